@@ -71,6 +71,24 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    "flush-menu-counters": {
+        "task": "navi_backend.menu.tasks.flush_menu_counters",
+        "schedule": 60.0,
+    },
+    "sweep-webhook-events": {
+        "task": "navi_backend.payments.tasks.sweep_webhook_events",
+        "schedule": 300.0,
+    },
+    "cancel-abandoned-orders": {
+        "task": "navi_backend.orders.tasks.cancel_abandoned_orders",
+        "schedule": 600.0,
+    },
+    "prune-notification-logs": {
+        "task": "navi_backend.notifications.tasks.prune_notification_logs",
+        "schedule": 60.0 * 60 * 24,
+    },
+}
 
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -91,6 +109,7 @@ DJANGO_APPS = [
     "django.contrib.sites",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
     "django.forms",
@@ -324,6 +343,46 @@ LOGGING = {
 REDIS_URL = env("REDIS_URL", default="redis://redis:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
 
+# Geocoding
+GEOCODING_PROVIDER = env(
+    "GEOCODING_PROVIDER",
+    default="navi_backend.core.helpers.geo_cache.NominatimGeocoder",
+)
+GEOCODING_URL = env(
+    "GEOCODING_URL", default="https://nominatim.openstreetmap.org/reverse"
+)
+GEOCODING_USER_AGENT = env("GEOCODING_USER_AGENT", default="NaviApi/1.0")
+# Nominatim's usage policy allows at most one request per second.
+GEOCODING_RATE_LIMIT = env.float("GEOCODING_RATE_LIMIT", default=1.0)
+
+# Invoice PDFs
+# How many render at once is set by the invoice worker's process count
+# (INVOICE_WORKER_CONCURRENCY in its start script), not by a setting here.
+# Load fonts and parse the invoice stylesheet when a worker process starts.
+INVOICE_PDF_WARM_UP = env.bool("INVOICE_PDF_WARM_UP", default=False)
+# Local copies of recently generated PDFs, so sending an invoice does not
+# download it from storage again. Each host or container without this
+# directory on a shared volume keeps, and downloads into, its own copy.
+INVOICE_PDF_CACHE_DIR = env(
+    "INVOICE_PDF_CACHE_DIR", default=str(BASE_DIR / ".cache" / "invoice-pdfs")
+)
+INVOICE_PDF_CACHE_MAX_BYTES = env.int(
+    "INVOICE_PDF_CACHE_MAX_BYTES", default=256 * 1024 * 1024
+)
+
+# Notification logs
+# Rows are saved in bulk once this many are buffered or the oldest has
+# waited this many seconds; worker shutdown flushes the rest.
+NOTIFICATION_LOG_BUFFER_SIZE = env.int("NOTIFICATION_LOG_BUFFER_SIZE", default=100)
+NOTIFICATION_LOG_FLUSH_INTERVAL = env.float(
+    "NOTIFICATION_LOG_FLUSH_INTERVAL", default=5.0
+)
+# Whole months of logs kept before the current one; older partitions are
+# dropped by the prune_notification_logs command and task.
+NOTIFICATION_LOG_RETENTION_MONTHS = env.int(
+    "NOTIFICATION_LOG_RETENTION_MONTHS", default=12
+)
+
 
 # django-allauth
 # ------------------------------------------------------------------------------
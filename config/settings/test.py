@@ -34,5 +34,15 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "http://media.testserver"
+
+# NOTIFICATIONS
+# ------------------------------------------------------------------------------
+# Save each notification log as it is written.
+NOTIFICATION_LOG_BUFFER_SIZE = 1
+
+# GEOCODING
+# ------------------------------------------------------------------------------
+GEOCODING_PROVIDER = "navi_backend.core.helpers.geo_cache.StubGeocoder"
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -7,6 +7,7 @@ from navi_backend.users.tests.factories import UserFactory
 @pytest.fixture(autouse=True)
 def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
+    settings.INVOICE_PDF_CACHE_DIR = tmpdir.join("invoice-pdfs").strpath
 
 
 @pytest.fixture
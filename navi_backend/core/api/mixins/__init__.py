@@ -1,13 +1,21 @@
+from .non_atomic_actions_mixin import NonAtomicActionsMixin
 from .permission_filter_mixin import PermissionFilterMixin
+from .prefetch_plan_mixin import PrefetchPlanMixin
+from .prefetch_plan_mixin import apply_prefetch_plan
 from .read_only_audit_mixin import ReadOnlyAuditMixin
 from .show_only_to_admin_fields_mixin import ShowOnlyToAdminFieldsMixin
+from .streaming_export_mixin import StreamingExportMixin
 from .user_scoped_queryset_mixin import UserScopedQuerySetMixin
 from .view_filter_mixin import ViewFilterMixin
 
 __all__ = [
+    "NonAtomicActionsMixin",
     "PermissionFilterMixin",
+    "PrefetchPlanMixin",
     "ReadOnlyAuditMixin",
     "ShowOnlyToAdminFieldsMixin",
+    "StreamingExportMixin",
     "UserScopedQuerySetMixin",
     "ViewFilterMixin",
+    "apply_prefetch_plan",
 ]
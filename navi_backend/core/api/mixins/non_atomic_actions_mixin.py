@@ -0,0 +1,19 @@
+from django.db import transaction
+
+
+class NonAtomicActionsMixin:
+    non_atomic_actions = ()
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(actions, **initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        action = self.action_map.get(request.method.lower())
+        atomic_requests = transaction.get_connection().settings_dict["ATOMIC_REQUESTS"]
+        if action in self.non_atomic_actions or not atomic_requests:
+            return super().dispatch(request, *args, **kwargs)
+
+        # Every other action keeps the ATOMIC_REQUESTS behaviour.
+        with transaction.atomic():
+            return super().dispatch(request, *args, **kwargs)
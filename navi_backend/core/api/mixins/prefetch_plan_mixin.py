@@ -0,0 +1,28 @@
+def apply_prefetch_plan(queryset, plan):
+    if not plan:
+        return queryset
+
+    if plan.get("select_related"):
+        queryset = queryset.select_related(*plan["select_related"])
+    if plan.get("prefetch_related"):
+        queryset = queryset.prefetch_related(*plan["prefetch_related"])
+    if plan.get("only"):
+        queryset = queryset.only(*plan["only"])
+
+    return queryset
+
+
+class PrefetchPlanMixin:
+    prefetch_plans = {}
+
+    def get_prefetch_plan(self):
+        action = getattr(self, "action", None)
+
+        if action in self.prefetch_plans:
+            return self.prefetch_plans[action]
+
+        serializer_class = self.get_serializer_class()
+        return getattr(serializer_class.Meta, "prefetch_plan", {})
+
+    def get_queryset(self):
+        return apply_prefetch_plan(super().get_queryset(), self.get_prefetch_plan())
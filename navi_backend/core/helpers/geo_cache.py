@@ -1,23 +1,80 @@
-import time
+import logging
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
 
-import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
 
-CODE_200 = 200
+from navi_backend.core.helpers.geocoding_client import get_geocoding_client
 
+logger = logging.getLogger(__name__)
 
-def send_geo_request(lat, lng, num_request=0, max_retries=5):
-    if num_request >= max_retries:
-        err = f"Failed after {max_retries} retries."
-        raise Exception(err)  # noqa: TRY002
+# Four decimal places is roughly 11m, well inside one street address.
+GEOCODE_PRECISION = Decimal("0.0001")
+GEOCODE_CACHE_KEY = "geocode:reverse:{lat}:{lng}"
+GEOCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
 
-    time.sleep(num_request * 1)
 
-    response = requests.get(
-        f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lng}",
-        headers={"User-Agent": "NaviApi/1.0"},
-        timeout=30,
+class NominatimGeocoder:
+    def reverse(self, lat, lng):
+        return get_geocoding_client().reverse(lat, lng)
+
+
+class StubGeocoder:
+    """
+    Offline provider for tests and local development. Returns a deterministic
+    Nominatim-shaped response derived from the coordinates.
+    """
+
+    def reverse(self, lat, lng):
+        lat, lng = round_coordinates(lat, lng)
+        return {
+            "address": {
+                "house_number": str(abs(int(lat * 100)) % 1000 + 1),
+                "road": f"Stub Street {lng}",
+                "city": "Stubville",
+                "state": "Stub State",
+                "postcode": f"{abs(int(lng * 100)) % 100000:05d}",
+                "country_code": "us",
+            }
+        }
+
+
+def get_geocoder():
+    return import_string(settings.GEOCODING_PROVIDER)()
+
+
+def round_coordinates(lat, lng):
+    return tuple(
+        Decimal(str(value)).quantize(GEOCODE_PRECISION, rounding=ROUND_HALF_UP)
+        for value in (lat, lng)
     )
 
-    if response.status_code != CODE_200:
-        return send_geo_request(lat, lng, num_request + 1, max_retries)
-    return response.json()
+
+def geocode_cache_key(lat, lng):
+    lat, lng = round_coordinates(lat, lng)
+    return GEOCODE_CACHE_KEY.format(lat=lat, lng=lng)
+
+
+def get_cached_geocode(lat, lng):
+    return cache.get(geocode_cache_key(lat, lng))
+
+
+def reverse_geocode(lat, lng):
+    """
+    Returns the reverse-geocode response for the rounded coordinates, asking
+    the configured provider only on a cache miss. Empty answers are not
+    cached so a later attempt can still fill them in.
+    """
+    key = geocode_cache_key(lat, lng)
+    response = cache.get(key)
+    if response is not None:
+        return response
+
+    response = get_geocoder().reverse(*round_coordinates(lat, lng))
+    if response.get("address"):
+        cache.set(key, response, GEOCODE_CACHE_TIMEOUT)
+    else:
+        logger.warning("Geocoder returned no address for %s", key)
+    return response
@@ -0,0 +1,291 @@
+import logging
+import random
+import threading
+import time
+from functools import cache
+
+import requests
+from django.conf import settings
+from redis.exceptions import RedisError
+from requests.adapters import HTTPAdapter
+
+from navi_backend.core.helpers.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+CODE_200 = 200
+CODE_429 = 429
+CODE_500 = 500
+GEOCODING_BUCKET_KEY = "geocoding:nominatim:bucket"
+
+# Refills and takes one token atomically, timed by the Redis clock so every
+# host agrees. Returns how many seconds the caller must wait for a token.
+TAKE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated_at", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""  # noqa: S105
+
+
+class GeocodingError(Exception):
+    pass
+
+
+class CircuitOpenError(GeocodingError):
+    pass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. ``acquire`` blocks until a token is available,
+    so callers sharing a bucket never exceed ``rate`` requests per second on
+    average or ``capacity`` in a burst.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RedisTokenBucket:
+    """
+    Token bucket kept in Redis, so every process and host sharing ``key``
+    shares one ``rate``. Falls back to a per-process bucket while Redis is
+    unreachable.
+    """
+
+    def __init__(self, key, rate, capacity=1):
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity
+        self.fallback = TokenBucket(rate, capacity)
+
+    def acquire(self):
+        while True:
+            try:
+                wait = float(
+                    get_redis().eval(
+                        TAKE_TOKEN_SCRIPT, 1, self.key, self.rate, self.capacity
+                    )
+                )
+            except RedisError:
+                logger.warning("Redis unavailable, rate limiting geocoding locally")
+                self.fallback.acquire()
+                return
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``reset_timeout`` seconds. The first call after that is let through
+    as a probe; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Geocoding circuit opened")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class GeocodingMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.calls = 0
+            self.failures = 0
+            self.retries = 0
+            self.rejected = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+
+    def record_call(self, latency, *, failed=False):
+        with self.lock:
+            self.calls += 1
+            self.failures += failed
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_rejected(self):
+        with self.lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "avg_latency": self.total_latency / self.calls if self.calls else 0.0,
+                "max_latency": self.max_latency,
+            }
+
+
+class NominatimClient:
+    """
+    Reverse-geocoding client for Nominatim. One pooled keep-alive session is
+    shared by every call, and all calls go through the same rate limiter and
+    circuit breaker, so it is meant to be used as a process-wide instance.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url,
+        user_agent,
+        *,
+        rate=1.0,
+        timeout=10,
+        max_retries=4,
+        backoff_base=1.0,
+        backoff_cap=30.0,
+        pool_size=10,
+        breaker=None,
+        bucket=None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.bucket = bucket or TokenBucket(rate)
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = GeocodingMetrics()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get_backoff(self, attempt):
+        # Full jitter keeps concurrent callers from retrying in lockstep.
+        return random.uniform(  # noqa: S311
+            0, min(self.backoff_cap, self.backoff_base * 2**attempt)
+        )
+
+    def reverse(self, lat, lng):
+        params = {"format": "json", "lat": str(lat), "lon": str(lng)}
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.metrics.record_retry()
+                time.sleep(self.get_backoff(attempt - 1))
+
+            if not self.breaker.allow():
+                self.metrics.record_rejected()
+                msg = "Geocoding circuit is open."
+                raise CircuitOpenError(msg)
+
+            self.bucket.acquire()
+            started = time.monotonic()
+            try:
+                response = self.session.get(
+                    self.base_url, params=params, timeout=self.timeout
+                )
+            except requests.RequestException as e:
+                error = e
+            else:
+                if response.status_code == CODE_200:
+                    self.metrics.record_call(time.monotonic() - started)
+                    self.breaker.record_success()
+                    return response.json()
+                error = GeocodingError(
+                    f"Geocoder responded with {response.status_code}."
+                )
+                if response.status_code != CODE_429 and response.status_code < CODE_500:
+                    # Other client errors will not succeed on a retry, and
+                    # they say nothing about the health of the service.
+                    self.metrics.record_call(time.monotonic() - started, failed=True)
+                    raise error
+
+            self.metrics.record_call(time.monotonic() - started, failed=True)
+            self.breaker.record_failure()
+            logger.warning("Geocoding attempt %s failed: %s", attempt + 1, error)
+
+        msg = f"Failed after {self.max_retries + 1} attempts."
+        raise GeocodingError(msg) from error
+
+
+@cache
+def get_geocoding_client():
+    return NominatimClient(
+        settings.GEOCODING_URL,
+        settings.GEOCODING_USER_AGENT,
+        rate=settings.GEOCODING_RATE_LIMIT,
+        # Nominatim's limit is per application, not per worker process.
+        bucket=RedisTokenBucket(GEOCODING_BUCKET_KEY, settings.GEOCODING_RATE_LIMIT),
+    )
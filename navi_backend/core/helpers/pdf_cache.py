@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Reads from storage happen in pieces this size.
+PDF_CHUNK_SIZE = 64 * 1024
+PDF_CACHE_NAME = "{key}-{content_hash}.pdf"
+
+
+def hash_pdf(pdf_bytes):
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def get_cache_dir():
+    cache_dir = Path(settings.INVOICE_PDF_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def pdf_cache_path(key, content_hash):
+    return get_cache_dir() / PDF_CACHE_NAME.format(key=key, content_hash=content_hash)
+
+
+def get_cached_pdf(key, content_hash):
+    """
+    Returns the path of the cached PDF, or None on a miss. A hit is marked as
+    recently used so eviction drops it last.
+    """
+    if not content_hash:
+        return None
+    path = pdf_cache_path(key, content_hash)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def cache_pdf(key, chunks):
+    """
+    Writes ``chunks`` to the cache and returns the path, named after the
+    SHA-256 of the content. The file only appears once complete, so readers
+    never see a partial PDF.
+    """
+    cache_dir = get_cache_dir()
+    digest = hashlib.sha256()
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            for chunk in chunks:
+                digest.update(chunk)
+                tmp.write(chunk)
+        path = pdf_cache_path(key, digest.hexdigest())
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    evict_pdf_cache()
+    return path
+
+
+def evict_pdf_cache(max_bytes=None):
+    """
+    Deletes the least recently used PDFs until the cache fits in
+    ``max_bytes`` (INVOICE_PDF_CACHE_MAX_BYTES by default).
+    """
+    if max_bytes is None:
+        max_bytes = settings.INVOICE_PDF_CACHE_MAX_BYTES
+    entries = []
+    for path in get_cache_dir().glob("*.pdf"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def fetch_pdf(key, content_hash, field_file):
+    """
+    Returns ``(path, content_hash)`` for a local copy of the PDF stored in
+    ``field_file``. A cache hit skips storage entirely; a miss streams the
+    file from storage into the cache in chunks, so it is downloaded once
+    however often it is sent. The returned hash is that of the cached copy,
+    so callers without one can record it.
+    """
+    path = get_cached_pdf(key, content_hash)
+    if path is not None:
+        return path, content_hash
+
+    logger.info("PDF cache miss for %s, reading %s", key, field_file.name)
+    field_file.open("rb")
+    try:
+        path = cache_pdf(key, field_file.chunks(PDF_CHUNK_SIZE))
+    finally:
+        field_file.close()
+    return path, path.stem.removeprefix(f"{key}-")
@@ -0,0 +1,20 @@
+from functools import cache
+
+import redis
+from django.conf import settings
+
+REDIS_SOCKET_TIMEOUT = 2
+
+
+@cache
+def get_redis():
+    """
+    Returns a process-wide client for REDIS_URL. The connection pool is
+    shared, and the short timeouts keep callers that fall back on
+    RedisError from hanging when Redis is down.
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+    )
@@ -1,12 +1,14 @@
 import uuid
+from functools import partial
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db import transaction
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from navi_backend.core.helpers.geo_cache import send_geo_request
+from navi_backend.core.helpers.geo_cache import get_cached_geocode
 from navi_backend.users.models import User
 
 
@@ -46,21 +48,40 @@ class AddressModel(models.Model):
         abstract = True
 
     def save(self, *args, **kwargs):
-        if not self.latitude or not self.longitude:
+        if self.latitude is None or self.longitude is None:
             err = "longitude and latitude must be defined for address model"
             raise NotImplementedError(err)
 
-        if self.address_line_1 and self.city and self.postal_code:
-            super().save(*args, **kwargs)
-            return
+        needs_enrichment = not self.has_full_address()
+        if needs_enrichment:
+            cached = get_cached_geocode(self.latitude, self.longitude)
+            fields = self.apply_geocode(cached) if cached else []
+            needs_enrichment = not fields
+            if fields and kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], *fields}
 
-        response = send_geo_request(self.latitude, self.longitude)
-        address_info = response.get("address", {})
+        super().save(*args, **kwargs)
+
+        if needs_enrichment:
+            from navi_backend.core.tasks import enrich_address  # noqa: PLC0415
+
+            transaction.on_commit(
+                partial(enrich_address.delay, self._meta.label, str(self.pk))
+            )
+
+    def has_full_address(self):
+        return bool(self.address_line_1 and self.city and self.postal_code)
 
+    def apply_geocode(self, response):
+        """
+        Copies a Nominatim-shaped reverse-geocode response onto the address
+        fields. Returns the names of the fields it set.
+        """
+        address_info = response.get("address", {})
         if not address_info:
-            err = "address_info is empty."
-            raise ValueError(err)
+            return []
 
+        fields = ["address_line_1", "city", "state_or_region", "postal_code"]
         road = address_info.get("road", "")
         address_parts = road.split(",") if road else []
 
@@ -72,8 +93,10 @@ class AddressModel(models.Model):
                 self.address_line_1 = f"{house_number} {str_part}".strip()
             elif index == 1:
                 self.address_line_2 = str_part
+                fields.append("address_line_2")
             elif not self.address_line_3:
                 self.address_line_3 = str_part
+                fields.append("address_line_3")
             else:
                 self.address_line_3 += f", {str_part}"
 
@@ -82,8 +105,8 @@ class AddressModel(models.Model):
         self.postal_code = address_info.get("postcode", "")
         if not self.country:
             self.country = address_info.get("country_code", "US").upper()
-
-        super().save(*args, **kwargs)
+            fields.append("country")
+        return fields
 
 
 class NamedModel(models.Model):
@@ -119,10 +142,14 @@ class SlugifiedModel(models.Model):
             try:
                 self.slug = slugify(self.name)
             except (AttributeError, TypeError):
-                self.slug = slugify(str(uuid.uuid4())[:8])
+                self.slug = self.random_slug()
         self.full_clean()
         return super().save(*args, **kwargs)
 
+    @staticmethod
+    def random_slug():
+        return slugify(str(uuid.uuid4())[:8])
+
 
 class UpdateRecordModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
@@ -1,7 +1,138 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.utils.urls import replace_query_param
 
 
 class StandardResultsSetPagination(pagination.PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetCursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination that seeks on the full ordering tuple instead of the
+    first field plus an offset, so every page costs one index range scan
+    however deep it is. The last ordering field must be unique.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.model = queryset.model
+        position, reverse = self.decode_keyset_cursor(request)
+        ordering = self.get_keyset_ordering(reverse=reverse)
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        self.has_next = position is not None if reverse else has_more
+        self.has_previous = has_more if reverse else position is not None
+        return self.page
+
+    def get_keyset_ordering(self, *, reverse=False):
+        if not reverse:
+            return list(self.ordering)
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def get_seek_filter(self, ordering, position):
+        """
+        Builds ``(a, b, ...) > (va, vb, ...)`` in ordering direction as nested
+        OR/AND terms, plus an inclusive bound on the leading field so the
+        planner can start an index range scan there.
+        """
+        terms = [
+            (field.lstrip("-"), "lt" if field.startswith("-") else "gt", value)
+            for field, value in zip(ordering, position, strict=True)
+        ]
+
+        name, lookup, value = terms[-1]
+        seek = Q(**{f"{name}__{lookup}": value})
+        for name, lookup, value in reversed(terms[:-1]):
+            seek = Q(**{f"{name}__{lookup}": value}) | (Q(**{name: value}) & seek)
+
+        name, lookup, value = terms[0]
+        return Q(**{f"{name}__{lookup}e": value}) & seek
+
+    def get_position(self, instance):
+        return [getattr(instance, field.lstrip("-")) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_keyset_cursor(self.get_position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_keyset_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def encode_keyset_cursor(self, position, *, reverse=False):
+        # isoformat() keeps microseconds, which DjangoJSONEncoder would drop.
+        values = [
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in position
+        ]
+        payload = json.dumps({"p": values, "r": reverse})
+        encoded = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_keyset_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position = [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)  # noqa: SLF001
+                for field, value in zip(self.ordering, payload["p"], strict=True)
+            ]
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+            ValidationError,
+        ) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+        return position, bool(payload.get("r"))
+
+
+class CreatedAtCursorPagination(KeysetCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+class SentAtCursorPagination(KeysetCursorPagination):
+    ordering = ("-sent_at", "-id")
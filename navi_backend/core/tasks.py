@@ -0,0 +1,35 @@
+import logging
+
+from celery import shared_task
+from django.apps import apps
+
+from navi_backend.core.helpers.geo_cache import reverse_geocode
+from navi_backend.core.helpers.geocoding_client import GeocodingError
+
+logger = logging.getLogger(__name__)
+
+
+# No task-level retries: the geocoding client already retries with backoff,
+# and retrying here as well would multiply the requests sent to Nominatim.
+@shared_task
+def enrich_address(model_label, pk):
+    model = apps.get_model(model_label)
+    instance = model._base_manager.filter(pk=pk).first()  # noqa: SLF001
+    if instance is None or instance.has_full_address():
+        return
+
+    try:
+        response = reverse_geocode(instance.latitude, instance.longitude)
+    except GeocodingError:
+        logger.warning("Could not geocode %s %s", model_label, pk, exc_info=True)
+        return
+    fields = instance.apply_geocode(response)
+    if not fields:
+        logger.warning("No address found for %s %s", model_label, pk)
+        return
+
+    # update() rather than save() so an address that is still incomplete
+    # does not schedule another enrichment.
+    model._base_manager.filter(pk=pk).update(  # noqa: SLF001
+        **{field: getattr(instance, field) for field in fields}
+    )
@@ -0,0 +1,137 @@
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+
+from navi_backend.core.helpers import geo_cache
+from navi_backend.core.helpers.geo_cache import StubGeocoder
+from navi_backend.core.helpers.geo_cache import geocode_cache_key
+from navi_backend.core.helpers.geo_cache import reverse_geocode
+from navi_backend.core.helpers.geocoding_client import GeocodingError
+from navi_backend.core.tasks import enrich_address
+from navi_backend.devices.models import NaviPort
+from navi_backend.devices.tests.factories import NaviPortFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def geocoder_calls(monkeypatch):
+    calls = []
+
+    class CountingGeocoder(StubGeocoder):
+        def reverse(self, lat, lng):
+            calls.append((lat, lng))
+            return super().reverse(lat, lng)
+
+    monkeypatch.setattr(geo_cache, "get_geocoder", CountingGeocoder)
+    return calls
+
+
+def build_unaddressed_port(**kwargs):
+    return NaviPortFactory(
+        address_line_1="",
+        city="",
+        postal_code="",
+        latitude=Decimal("40.712776"),
+        longitude=Decimal("-74.005974"),
+        **kwargs,
+    )
+
+
+def owned_by(user):
+    # Reusing one user keeps its own on_commit hooks out of the capture.
+    return {
+        "created_by": user,
+        "updated_by": user,
+        "raspberry_pi": None,
+        "espresso_machine": None,
+    }
+
+
+class TestReverseGeocode:
+    def test_cache_key_rounds_coordinates(self):
+        assert geocode_cache_key(40.712776, -74.005974) == geocode_cache_key(
+            Decimal("40.71281"), Decimal("-74.00601")
+        )
+        assert geocode_cache_key(40.7127, -74.0059) != geocode_cache_key(
+            40.7129, -74.0059
+        )
+
+    def test_repeated_coordinates_hit_provider_once(self, geocoder_calls):
+        first = reverse_geocode(Decimal("40.712776"), Decimal("-74.005974"))
+        second = reverse_geocode(Decimal("40.712791"), Decimal("-74.005951"))
+
+        assert first == second
+        assert geocoder_calls == [(Decimal("40.7128"), Decimal("-74.0060"))]
+
+    def test_empty_response_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(StubGeocoder, "reverse", lambda self, lat, lng: {})
+
+        assert reverse_geocode(1, 2) == {}
+        assert cache.get(geocode_cache_key(1, 2)) is None
+
+
+@pytest.mark.django_db
+class TestAddressEnrichment:
+    def test_save_defers_geocoding_to_task(
+        self, geocoder_calls, user, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            port = build_unaddressed_port(**owned_by(user))
+
+        assert geocoder_calls == []
+        assert port.address_line_1 == ""
+        assert len(callbacks) == 1
+
+    def test_task_fills_address_fields(self, geocoder_calls):
+        port = build_unaddressed_port()
+
+        enrich_address(NaviPort._meta.label, str(port.pk))  # noqa: SLF001
+
+        port.refresh_from_db()
+        assert port.address_line_1 == "72 Stub Street -74.0060"
+        assert port.city == "Stubville"
+        assert port.state_or_region == "Stub State"
+        assert port.postal_code == "07400"
+        assert len(geocoder_calls) == 1
+
+    def test_cached_coordinates_fill_inline(
+        self, geocoder_calls, user, django_capture_on_commit_callbacks
+    ):
+        reverse_geocode(Decimal("40.712776"), Decimal("-74.005974"))
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            port = build_unaddressed_port(**owned_by(user))
+
+        assert callbacks == []
+        assert port.city == "Stubville"
+        port.refresh_from_db()
+        assert port.city == "Stubville"
+        assert len(geocoder_calls) == 1
+
+    def test_task_gives_up_on_geocoding_errors(self, monkeypatch):
+        class FailingGeocoder:
+            def reverse(self, lat, lng):
+                msg = "Failed after 5 attempts."
+                raise GeocodingError(msg)
+
+        monkeypatch.setattr(geo_cache, "get_geocoder", FailingGeocoder)
+        port = build_unaddressed_port()
+
+        enrich_address(NaviPort._meta.label, str(port.pk))  # noqa: SLF001
+
+        port.refresh_from_db()
+        assert port.address_line_1 == ""
+
+    def test_task_skips_complete_address(self, geocoder_calls):
+        port = NaviPortFactory()
+
+        enrich_address(NaviPort._meta.label, str(port.pk))  # noqa: SLF001
+
+        assert geocoder_calls == []
@@ -0,0 +1,208 @@
+import time
+
+import pytest
+import requests
+from redis.exceptions import RedisError
+
+from navi_backend.core.helpers import geocoding_client
+from navi_backend.core.helpers.geocoding_client import CircuitBreaker
+from navi_backend.core.helpers.geocoding_client import CircuitOpenError
+from navi_backend.core.helpers.geocoding_client import GeocodingError
+from navi_backend.core.helpers.geocoding_client import NominatimClient
+from navi_backend.core.helpers.geocoding_client import RedisTokenBucket
+from navi_backend.core.helpers.geocoding_client import TokenBucket
+from navi_backend.core.helpers.geocoding_client import get_geocoding_client
+from navi_backend.core.helpers.redis_client import get_redis
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload or {}
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(geocoding_client.time, "sleep", recorded.append)
+    return recorded
+
+
+def build_client(monkeypatch, responses, **kwargs):
+    client = NominatimClient("https://geocoder.test/reverse", "NaviTest/1.0", **kwargs)
+    calls = []
+
+    def fake_get(url, params, timeout):
+        calls.append(params)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    monkeypatch.setattr(client.bucket, "acquire", lambda: None)
+    return client, calls
+
+
+class TestNominatimClient:
+    def test_returns_payload_and_records_latency(self, monkeypatch, sleeps):
+        client, calls = build_client(
+            monkeypatch, [FakeResponse(200, {"address": {"city": "Boston"}})]
+        )
+
+        assert client.reverse(1.5, 2.5) == {"address": {"city": "Boston"}}
+        assert calls == [{"format": "json", "lat": "1.5", "lon": "2.5"}]
+        metrics = client.metrics.snapshot()
+        assert metrics["calls"] == 1
+        assert metrics["failures"] == 0
+        assert metrics["max_latency"] >= metrics["avg_latency"] >= 0
+
+    def test_retries_server_errors_with_backoff(self, monkeypatch, sleeps):
+        client, calls = build_client(
+            monkeypatch,
+            [
+                FakeResponse(503),
+                requests.ConnectionError("reset"),
+                FakeResponse(200, {"address": {}}),
+            ],
+            backoff_base=1.0,
+        )
+
+        assert client.reverse(1, 2) == {"address": {}}
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 1
+        assert 0 <= sleeps[1] <= 2
+        metrics = client.metrics.snapshot()
+        assert metrics["calls"] == 3
+        assert metrics["failures"] == 2
+        assert metrics["retries"] == 2
+
+    def test_client_error_is_not_retried(self, monkeypatch, sleeps):
+        client, calls = build_client(monkeypatch, [FakeResponse(400)])
+
+        with pytest.raises(GeocodingError):
+            client.reverse(1, 2)
+
+        assert len(calls) == 1
+        assert client.breaker.state == CircuitBreaker.CLOSED
+
+    def test_gives_up_after_max_retries(self, monkeypatch, sleeps):
+        client, calls = build_client(
+            monkeypatch, [FakeResponse(429)] * 3, max_retries=2
+        )
+
+        with pytest.raises(GeocodingError, match="3 attempts"):
+            client.reverse(1, 2)
+
+        assert len(calls) == 3
+
+    def test_open_circuit_rejects_without_calling(self, monkeypatch, sleeps):
+        client, calls = build_client(
+            monkeypatch,
+            [FakeResponse(500)] * 2,
+            max_retries=5,
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        )
+
+        with pytest.raises(CircuitOpenError):
+            client.reverse(1, 2)
+        with pytest.raises(CircuitOpenError):
+            client.reverse(1, 2)
+
+        assert len(calls) == 2
+        assert client.metrics.snapshot()["rejected"] == 2
+
+    def test_backoff_is_capped(self):
+        client = NominatimClient("https://geocoder.test", "NaviTest/1.0")
+        client.backoff_cap = 5
+
+        assert all(0 <= client.get_backoff(10) <= 5 for _ in range(50))
+
+    def test_session_is_shared(self, settings):
+        get_geocoding_client.cache_clear()
+        try:
+            assert get_geocoding_client() is get_geocoding_client()
+            assert get_geocoding_client().session.headers["User-Agent"] == (
+                settings.GEOCODING_USER_AGENT
+            )
+        finally:
+            get_geocoding_client.cache_clear()
+
+
+class TestCircuitBreaker:
+    def test_half_open_probe_closes_on_success(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(geocoding_client.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] += 30
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_reopens_on_failure(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(geocoding_client.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+        for _ in range(3):
+            breaker.record_failure()
+        now[0] += 30
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+
+class TestTokenBucket:
+    def test_limits_rate(self):
+        bucket = TokenBucket(rate=20)
+
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+
+        assert time.monotonic() - started >= 0.14
+
+
+class TestRedisTokenBucket:
+    @pytest.fixture
+    def key(self):
+        key = "geocoding:test:bucket"
+        get_redis().delete(key)
+        yield key
+        get_redis().delete(key)
+
+    def test_buckets_on_one_key_share_the_rate(self, key):
+        first = RedisTokenBucket(key, rate=20)
+        second = RedisTokenBucket(key, rate=20)
+
+        started = time.monotonic()
+        for _ in range(2):
+            first.acquire()
+            second.acquire()
+
+        assert time.monotonic() - started >= 0.14
+
+    def test_falls_back_to_a_local_bucket(self, key, monkeypatch):
+        class DownRedis:
+            def eval(self, *args):
+                raise RedisError
+
+        monkeypatch.setattr(geocoding_client, "get_redis", DownRedis)
+        bucket = RedisTokenBucket(key, rate=20)
+
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+
+        assert time.monotonic() - started >= 0.14
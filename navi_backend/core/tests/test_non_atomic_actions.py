@@ -0,0 +1,37 @@
+import pytest
+from django.db import connection
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.core.api.mixins import NonAtomicActionsMixin
+
+
+class AtomicityViewSet(NonAtomicActionsMixin, viewsets.ViewSet):
+    permission_classes = [AllowAny]
+    non_atomic_actions = ("create",)
+
+    def list(self, request):
+        return Response({"atomic": connection.in_atomic_block})
+
+    def create(self, request):
+        return Response({"atomic": connection.in_atomic_block})
+
+
+@pytest.mark.django_db(transaction=True)
+class TestNonAtomicActionsMixin:
+    def test_listed_actions_run_outside_a_transaction(self):
+        view = AtomicityViewSet.as_view({"post": "create"})
+
+        response = view(APIRequestFactory().post("/"))
+
+        assert view._non_atomic_requests  # noqa: SLF001
+        assert response.data == {"atomic": False}
+
+    def test_other_actions_stay_atomic(self):
+        view = AtomicityViewSet.as_view({"get": "list"})
+
+        response = view(APIRequestFactory().get("/"))
+
+        assert response.data == {"atomic": True}
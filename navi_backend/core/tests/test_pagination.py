@@ -0,0 +1,75 @@
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.core.pagination import SentAtCursorPagination
+from navi_backend.notifications.models import EmailLog
+
+
+def paginate(url):
+    request = Request(APIRequestFactory().get(url))
+    paginator = SentAtCursorPagination()
+    page = paginator.paginate_queryset(EmailLog.objects.all(), request)
+    return [log.pk for log in page], paginator.get_paginated_response([]).data
+
+
+def cursor_url(link):
+    query = parse_qs(urlparse(link).query)
+    return f"/api/email-logs/?page_size=2&cursor={query['cursor'][0]}"
+
+
+@pytest.fixture
+def email_logs(db):
+    logs = [
+        EmailLog.objects.create(recipient=f"user{n}@example.com", kind="email")
+        for n in range(5)
+    ]
+    # Three rows share a timestamp so the id tiebreaker decides their order.
+    EmailLog.objects.filter(pk__in=[log.pk for log in logs[:3]]).update(
+        sent_at=timezone.now()
+    )
+    return list(
+        EmailLog.objects.order_by("-sent_at", "-id").values_list("pk", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestKeysetCursorPagination:
+    def test_walks_forward_and_back(self, email_logs):
+        pages = []
+        ids, data = paginate("/api/email-logs/?page_size=2")
+        pages.append(ids)
+        assert data["previous"] is None
+
+        while data["next"]:
+            ids, data = paginate(cursor_url(data["next"]))
+            pages.append(ids)
+
+        assert [pk for page in pages for pk in page] == email_logs
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+        back = []
+        while data["previous"]:
+            ids, data = paginate(cursor_url(data["previous"]))
+            back.insert(0, ids)
+        assert back == pages[:-1]
+
+    def test_deep_page_seeks_without_offset(
+        self, email_logs, django_assert_num_queries
+    ):
+        _, data = paginate("/api/email-logs/?page_size=2")
+        _, data = paginate(cursor_url(data["next"]))
+
+        with django_assert_num_queries(1) as ctx:
+            paginate(cursor_url(data["next"]))
+
+        assert "OFFSET" not in ctx.captured_queries[0]["sql"]
+
+    def test_invalid_cursor(self, email_logs):
+        with pytest.raises(NotFound):
+            paginate("/api/email-logs/?cursor=not-a-cursor")
@@ -0,0 +1,63 @@
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from navi_backend.core.helpers.pdf_cache import cache_pdf
+from navi_backend.core.helpers.pdf_cache import evict_pdf_cache
+from navi_backend.core.helpers.pdf_cache import fetch_pdf
+from navi_backend.core.helpers.pdf_cache import get_cache_dir
+from navi_backend.core.helpers.pdf_cache import get_cached_pdf
+from navi_backend.core.helpers.pdf_cache import hash_pdf
+
+PDF = b"%PDF-1.7 invoice"
+
+
+class CountingFieldFile:
+    def __init__(self, name):
+        self.name = name
+        self.opened = 0
+        self.file = None
+
+    def open(self, mode):
+        self.opened += 1
+        self.file = default_storage.open(self.name, mode)
+
+    def chunks(self, chunk_size):
+        return self.file.chunks(chunk_size)
+
+    def close(self):
+        self.file.close()
+
+
+def test_cache_pdf_is_keyed_by_content_hash():
+    path = cache_pdf("inv-1", [PDF[:4], PDF[4:]])
+
+    assert path.read_bytes() == PDF
+    assert get_cached_pdf("inv-1", hash_pdf(PDF)) == path
+    assert get_cached_pdf("inv-1", hash_pdf(b"other")) is None
+    assert get_cached_pdf("inv-1", "") is None
+    assert not list(get_cache_dir().glob("*.part"))
+
+
+def test_fetch_pdf_reads_storage_once():
+    name = default_storage.save("invoices/invoice-1", ContentFile(PDF))
+    field_file = CountingFieldFile(name)
+
+    first = fetch_pdf("inv-1", "", field_file)
+    second = fetch_pdf("inv-1", hash_pdf(PDF), field_file)
+
+    assert first == second == (second[0], hash_pdf(PDF))
+    assert second[0].read_bytes() == PDF
+    assert field_file.opened == 1
+
+
+def test_evict_drops_least_recently_used():
+    old = cache_pdf("old", [b"a" * 10])
+    new = cache_pdf("new", [b"b" * 10])
+    os.utime(old, (1, 1))
+
+    evict_pdf_cache(max_bytes=15)
+
+    assert not old.exists()
+    assert new.exists()
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
+
+from navi_backend.notifications.api.views import EmailLogViewSet
+from navi_backend.notifications.models import EmailLog
+from navi_backend.users.tests.factories import UserFactory
+
+
+def export(user, **params):
+    request = APIRequestFactory().get("/api/email_logs/export/", params)
+    force_authenticate(request, user=user)
+    return EmailLogViewSet.as_view({"get": "export"})(request)
+
+
+@pytest.fixture
+def admin(db):
+    return UserFactory(is_staff=True)
+
+
+@pytest.fixture
+def email_logs(db):
+    return [
+        EmailLog.objects.create(
+            recipient=f"user{n}@example.com",
+            kind="email",
+            reason="invoice",
+            meta={"n": n},
+        )
+        for n in range(3)
+    ]
+
+
+@pytest.mark.django_db
+class TestStreamingExportMixin:
+    def test_ndjson(self, admin, email_logs):
+        response = export(admin)
+
+        with CaptureQueriesContext(connection) as ctx:
+            body = b"".join(response.streaming_content).decode()
+
+        selects = [q for q in ctx.captured_queries if "SELECT" in q["sql"]]
+        assert len(selects) == 1
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [row["recipient"] for row in rows] == [
+            log.recipient for log in email_logs
+        ]
+        assert rows[0]["meta"] == {"n": 0}
+
+    def test_csv(self, admin, email_logs):
+        response = export(admin, export_format="csv")
+
+        body = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert response["Content-Disposition"].endswith('.csv"')
+        assert len(rows) == len(email_logs)
+        assert json.loads(rows[2]["meta"]) == {"n": 2}
+
+    def test_since_filter(self, admin, email_logs):
+        response = export(admin, since=email_logs[1].sent_at.isoformat())
+
+        body = b"".join(response.streaming_content).decode()
+        assert len(body.splitlines()) == 2
+
+    def test_rejects_unknown_format(self, admin):
+        assert export(admin, export_format="xml").status_code == 400
+
+    def test_admin_only(self, db):
+        assert export(UserFactory()).status_code == 403
@@ -1,6 +1,9 @@
+from rest_framework import status
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 
 from navi_backend.devices.api.serializers import EspressoMachineSerializer
 from navi_backend.devices.api.serializers import MachineTypeSerializer
@@ -12,12 +15,68 @@ from navi_backend.devices.models import NaviPort
 from navi_backend.devices.models import RaspberryPi
 from navi_backend.orders.api.mixins import TrackUserMixin
 
+NAVI_PORT_NEARBY_LIMIT = 10
+NAVI_PORT_NEARBY_MAX_LIMIT = 100
+NAVI_PORT_NEARBY_MAX_RADIUS_KM = 500
+COORDINATE_BOUNDS = {"lat": 90, "lng": 180}
+
 
 class NaviPortViewSet(TrackUserMixin, viewsets.ModelViewSet):
     queryset = NaviPort.objects.all()
     serializer_class = NaviPortSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    @action(detail=False, methods=["get"], url_path="nearby")
+    def nearby(self, request):
+        """
+        GET /navi_ports/nearby/?lat=<lat>&lng=<lng>&radius_km=<km>&limit=<n>
+        """
+        try:
+            lat, lng = (
+                float(request.query_params[param]) for param in COORDINATE_BOUNDS
+            )
+            radius_km = request.query_params.get("radius_km")
+            radius_km = float(radius_km) if radius_km else None
+        except (KeyError, ValueError):
+            return Response(
+                {"detail": "Numeric query parameters 'lat' and 'lng' are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if abs(lat) > COORDINATE_BOUNDS["lat"] or abs(lng) > COORDINATE_BOUNDS["lng"]:
+            return Response(
+                {"detail": "Coordinates are out of range."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if (
+            radius_km is not None
+            and not 0 < radius_km <= NAVI_PORT_NEARBY_MAX_RADIUS_KM
+        ):
+            return Response(
+                {
+                    "detail": "radius_km must be between 0 and "
+                    f"{NAVI_PORT_NEARBY_MAX_RADIUS_KM}."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", NAVI_PORT_NEARBY_LIMIT))
+        except ValueError:
+            limit = NAVI_PORT_NEARBY_LIMIT
+        limit = max(1, min(limit, NAVI_PORT_NEARBY_MAX_LIMIT))
+
+        queryset = self.get_queryset()
+        if radius_km is None:
+            results = queryset.nearest(lat, lng, limit=limit)
+        else:
+            results = queryset.within_radius(lat, lng, radius_km)[:limit]
+        serializer = self.get_serializer(results, many=True)
+        data = [
+            {**port, "distance_km": result.distance_km}
+            for port, result in zip(serializer.data, results, strict=True)
+        ]
+        return Response(data, status=status.HTTP_200_OK)
+
 
 class RaspberryPiViewSet(TrackUserMixin, viewsets.ModelViewSet):
     serializer_class = RaspberryPiSerializer
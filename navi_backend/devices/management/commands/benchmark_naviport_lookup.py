@@ -0,0 +1,144 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+
+from navi_backend.devices.models import NaviPort
+from navi_backend.users.models import User
+
+# Synthetic ports cluster around these (lat, lng) centres, the way real
+# deployments do, with a uniform sprinkle across the continental US.
+CITY_CENTRES = [
+    (40.7128, -74.0060),
+    (34.0522, -118.2437),
+    (41.8781, -87.6298),
+    (29.7604, -95.3698),
+    (47.6062, -122.3321),
+    (42.3601, -71.0589),
+    (25.7617, -80.1918),
+    (39.7392, -104.9903),
+]
+CITY_SPREAD_DEGREES = 0.3
+SCATTER_SHARE = 0.1
+US_BOUNDS = ((24.5, 49.0), (-124.8, -66.9))
+PERCENTILE_95 = 0.95
+
+
+class Command(BaseCommand):
+    help = (
+        "times nearest-navi-port lookups against synthetic ports, comparing the "
+        "bounding-box search with a full haversine scan; rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ports",
+            type=int,
+            default=100_000,
+            help="Number of synthetic ports to insert.",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=200,
+            help="Number of lookups to time per strategy.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=10, help="Ports returned per lookup."
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        user = User.objects.order_by("pk").first()
+        if user is None:
+            msg = "At least one user must exist to own the synthetic ports."
+            raise CommandError(msg)
+
+        rng = random.Random(options["seed"])  # noqa: S311
+        limit = options["limit"]
+
+        with transaction.atomic():
+            started = time.monotonic()
+            NaviPort.objects.bulk_create(
+                self.build_ports(rng, options["ports"], user), batch_size=5000
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {NaviPort._meta.db_table}")  # noqa: SLF001
+            self.stdout.write(
+                f"Inserted {options['ports']} ports in "
+                f"{time.monotonic() - started:.1f}s"
+            )
+
+            points = [self.random_point(rng) for _ in range(options["queries"])]
+            indexed, indexed_results = self.time_lookups(
+                points, lambda lat, lng: NaviPort.objects.nearest(lat, lng, limit)
+            )
+            scanned, scanned_results = self.time_lookups(
+                points,
+                lambda lat, lng: list(
+                    NaviPort.objects.with_distance(lat, lng).order_by(
+                        "distance_km", "pk"
+                    )[:limit]
+                ),
+            )
+            transaction.set_rollback(True)
+
+        mismatches = sum(
+            [port.pk for port in a] != [port.pk for port in b]
+            for a, b in zip(indexed_results, scanned_results, strict=True)
+        )
+        self.report("bounding box", indexed)
+        self.report("full scan", scanned)
+        msg = f"{mismatches} of {len(points)} lookups disagreed with the full scan."
+        if mismatches:
+            self.stdout.write(self.style.WARNING(msg))
+        else:
+            self.stdout.write(self.style.SUCCESS(msg))
+
+    def build_ports(self, rng, count, user):
+        for index in range(count):
+            lat, lng = self.random_point(rng)
+            name = f"benchmark-port-{index}"
+            yield NaviPort(
+                name=name,
+                slug=name,
+                latitude=Decimal(f"{lat:.6f}"),
+                longitude=Decimal(f"{lng:.6f}"),
+                address_line_1="Synthetic",
+                city="Synthetic",
+                postal_code="00000",
+                created_by=user,
+                updated_by=user,
+            )
+
+    def random_point(self, rng):
+        if rng.random() < SCATTER_SHARE:
+            (south, north), (west, east) = US_BOUNDS
+            return rng.uniform(south, north), rng.uniform(west, east)
+        lat, lng = rng.choice(CITY_CENTRES)
+        return (
+            rng.gauss(lat, CITY_SPREAD_DEGREES),
+            rng.gauss(lng, CITY_SPREAD_DEGREES),
+        )
+
+    def time_lookups(self, points, lookup):
+        timings = []
+        results = []
+        for lat, lng in points:
+            started = time.perf_counter()
+            results.append(lookup(lat, lng))
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, results
+
+    def report(self, label, timings):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * PERCENTILE_95))]
+        self.stdout.write(
+            f"{label}: mean {statistics.fmean(timings):.2f}ms, "
+            f"p50 {statistics.median(timings):.2f}ms, p95 {p95:.2f}ms"
+        )
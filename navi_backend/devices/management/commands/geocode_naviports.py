@@ -0,0 +1,102 @@
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from navi_backend.core.helpers.geo_cache import reverse_geocode
+from navi_backend.core.helpers.geo_cache import round_coordinates
+from navi_backend.devices.models import NaviPort
+
+
+class Command(BaseCommand):
+    help = "reverse geocodes navi ports that are missing address fields"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of concurrent geocoding requests in flight.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of ports written per bulk_update.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Geocode and report without writing addresses.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        started = time.monotonic()
+
+        ports_by_coordinates = defaultdict(list)
+        for port in NaviPort.objects.filter(
+            latitude__isnull=False, longitude__isnull=False
+        ).filter(Q(address_line_1="") | Q(city="") | Q(postal_code="")):
+            ports_by_coordinates[
+                round_coordinates(port.latitude, port.longitude)
+            ].append(port)
+
+        if not ports_by_coordinates:
+            self.stdout.write(self.style.SUCCESS("No navi ports need geocoding."))
+            return
+
+        # Ports sharing rounded coordinates share one lookup. Workers only
+        # overlap network waits; the client's token bucket still spaces the
+        # requests out to the provider's rate limit.
+        responses, failed = self.geocode(ports_by_coordinates, options["workers"])
+
+        updated = []
+        fields = set()
+        for coordinates, response in responses.items():
+            for port in ports_by_coordinates[coordinates]:
+                applied = port.apply_geocode(response)
+                if applied:
+                    updated.append(port)
+                    fields.update(applied)
+
+        if updated and not options["dry_run"]:
+            NaviPort.objects.bulk_update(
+                updated, sorted(fields), batch_size=options["batch_size"]
+            )
+
+        elapsed = time.monotonic() - started
+        msg = (
+            f"{'Found' if options['dry_run'] else 'Geocoded'} {len(updated)} "
+            f"navi port(s) from {len(responses)} of {len(ports_by_coordinates)} "
+            f"coordinate(s) in {elapsed:.1f}s "
+            f"({len(ports_by_coordinates) / elapsed:.2f} lookups/s); "
+            f"{failed} failed."
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(msg))
+        else:
+            self.stdout.write(self.style.SUCCESS(msg))
+
+    def geocode(self, ports_by_coordinates, workers):
+        responses = {}
+        failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(reverse_geocode, *coordinates): coordinates
+                for coordinates in ports_by_coordinates
+            }
+            for future in as_completed(futures):
+                coordinates = futures[future]
+                try:
+                    responses[coordinates] = future.result()
+                except Exception as e:  # noqa: BLE001
+                    failed += 1
+                    self.stderr.write(f"  {coordinates} failed: {e}")
+                    continue
+                if self.verbosity > 1:
+                    self.stdout.write(f"  {coordinates} geocoded")
+        return responses, failed
@@ -0,0 +1,102 @@
+import math
+
+from django.db import models
+from django.db.models import FloatField
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models.functions import ASin
+from django.db.models.functions import Cast
+from django.db.models.functions import Cos
+from django.db.models.functions import Least
+from django.db.models.functions import Power
+from django.db.models.functions import Radians
+from django.db.models.functions import Sin
+from django.db.models.functions import Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LATITUDE = 111.32
+# Half the circumference: no two points on Earth are further apart.
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+NEAREST_START_RADIUS_KM = 5
+
+
+def haversine_km(lat, lng):
+    """
+    Great-circle distance in km from ``(lat, lng)`` to the row's latitude and
+    longitude, as a float expression.
+    """
+    origin_lat = math.radians(float(lat))
+    row_lat = Radians(Cast("latitude", FloatField()))
+    row_lng = Radians(Cast("longitude", FloatField()))
+    half_dlat = (row_lat - Value(origin_lat)) / Value(2.0)
+    half_dlng = (row_lng - Value(math.radians(float(lng)))) / Value(2.0)
+    a = Power(Sin(half_dlat), 2) + Value(math.cos(origin_lat)) * Cos(row_lat) * Power(
+        Sin(half_dlng), 2
+    )
+    # Least() guards asin against rounding pushing sqrt(a) just past 1.
+    return Value(2 * EARTH_RADIUS_KM) * ASin(
+        Least(Sqrt(a), Value(1.0)), output_field=FloatField()
+    )
+
+
+def bounding_box(lat, lng, radius_km):
+    """
+    Returns a Q over latitude/longitude that contains every point within
+    ``radius_km`` of ``(lat, lng)``, for the (latitude, longitude) index to
+    range-scan before the exact distance is computed.
+    """
+    lat, lng = float(lat), float(lng)
+    dlat = radius_km / KM_PER_DEGREE_LATITUDE
+    box = Q(latitude__gte=max(lat - dlat, -90), latitude__lte=min(lat + dlat, 90))
+
+    # Near a pole, or for huge radii, every longitude can be in range.
+    if abs(lat) + dlat >= 90:  # noqa: PLR2004
+        return box
+    dlng = dlat / math.cos(math.radians(lat))
+    if dlng >= 180:  # noqa: PLR2004
+        return box
+
+    west, east = lng - dlng, lng + dlng
+    if west < -180:  # noqa: PLR2004
+        return box & (Q(longitude__gte=west + 360) | Q(longitude__lte=east))
+    if east > 180:  # noqa: PLR2004
+        return box & (Q(longitude__gte=west) | Q(longitude__lte=east - 360))
+    return box & Q(longitude__gte=west, longitude__lte=east)
+
+
+class NaviPortQuerySet(models.QuerySet):
+    def with_distance(self, lat, lng):
+        return self.annotate(distance_km=haversine_km(lat, lng))
+
+    def within_radius(self, lat, lng, radius_km):
+        """
+        Ports within ``radius_km`` of ``(lat, lng)``, nearest first, with the
+        distance annotated as ``distance_km``.
+        """
+        return (
+            self.filter(bounding_box(lat, lng, radius_km))
+            .with_distance(lat, lng)
+            .filter(distance_km__lte=radius_km)
+            .order_by("distance_km", "pk")
+        )
+
+    def nearest(
+        self,
+        lat,
+        lng,
+        limit=10,
+        max_radius_km=MAX_DISTANCE_KM,
+    ):
+        """
+        Returns a list of the ``limit`` ports nearest to ``(lat, lng)``.
+
+        Searches a small radius first and widens it until enough ports are
+        found, so dense areas only ever touch a few index pages. Every port
+        within the radius is considered, so the result is exact.
+        """
+        radius_km = min(NEAREST_START_RADIUS_KM, max_radius_km)
+        while True:
+            results = list(self.within_radius(lat, lng, radius_km)[:limit])
+            if len(results) >= limit or radius_km >= max_radius_km:
+                return results
+            radius_km = min(radius_km * 4, max_radius_km)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0008_alter_espressomachine_status_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='naviport',
+            index=models.Index(fields=['latitude', 'longitude'], name='naviport_lat_lng_idx'),
+        ),
+    ]
@@ -6,6 +6,7 @@ from navi_backend.core.models import AuditModel
 from navi_backend.core.models import NamedModel
 from navi_backend.core.models import SlugifiedModel
 from navi_backend.core.models import UUIDModel
+from navi_backend.devices.managers import NaviPortQuerySet
 from navi_backend.menu.models import MenuItem
 
 
@@ -80,5 +81,12 @@ class NaviPort(UUIDModel, SlugifiedModel, NamedModel, AuditModel, AddressModel):
     latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True)
     longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True)
 
+    objects = NaviPortQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"], name="naviport_lat_lng_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         return super().save(*args, **kwargs)
@@ -0,0 +1,101 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from navi_backend.core.helpers import geo_cache
+from navi_backend.core.helpers.geo_cache import StubGeocoder
+
+from .factories import NaviPortFactory
+
+
+def geocode_naviports(*args):
+    out = StringIO()
+    err = StringIO()
+    call_command("geocode_naviports", *args, stdout=out, stderr=err, skip_checks=True)
+    return out.getvalue(), err.getvalue()
+
+
+@pytest.fixture
+def geocoder_calls(monkeypatch):
+    cache.clear()
+    calls = []
+
+    class CountingGeocoder(StubGeocoder):
+        def reverse(self, lat, lng):
+            calls.append((lat, lng))
+            if lat < 0:
+                msg = "Geocoder responded with 500."
+                raise ValueError(msg)
+            return super().reverse(lat, lng)
+
+    monkeypatch.setattr(geo_cache, "get_geocoder", CountingGeocoder)
+    yield calls
+    cache.clear()
+
+
+def build_unaddressed_port(latitude, longitude):
+    return NaviPortFactory(
+        address_line_1="",
+        city="",
+        postal_code="",
+        latitude=Decimal(latitude),
+        longitude=Decimal(longitude),
+        espresso_machine=None,
+    )
+
+
+@pytest.mark.django_db
+class TestGeocodeNaviPorts:
+    def test_geocodes_unique_coordinates_once(self, geocoder_calls):
+        first = build_unaddressed_port("40.712776", "-74.005974")
+        second = build_unaddressed_port("40.712791", "-74.005951")
+        other = build_unaddressed_port("42.360082", "-71.058880")
+        addressed = NaviPortFactory(espresso_machine=None)
+
+        output, _ = geocode_naviports("--workers", "2")
+
+        assert sorted(geocoder_calls) == [
+            (Decimal("40.7128"), Decimal("-74.0060")),
+            (Decimal("42.3601"), Decimal("-71.0589")),
+        ]
+        assert "Geocoded 3 navi port(s) from 2 of 2 coordinate(s)" in output
+        for port in (first, second, other):
+            port.refresh_from_db()
+            assert port.city == "Stubville"
+            assert port.address_line_1
+            assert port.postal_code
+        city = addressed.city
+        addressed.refresh_from_db()
+        assert addressed.city == city
+
+    def test_reports_failures(self, geocoder_calls):
+        build_unaddressed_port("40.712776", "-74.005974")
+        failing = build_unaddressed_port("-33.868820", "151.209290")
+
+        output, errors = geocode_naviports()
+
+        assert "Geocoded 1 navi port(s) from 1 of 2 coordinate(s)" in output
+        assert "1 failed" in output
+        assert "500" in errors
+        failing.refresh_from_db()
+        assert failing.city == ""
+
+    def test_dry_run_writes_nothing(self, geocoder_calls):
+        port = build_unaddressed_port("40.712776", "-74.005974")
+
+        output, _ = geocode_naviports("--dry-run")
+
+        assert "Found 1 navi port(s)" in output
+        port.refresh_from_db()
+        assert port.city == ""
+
+    def test_nothing_to_do(self, geocoder_calls):
+        NaviPortFactory(espresso_machine=None)
+
+        output, _ = geocode_naviports()
+
+        assert "No navi ports need geocoding." in output
+        assert geocoder_calls == []
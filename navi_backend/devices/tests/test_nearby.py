@@ -0,0 +1,144 @@
+import math
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.devices.api.views import NaviPortViewSet
+from navi_backend.devices.managers import EARTH_RADIUS_KM
+from navi_backend.devices.managers import bounding_box
+from navi_backend.devices.models import NaviPort
+
+from .factories import NaviPortFactory
+
+BOSTON = (42.3601, -71.0589)
+
+
+def haversine(origin, point):
+    lat1, lng1, lat2, lng2 = map(math.radians, (*origin, *point))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def build_port(lat, lng, **kwargs):
+    return NaviPortFactory(
+        latitude=Decimal(f"{lat:.6f}"),
+        longitude=Decimal(f"{lng:.6f}"),
+        espresso_machine=None,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def ports():
+    # Roughly 1km, 5km, 20km and 300km from BOSTON, plus one in Sydney.
+    return [
+        build_port(42.3690, -71.0589),
+        build_port(42.3601, -71.0000),
+        build_port(42.5400, -71.0589),
+        build_port(40.7128, -74.0060),
+        build_port(-33.8688, 151.2093),
+    ]
+
+
+@pytest.mark.django_db
+class TestNaviPortQuerySet:
+    def test_within_radius_orders_by_distance(self, ports):
+        results = list(NaviPort.objects.within_radius(*BOSTON, 25))
+
+        assert [port.pk for port in results] == [port.pk for port in ports[:3]]
+        for port in results:
+            expected = haversine(BOSTON, (port.latitude, port.longitude))
+            assert port.distance_km == pytest.approx(expected, abs=0.01)
+
+    def test_nearest_widens_search_until_limit(self, ports):
+        results = NaviPort.objects.nearest(*BOSTON, limit=4)
+
+        assert [port.pk for port in results] == [port.pk for port in ports[:4]]
+
+    def test_nearest_reaches_the_other_side_of_the_world(self, ports):
+        results = NaviPort.objects.nearest(*BOSTON, limit=10)
+
+        assert [port.pk for port in results] == [port.pk for port in ports]
+
+    def test_nearest_respects_max_radius(self, ports):
+        results = NaviPort.objects.nearest(*BOSTON, limit=10, max_radius_km=50)
+
+        assert len(results) == 3
+
+    def test_bounding_box_wraps_the_antimeridian(self):
+        east = build_port(0, 179.95)
+        west = build_port(0, -179.95)
+        build_port(0, 170)
+
+        results = list(NaviPort.objects.within_radius(0, 179.99, 20))
+
+        assert {port.pk for port in results} == {east.pk, west.pk}
+
+    def test_bounding_box_drops_longitude_near_poles(self):
+        assert "longitude" not in str(bounding_box(89.9, 0, 50))
+
+    def test_lookup_uses_lat_lng_index(self, ports):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = NaviPort.objects.within_radius(*BOSTON, 25).explain()
+
+        assert "naviport_lat_lng_idx" in plan
+
+
+@pytest.mark.django_db
+class TestNearbyAction:
+    def get(self, **params):
+        view = NaviPortViewSet.as_view({"get": "nearby"})
+        return view(APIRequestFactory().get("/navi_ports/nearby/", params))
+
+    def test_returns_nearest_with_distance(self, ports):
+        response = self.get(lat=BOSTON[0], lng=BOSTON[1], limit=2)
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data] == [
+            str(port.pk) for port in ports[:2]
+        ]
+        assert response.data[0]["distance_km"] < response.data[1]["distance_km"]
+
+    def test_radius_filters_results(self, ports):
+        response = self.get(lat=BOSTON[0], lng=BOSTON[1], radius_km=10)
+
+        assert len(response.data) == 2
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"lat": "north", "lng": 0},
+            {"lat": 91, "lng": 0},
+            {"lat": 0, "lng": 0, "radius_km": 0},
+            {"lat": 0, "lng": 0, "radius_km": 10_000},
+        ],
+    )
+    def test_rejects_bad_parameters(self, params):
+        assert self.get(**params).status_code == 400
+
+
+@pytest.mark.django_db
+def test_benchmark_command_agrees_with_full_scan(user):
+    out = StringIO()
+    call_command(
+        "benchmark_naviport_lookup",
+        "--ports",
+        "300",
+        "--queries",
+        "10",
+        stdout=out,
+        skip_checks=True,
+    )
+
+    assert "0 of 10 lookups disagreed" in out.getvalue()
+    assert not NaviPort.objects.exists()
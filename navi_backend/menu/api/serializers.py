@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from navi_backend.core.api import BaseModelSerializer
@@ -5,6 +6,7 @@ from navi_backend.core.api.mixins import ReadOnlyAuditMixin
 from navi_backend.menu.models import Category
 from navi_backend.menu.models import Customization
 from navi_backend.menu.models import CustomizationGroup
+from navi_backend.menu.models import Ingredient
 from navi_backend.menu.models import MenuItem
 from navi_backend.menu.models import MenuItemIngredient
 
@@ -20,6 +22,18 @@ class MenuItemIngredientSerializer(serializers.ModelSerializer):
         ]
 
 
+class IngredientSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Ingredient
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "description",
+            "is_allergen",
+        ]
+
+
 class CustomizationSerializer(BaseModelSerializer):
     class Meta:
         model = Customization
@@ -64,6 +78,10 @@ class MenuItemSerializer(ReadOnlyAuditMixin, serializers.ModelSerializer):
             "price",
             "ingredients",
         ]
+        prefetch_plan = {
+            "select_related": ["category"],
+            "prefetch_related": ["menu_item_ingredients"],
+        }
 
 
 class CustomizationGroupSerializer(BaseModelSerializer):
@@ -91,6 +109,9 @@ class CustomizationGroupSerializer(BaseModelSerializer):
             "maximum_allowed",
             "customizations",
         ]
+        prefetch_plan = {
+            "prefetch_related": ["category", "customization_set"],
+        }
 
 
 class CategoryCustomizationSerializer(serializers.ModelSerializer):
@@ -103,6 +124,16 @@ class CategoryCustomizationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "slug", "customization_groups"]
+        prefetch_plan = {
+            "prefetch_related": [
+                Prefetch(
+                    "customizationgroup_set",
+                    queryset=CustomizationGroup.objects.prefetch_related(
+                        "category", "customization_set"
+                    ),
+                )
+            ],
+        }
 
 
 class CategorySerializer(ReadOnlyAuditMixin, serializers.ModelSerializer):
@@ -119,12 +150,8 @@ class CategorySerializer(ReadOnlyAuditMixin, serializers.ModelSerializer):
 
 
 class MenuItemCustomizationSerializer(ReadOnlyAuditMixin, serializers.ModelSerializer):
-    category = CategoryCustomizationSerializer(read_only=True)
-    ingredients = MenuItemIngredientSerializer(
-        many=True,
-        source="menu_item_ingredients",
-        read_only=True,
-    )
+    category = serializers.SerializerMethodField()
+    ingredients = serializers.SerializerMethodField()
 
     class Meta:
         model = MenuItem
@@ -139,3 +166,24 @@ class MenuItemCustomizationSerializer(ReadOnlyAuditMixin, serializers.ModelSeria
             "price",
             "ingredients",
         ]
+
+    def get_ingredients(self, obj):
+        # Items looked up with with_ingredient_rows() carry their ingredients.
+        rows = getattr(obj, "ingredient_rows", None)
+        if rows is None:
+            return MenuItemIngredientSerializer(
+                obj.menu_item_ingredients.all(), many=True
+            ).data
+        fields = MenuItemIngredientSerializer.Meta.fields
+        return [{field: row[field] for field in fields} for row in rows]
+
+    def get_category(self, obj):
+        from navi_backend.menu.services import (  # noqa: PLC0415
+            CategoryCustomizationService,
+        )
+
+        if not obj.category_id:
+            return None
+        return CategoryCustomizationService.get_tree(
+            obj.category_id, self.context.get("request")
+        )
@@ -5,6 +5,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
+from navi_backend.core.api.mixins import PrefetchPlanMixin
 from navi_backend.core.permissions import ReadOnly
 from navi_backend.menu.api.serializers import CategorySerializer
 from navi_backend.menu.api.serializers import CustomizationGroupSerializer
@@ -18,13 +19,39 @@ from navi_backend.menu.models import CustomizationGroup
 from navi_backend.menu.models import Ingredient
 from navi_backend.menu.models import MenuItem
 from navi_backend.menu.models import MenuItemIngredient
+from navi_backend.menu.services import MenuSnapshotService
 from navi_backend.orders.api.mixins import TrackUserMixin
 
-
-class MenuItemViewSet(TrackUserMixin, viewsets.ModelViewSet):
+MENU_ITEM_SEARCH_LIMIT = 20
+MENU_ITEM_SEARCH_MAX_LIMIT = 100
+MENU_ITEM_READ_FIELDS = [
+    "id",
+    "slug",
+    "name",
+    "status",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "updated_by",
+    "body",
+    "description",
+    "price",
+    "category__name",
+]
+
+
+class MenuItemViewSet(PrefetchPlanMixin, TrackUserMixin, viewsets.ModelViewSet):
     queryset = MenuItem.objects.all()
     serializer_class = MenuItemSerializer
     permission_classes = [IsAdminUser | ReadOnly]
+    prefetch_plans = {
+        "retrieve": {
+            **MenuItemSerializer.Meta.prefetch_plan,
+            "only": MENU_ITEM_READ_FIELDS,
+        },
+        # Ingredients come from with_ingredient_rows(), in the item's query.
+        "category_customizations": {},
+    }
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -35,6 +62,50 @@ class MenuItemViewSet(TrackUserMixin, viewsets.ModelViewSet):
 
         return qs.filter(status=status)
 
+    def list(self, request, *args, **kwargs):
+        menu_items = MenuSnapshotService.get_snapshot()["menu_items"]
+        status_filter = request.query_params.get("status")
+
+        if status_filter is not None:
+            menu_items = [
+                item for item in menu_items if item["status"] == status_filter
+            ]
+
+        return Response(menu_items, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def snapshot(self, request):
+        """
+        GET /menu_items/snapshot/
+        """
+        return Response(MenuSnapshotService.get_snapshot(), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        GET /menu_items/search/?q=<query>&limit=<n>
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"detail": "Query parameter 'q' is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", MENU_ITEM_SEARCH_LIMIT))
+        except ValueError:
+            limit = MENU_ITEM_SEARCH_LIMIT
+        limit = max(1, min(limit, MENU_ITEM_SEARCH_MAX_LIMIT))
+
+        results = MenuItem.objects.search(query, queryset=self.get_queryset())[:limit]
+        serializer = self.get_serializer(results, many=True)
+        data = [
+            {**item, "rank": result.rank}
+            for item, result in zip(serializer.data, results, strict=True)
+        ]
+        return Response(data, status=status.HTTP_200_OK)
+
     @action(
         detail=False,
         methods=["get"],
@@ -44,8 +115,10 @@ class MenuItemViewSet(TrackUserMixin, viewsets.ModelViewSet):
         """
         GET /menu_items/<slug>/category-customizations/
         """
-        menu_item = get_object_or_404(MenuItem, slug=slug)
-        if not menu_item.category:
+        menu_item = get_object_or_404(
+            MenuItem.objects.with_ingredient_rows(self.get_queryset()), slug=slug
+        )
+        if not menu_item.category_id:
             return Response(
                 {"detail": "No category for that menu-item."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -108,7 +181,9 @@ class CustomizationViewSet(TrackUserMixin, viewsets.ModelViewSet):
     permission_classes = [IsAdminUser | ReadOnly]
 
 
-class CustomizationGroupViewSet(TrackUserMixin, viewsets.ModelViewSet):
+class CustomizationGroupViewSet(
+    PrefetchPlanMixin, TrackUserMixin, viewsets.ModelViewSet
+):
     queryset = CustomizationGroup.objects.all()
     serializer_class = CustomizationGroupSerializer
     permission_classes = [IsAdminUser | ReadOnly]
@@ -1,7 +1,19 @@
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.core.cache import cache
 from django.db import models
+from django.db.models import Q
+from django.db.models import TextField
+from django.db.models import Value
+from django.db.models.functions import Cast
+from django.db.models.functions import JSONObject
 from django.utils import timezone
 
+SEARCH_CONFIG = "english"
+TRIGRAM_THRESHOLD = 0.3
+
 
 class MenuItemManager(models.Manager):
     def get_queryset(self):
@@ -19,11 +31,56 @@ class MenuItemManager(models.Manager):
     def by_category(self, category_slug):
         return self.active().filter(category__slug=category_slug)
 
+    def with_live_counts(self, queryset=None):
+        """
+        Annotates live_view_count and live_selected_count: the persisted
+        counters plus increments still buffered in Redis.
+        """
+        from navi_backend.menu.services.menu_counter_service import (  # noqa: PLC0415
+            MenuCounterService,
+        )
+        from navi_backend.menu.services.menu_counter_service import (  # noqa: PLC0415
+            counter_delta,
+        )
+
+        queryset = self.get_queryset() if queryset is None else queryset
+        return queryset.annotate(
+            live_view_count=counter_delta(
+                MenuCounterService.get_pending("view_count"), "view_count"
+            ),
+            live_selected_count=counter_delta(
+                MenuCounterService.get_pending("selected_count"), "selected_count"
+            ),
+        )
+
+    def with_ingredient_rows(self, queryset=None):
+        """
+        Annotates ingredient_rows: the item's MenuItemIngredients as the
+        dicts MenuItemIngredientSerializer renders, aggregated in the same
+        query as the item so no prefetch is needed.
+        """
+        queryset = self.get_queryset() if queryset is None else queryset
+        return queryset.annotate(
+            ingredient_rows=JSONBAgg(
+                JSONObject(
+                    menu_item=Cast("menu_item_ingredients__menu_item", TextField()),
+                    ingredient=Cast("menu_item_ingredients__ingredient", TextField()),
+                    quantity=Cast("menu_item_ingredients__quantity", TextField()),
+                    unit="menu_item_ingredients__unit",
+                ),
+                filter=Q(menu_item_ingredients__isnull=False),
+                ordering="menu_item_ingredients__ingredient",
+                default=Value([]),
+            )
+        )
+
     def most_viewed(self, limit=30):
-        return self.active().order_by("-selected_count")[:limit]
+        queryset = self.with_live_counts(self.active())
+        return queryset.order_by("-live_view_count")[:limit]
 
     def most_selected(self, limit=30):
-        return self.active().order_by("-selected_count")[:limit]
+        queryset = self.with_live_counts(self.active())
+        return queryset.order_by("-live_selected_count")[:limit]
 
     def recently_added(self, days=30, limit=30):
         cutoff_date = timezone.now() - timezone.timedelta(days=days)
@@ -44,9 +101,11 @@ class MenuItemManager(models.Manager):
 
         return queryset
 
-    # TODO add more functionality to get cache
     def get_cached(self, slug):
-        cache_key = f"menuitem:slug:{slug}"
+        from navi_backend.menu.services import MenuSnapshotService  # noqa: PLC0415
+
+        version = MenuSnapshotService.get_version()
+        cache_key = f"menuitem:slug:{slug}:v{version}"
         cached_item = cache.get(cache_key)
 
         if cached_item is None:
@@ -60,13 +119,24 @@ class MenuItemManager(models.Manager):
 
         return cached_item
 
-    def search(self, query):
+    def search(self, query, queryset=None):
+        """
+        Ranks items by weighted full-text match on name, description and
+        body. When nothing matches, falls back to trigram similarity on name
+        so misspelled queries still find something.
+        """
+        queryset = self.get_queryset() if queryset is None else queryset
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        results = (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(models.F("search_vector"), search_query))
+            .order_by("-rank", "name")
+        )
+        if results.exists():
+            return results
+
         return (
-            self.get_queryset()
-            .filter(
-                models.Q(name__icontains=query)
-                | models.Q(description__icontains=query)
-                | models.Q(body__icontains=query)
-            )
-            .distinct()
+            queryset.annotate(rank=TrigramWordSimilarity(query, "name"))
+            .filter(rank__gte=TRIGRAM_THRESHOLD)
+            .order_by("-rank", "name")
         )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0006_alter_category_status_alter_customization_status_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='menuitem',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), '||', django.contrib.postgres.search.SearchVector('body', config='english', weight='C'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='menuitem_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='menuitem_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
@@ -11,6 +14,7 @@ from navi_backend.core.models import AuditModel
 from navi_backend.core.models import NamedModel
 from navi_backend.core.models import SlugifiedModel
 from navi_backend.core.models import UUIDModel
+from navi_backend.menu.managers import SEARCH_CONFIG
 from navi_backend.menu.managers import MenuItemManager
 
 
@@ -82,6 +86,15 @@ class MenuItem(
         editable=False,
         help_text=_("Internal version tracking"),
     )
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("body", weight="C", config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     objects = MenuItemManager()
 
@@ -89,6 +102,14 @@ class MenuItem(
         verbose_name = _("MenuItem")
         verbose_name_plural = _("MenuItems")
         ordering = ["name"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="menuitem_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                name="menuitem_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
         permissions = [
             ("can_change_status", "Can change menuitem status"),
             ("can_feature_product", "Can mark menuitem as featured"),
@@ -112,16 +133,22 @@ class MenuItem(
         super().save(*args, **kwargs)
 
     def increment_view_count(self):
-        """Increment the view count safely using F() expressions."""
-        self.__class__.objects.filter(pk=self.pk).update(
-            view_count=models.F("view_count") + 1
-        )
+        """Buffer a view count increment; flushed by flush_menu_counters."""
+        from navi_backend.menu.services import MenuCounterService  # noqa: PLC0415
+
+        MenuCounterService.increment(self.pk, "view_count")
 
     def increment_selected_count(self):
-        """Increment the view count safely using F() expressions."""
-        self.__class__.objects.filter(pk=self.pk).update(
-            selected_count=models.F("selected_count") + 1
-        )
+        """Buffer a selected count increment; flushed by flush_menu_counters."""
+        from navi_backend.menu.services import MenuCounterService  # noqa: PLC0415
+
+        MenuCounterService.increment(self.pk, "selected_count")
+
+    def get_live_counts(self):
+        """Persisted view/selected counts plus increments not yet flushed."""
+        from navi_backend.menu.services import MenuCounterService  # noqa: PLC0415
+
+        return MenuCounterService.get_counts(self)
 
     def get_absolute_url(self):
         """Get the canonical URL for the menuitem."""
@@ -0,0 +1,13 @@
+from .category_customization_service import CategoryCustomizationService
+from .customization_rule_service import CustomizationRule
+from .customization_rule_service import CustomizationRuleService
+from .menu_counter_service import MenuCounterService
+from .menu_snapshot_service import MenuSnapshotService
+
+__all__ = [
+    "CategoryCustomizationService",
+    "CustomizationRule",
+    "CustomizationRuleService",
+    "MenuCounterService",
+    "MenuSnapshotService",
+]
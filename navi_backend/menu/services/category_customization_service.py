@@ -0,0 +1,69 @@
+from django.core.cache import cache
+
+from navi_backend.core.api.mixins import apply_prefetch_plan
+from navi_backend.menu.api.serializers import CategoryCustomizationSerializer
+from navi_backend.menu.models import Category
+from navi_backend.menu.models import CustomizationGroup
+
+CATEGORY_CUSTOMIZATIONS_KEY = "menu:category:{category_id}:customizations:{audience}"
+# Staff see admin-only fields, so they get a tree of their own.
+CATEGORY_CUSTOMIZATIONS_AUDIENCES = ("staff", "public")
+CATEGORY_CUSTOMIZATIONS_TIMEOUT = 60 * 60 * 24
+
+
+class CategoryCustomizationService:
+    @staticmethod
+    def get_tree(category_id, request=None):
+        """
+        Returns the serialized customization tree for a category as seen by
+        ``request``'s user, building and caching it on a miss.
+        """
+        is_staff = getattr(getattr(request, "user", None), "is_staff", False)
+        cache_key = CATEGORY_CUSTOMIZATIONS_KEY.format(
+            category_id=category_id, audience="staff" if is_staff else "public"
+        )
+
+        tree = cache.get(cache_key)
+        if tree is None:
+            tree = CategoryCustomizationService.build_tree(category_id, request)
+            cache.set(cache_key, tree, timeout=CATEGORY_CUSTOMIZATIONS_TIMEOUT)
+
+        return tree
+
+    @staticmethod
+    def build_tree(category_id, request=None):
+        """
+        Serializes a category with its groups and customizations in a single
+        prefetch pass.
+        """
+        category = apply_prefetch_plan(
+            Category.objects.filter(pk=category_id),
+            CategoryCustomizationSerializer.Meta.prefetch_plan,
+        ).first()
+
+        if category is None:
+            return None
+
+        return dict(
+            CategoryCustomizationSerializer(category, context={"request": request}).data
+        )
+
+    @staticmethod
+    def invalidate(category_ids):
+        cache.delete_many(
+            [
+                CATEGORY_CUSTOMIZATIONS_KEY.format(
+                    category_id=category_id, audience=audience
+                )
+                for category_id in category_ids
+                for audience in CATEGORY_CUSTOMIZATIONS_AUDIENCES
+            ]
+        )
+
+    @staticmethod
+    def category_ids_for_groups(group_ids):
+        return set(
+            CustomizationGroup.category.through.objects.filter(
+                customizationgroup_id__in=[pk for pk in group_ids if pk]
+            ).values_list("category_id", flat=True)
+        )
@@ -0,0 +1,122 @@
+import threading
+from dataclasses import dataclass
+
+from navi_backend.menu.models import CustomizationGroup
+from navi_backend.menu.services.menu_snapshot_service import MenuSnapshotService
+
+_rule_table_lock = threading.Lock()
+_rule_table = {"version": None, "rules": {}}
+
+
+@dataclass(frozen=True)
+class CustomizationRule:
+    group_id: object
+    name: str
+    is_required: bool
+    allow_multiple: bool
+    minimum_allowed: int | None
+    maximum_allowed: int | None
+
+    def check(self, count):
+        """
+        Returns the error messages for ``count`` selections in this group.
+        """
+        if self.is_required and count == 0:
+            return [f'"{self.name}" is required.']
+
+        if count == 0:
+            return []
+
+        errors = []
+        if not self.allow_multiple and count > 1:
+            errors.append(f'"{self.name}" only allows a single selection.')
+
+        if self.minimum_allowed is not None and count < self.minimum_allowed:
+            errors.append(
+                f'"{self.name}" requires at least {self.minimum_allowed} selection(s).'
+            )
+
+        if self.maximum_allowed is not None and count > self.maximum_allowed:
+            errors.append(
+                f'"{self.name}" allows at most {self.maximum_allowed} selection(s).'
+            )
+
+        return errors
+
+
+class CustomizationRuleService:
+    @staticmethod
+    def get_rules(category_ids, *, use_cache=True):
+        """
+        Returns ``{category_id: [CustomizationRule, ...]}`` for the given
+        categories. Misses are loaded in a single query; hits come from a
+        process-local table that is dropped whenever the menu version moves.
+        """
+        category_ids = {category_id for category_id in category_ids if category_id}
+        if not category_ids:
+            return {}
+
+        version = MenuSnapshotService.get_version() if use_cache else None
+        if version is None:
+            return CustomizationRuleService.load_rules(category_ids)
+
+        with _rule_table_lock:
+            if _rule_table["version"] != version:
+                _rule_table["version"] = version
+                _rule_table["rules"] = {}
+            cached = _rule_table["rules"]
+            missing = category_ids - cached.keys()
+
+        loaded = {}
+        if missing:
+            loaded = CustomizationRuleService.load_rules(missing)
+            with _rule_table_lock:
+                if _rule_table["version"] == version:
+                    _rule_table["rules"].update(loaded)
+
+        return {
+            category_id: loaded.get(category_id, cached.get(category_id, []))
+            for category_id in category_ids
+        }
+
+    @staticmethod
+    def load_rules(category_ids):
+        """
+        Reads the groups of every category in one query over the
+        group/category join table, keeping the groups' display order.
+        """
+        rules = {category_id: [] for category_id in category_ids}
+        memberships = (
+            CustomizationGroup.category.through.objects.filter(
+                category_id__in=category_ids
+            )
+            .select_related("customizationgroup")
+            .order_by(
+                "customizationgroup__display_order",
+                "customizationgroup__name",
+            )
+        )
+
+        for membership in memberships:
+            group = membership.customizationgroup
+            rules[membership.category_id].append(
+                CustomizationRule(
+                    group_id=group.pk,
+                    name=group.name,
+                    is_required=group.is_required,
+                    allow_multiple=group.allow_multiple,
+                    minimum_allowed=group.minimum_allowed,
+                    maximum_allowed=group.maximum_allowed,
+                )
+            )
+
+        return rules
+
+    @staticmethod
+    def clear():
+        """
+        Drops the process-local rule table.
+        """
+        with _rule_table_lock:
+            _rule_table["version"] = None
+            _rule_table["rules"] = {}
@@ -0,0 +1,145 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import F
+from django.db.models import IntegerField
+from django.db.models import Value
+from django.db.models import When
+from redis.exceptions import RedisError
+
+from navi_backend.core.helpers.redis_client import get_redis
+from navi_backend.menu.models import MenuItem
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ("view_count", "selected_count")
+MENU_COUNTERS_KEY = "menu:counters:{field}"
+MENU_COUNTERS_FLUSHING_KEY = "menu:counters:{field}:flushing"
+MENU_COUNTERS_LOCK_KEY = "menu:counters:flush-lock"
+MENU_COUNTERS_LOCK_TIMEOUT = 60
+MENU_COUNTERS_BATCH_SIZE = 500
+
+
+def counter_delta(deltas, field):
+    """
+    Returns ``field`` plus the buffered delta for the row, as an expression.
+    """
+    if not deltas:
+        return F(field)
+    return F(field) + Case(
+        *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+class MenuCounterService:
+    @staticmethod
+    def increment(menu_item_id, field, amount=1):
+        """
+        Buffers a counter increment in a Redis hash. Falls back to a direct
+        UPDATE when Redis is unreachable so no increment is lost.
+        """
+        try:
+            get_redis().hincrby(
+                MENU_COUNTERS_KEY.format(field=field), str(menu_item_id), amount
+            )
+        except RedisError:
+            logger.warning("Redis unavailable, writing %s directly", field)
+            MenuItem.objects.with_deleted().filter(pk=menu_item_id).update(
+                **{field: F(field) + amount}
+            )
+
+    @staticmethod
+    def get_pending(field):
+        """
+        Returns ``{menu_item_id: delta}`` for increments not yet flushed,
+        including any batch a failed flush left behind.
+        """
+        client = get_redis()
+        try:
+            buffers = [
+                client.hgetall(MENU_COUNTERS_KEY.format(field=field)),
+                client.hgetall(MENU_COUNTERS_FLUSHING_KEY.format(field=field)),
+            ]
+        except RedisError:
+            logger.warning("Redis unavailable, ignoring buffered %s", field)
+            return {}
+
+        pending = {}
+        for buffer in buffers:
+            for pk, delta in buffer.items():
+                pk = pk.decode()  # noqa: PLW2901
+                pending[pk] = pending.get(pk, 0) + int(delta)
+        return pending
+
+    @staticmethod
+    def get_counts(menu_item):
+        """
+        Returns the persisted counters of ``menu_item`` plus buffered deltas.
+        """
+        return {
+            field: getattr(menu_item, field)
+            + MenuCounterService.get_pending(field).get(str(menu_item.pk), 0)
+            for field in COUNTER_FIELDS
+        }
+
+    @staticmethod
+    def flush(batch_size=MENU_COUNTERS_BATCH_SIZE):
+        """
+        Moves buffered increments into Postgres with one UPDATE per batch.
+        Returns the number of rows updated.
+        """
+        client = get_redis()
+        lock = client.lock(MENU_COUNTERS_LOCK_KEY, timeout=MENU_COUNTERS_LOCK_TIMEOUT)
+        if not lock.acquire(blocking=False):
+            return 0
+
+        try:
+            return sum(
+                MenuCounterService.flush_field(client, field, batch_size)
+                for field in COUNTER_FIELDS
+            )
+        finally:
+            lock.release()
+
+    @staticmethod
+    def flush_field(client, field, batch_size):
+        live_key = MENU_COUNTERS_KEY.format(field=field)
+        flushing_key = MENU_COUNTERS_FLUSHING_KEY.format(field=field)
+
+        # RENAME snapshots the hash atomically; increments landing after it go
+        # to a fresh hash. A leftover snapshot from a failed flush is retried
+        # before a new one is taken.
+        if not client.exists(flushing_key):
+            if not client.exists(live_key):
+                return 0
+            client.rename(live_key, flushing_key)
+
+        deltas = {
+            pk.decode(): int(delta)
+            for pk, delta in client.hgetall(flushing_key).items()
+            if int(delta)
+        }
+        pks = list(deltas)
+
+        updated = 0
+        try:
+            with transaction.atomic():
+                for start in range(0, len(pks), batch_size):
+                    batch = {pk: deltas[pk] for pk in pks[start : start + batch_size]}
+                    updated += (
+                        MenuItem.objects.with_deleted()
+                        .filter(pk__in=batch)
+                        .update(**{field: counter_delta(batch, field)})
+                    )
+                # Drop the snapshot before COMMIT: a crash in between loses
+                # this batch instead of applying it a second time.
+                client.delete(flushing_key)
+        except Exception:
+            # Nothing was committed, so put the snapshot back for the retry.
+            if deltas:
+                client.hset(flushing_key, mapping=deltas)
+            raise
+        return updated
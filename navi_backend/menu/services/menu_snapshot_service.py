@@ -0,0 +1,87 @@
+import time
+
+from django.core.cache import cache
+
+from navi_backend.core.api.mixins import apply_prefetch_plan
+from navi_backend.menu.api.serializers import CategoryCustomizationSerializer
+from navi_backend.menu.api.serializers import IngredientSerializer
+from navi_backend.menu.api.serializers import MenuItemSerializer
+from navi_backend.menu.models import Category
+from navi_backend.menu.models import Ingredient
+from navi_backend.menu.models import MenuItem
+
+MENU_VERSION_KEY = "menu:version"
+MENU_SNAPSHOT_KEY = "menu:snapshot:v{version}"
+MENU_SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+
+class MenuSnapshotService:
+    @staticmethod
+    def get_version():
+        """
+        Returns the current menu version, seeding it if the key was evicted.
+        Returns None when the cache is unreachable.
+        """
+        version = cache.get(MENU_VERSION_KEY)
+        if version is not None:
+            return version
+
+        # Seed from the clock so an evicted counter never resurrects a stale
+        # snapshot stored under a previously used version number.
+        cache.add(MENU_VERSION_KEY, time.time_ns() // 1000, timeout=None)
+        return cache.get(MENU_VERSION_KEY)
+
+    @staticmethod
+    def bump_version():
+        """
+        Moves the menu to a new version, orphaning every cached snapshot.
+        """
+        try:
+            return cache.incr(MENU_VERSION_KEY)
+        except ValueError:
+            return MenuSnapshotService.get_version()
+
+    @staticmethod
+    def get_snapshot():
+        """
+        Returns the serialized menu for the current version, building and
+        caching it on a miss.
+        """
+        version = MenuSnapshotService.get_version()
+        if version is None:
+            return MenuSnapshotService.build_snapshot(version)
+
+        cache_key = MENU_SNAPSHOT_KEY.format(version=version)
+
+        snapshot = cache.get(cache_key)
+        if snapshot is None:
+            snapshot = MenuSnapshotService.build_snapshot(version)
+            cache.set(cache_key, snapshot, timeout=MENU_SNAPSHOT_TIMEOUT)
+
+        return snapshot
+
+    @staticmethod
+    def build_snapshot(version):
+        """
+        Serializes categories, customization groups, menu items and
+        ingredients in a fixed number of queries.
+        """
+        categories = apply_prefetch_plan(
+            Category.objects.all(),
+            CategoryCustomizationSerializer.Meta.prefetch_plan,
+        )
+        menu_items = apply_prefetch_plan(
+            MenuItem.objects.all(),
+            MenuItemSerializer.Meta.prefetch_plan,
+        )
+
+        return {
+            "version": version,
+            "categories": list(
+                CategoryCustomizationSerializer(categories, many=True).data
+            ),
+            "menu_items": list(MenuItemSerializer(menu_items, many=True).data),
+            "ingredients": list(
+                IngredientSerializer(Ingredient.objects.all(), many=True).data
+            ),
+        }
@@ -0,0 +1,108 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from navi_backend.menu.models import Category
+from navi_backend.menu.models import Customization
+from navi_backend.menu.models import CustomizationGroup
+from navi_backend.menu.models import Ingredient
+from navi_backend.menu.models import MenuItem
+from navi_backend.menu.models import MenuItemIngredient
+from navi_backend.menu.services import CategoryCustomizationService
+from navi_backend.menu.services import MenuSnapshotService
+
+SNAPSHOT_MODELS = (
+    Category,
+    Customization,
+    CustomizationGroup,
+    Ingredient,
+    MenuItem,
+    MenuItemIngredient,
+)
+
+
+def invalidate_menu_snapshot(sender, **kwargs):
+    # Bump after commit so a concurrent reader can't cache the old rows under
+    # the new version.
+    transaction.on_commit(MenuSnapshotService.bump_version)
+
+
+for model in SNAPSHOT_MODELS:
+    post_save.connect(
+        invalidate_menu_snapshot,
+        sender=model,
+        dispatch_uid=f"menu_snapshot_post_save_{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_menu_snapshot,
+        sender=model,
+        dispatch_uid=f"menu_snapshot_post_delete_{model.__name__}",
+    )
+
+m2m_changed.connect(
+    invalidate_menu_snapshot,
+    sender=CustomizationGroup.category.through,
+    dispatch_uid="menu_snapshot_m2m_changed_customizationgroup_category",
+)
+
+
+def invalidate_category_customizations(category_ids):
+    category_ids = set(category_ids)
+    if not category_ids:
+        return
+
+    transaction.on_commit(lambda: CategoryCustomizationService.invalidate(category_ids))
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_tree(sender, instance, **kwargs):
+    invalidate_category_customizations([instance.pk])
+
+
+@receiver(post_save, sender=CustomizationGroup)
+@receiver(pre_delete, sender=CustomizationGroup)
+def invalidate_group_category_trees(sender, instance, **kwargs):
+    invalidate_category_customizations(
+        CategoryCustomizationService.category_ids_for_groups([instance.pk])
+    )
+
+
+@receiver(m2m_changed, sender=CustomizationGroup.category.through)
+def invalidate_group_membership_trees(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        invalidate_category_customizations([instance.pk])
+    elif action == "pre_clear":
+        invalidate_category_customizations(
+            CategoryCustomizationService.category_ids_for_groups([instance.pk])
+        )
+    else:
+        invalidate_category_customizations(pk_set or [])
+
+
+@receiver(pre_save, sender=Customization)
+def invalidate_customization_previous_group_trees(sender, instance, **kwargs):
+    if instance._state.adding:  # noqa: SLF001
+        return
+
+    previous_group_ids = Customization.objects.filter(pk=instance.pk).values_list(
+        "group_id", flat=True
+    )
+    invalidate_category_customizations(
+        CategoryCustomizationService.category_ids_for_groups(previous_group_ids)
+    )
+
+
+@receiver([post_save, post_delete], sender=Customization)
+def invalidate_customization_group_trees(sender, instance, **kwargs):
+    invalidate_category_customizations(
+        CategoryCustomizationService.category_ids_for_groups([instance.group_id])
+    )
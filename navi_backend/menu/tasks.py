@@ -0,0 +1,14 @@
+import logging
+
+from celery import shared_task
+
+from navi_backend.menu.services import MenuCounterService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def flush_menu_counters(self):
+    updated = MenuCounterService.flush()
+    logger.info("Flushed buffered menu counters into %s rows", updated)
+    return updated
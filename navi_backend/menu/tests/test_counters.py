@@ -0,0 +1,124 @@
+import pytest
+import redis
+from django.db import DatabaseError
+from django.db import transaction
+
+from navi_backend.core.helpers.redis_client import get_redis
+from navi_backend.menu.models import MenuItem
+from navi_backend.menu.services import MenuCounterService
+from navi_backend.menu.services import menu_counter_service
+from navi_backend.menu.tasks import flush_menu_counters
+
+from .factories import MenuItemFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_counters():
+    keys = get_redis().keys("menu:counters:*")
+    if keys:
+        get_redis().delete(*keys)
+    yield
+    keys = get_redis().keys("menu:counters:*")
+    if keys:
+        get_redis().delete(*keys)
+
+
+@pytest.mark.django_db
+class TestMenuCounterService:
+    def test_increments_are_buffered_until_flush(self, django_assert_num_queries):
+        menu_item = MenuItemFactory(status=MenuItem.Status.ACTIVE)
+
+        with django_assert_num_queries(0):
+            for _ in range(3):
+                menu_item.increment_view_count()
+            menu_item.increment_selected_count()
+
+        menu_item.refresh_from_db()
+        assert menu_item.view_count == 0
+        assert menu_item.get_live_counts() == {"view_count": 3, "selected_count": 1}
+
+        assert flush_menu_counters() == 2
+        menu_item.refresh_from_db()
+        assert menu_item.view_count == 3
+        assert menu_item.selected_count == 1
+        assert MenuCounterService.get_pending("view_count") == {}
+
+    def test_flush_batches_updates(self, django_assert_num_queries):
+        menu_items = MenuItemFactory.create_batch(5)
+        for menu_item in menu_items:
+            menu_item.increment_view_count()
+
+        # One UPDATE per batch of two, inside a savepoint.
+        with django_assert_num_queries(5):
+            MenuCounterService.flush(batch_size=2)
+
+        assert set(
+            MenuItem.objects.filter(pk__in=[m.pk for m in menu_items]).values_list(
+                "view_count", flat=True
+            )
+        ) == {1}
+
+    def test_most_viewed_merges_buffered_counts(self):
+        persisted = MenuItemFactory(status=MenuItem.Status.ACTIVE)
+        MenuItem.objects.filter(pk=persisted.pk).update(view_count=2)
+        buffered = MenuItemFactory(status=MenuItem.Status.ACTIVE)
+        for _ in range(3):
+            buffered.increment_view_count()
+
+        ranked = list(MenuItem.objects.most_viewed(limit=2))
+
+        assert ranked == [buffered, persisted]
+        assert ranked[0].live_view_count == 3
+
+    def test_leftover_flushing_batch_is_retried(self):
+        menu_item = MenuItemFactory()
+        menu_item.increment_selected_count()
+        get_redis().rename(
+            "menu:counters:selected_count", "menu:counters:selected_count:flushing"
+        )
+        menu_item.increment_selected_count()
+
+        assert menu_item.get_live_counts()["selected_count"] == 2
+        MenuCounterService.flush()
+        MenuCounterService.flush()
+
+        menu_item.refresh_from_db()
+        assert menu_item.selected_count == 2
+
+    def test_snapshot_is_dropped_before_commit(self, monkeypatch):
+        menu_item = MenuItemFactory()
+        menu_item.increment_view_count()
+        client = get_redis()
+        delete = client.delete
+        in_transaction = []
+
+        def failing_delete(*keys):
+            in_transaction.append(transaction.get_connection().in_atomic_block)
+            delete(*keys)
+            msg = "commit failed"
+            raise DatabaseError(msg)
+
+        monkeypatch.setattr(client, "delete", failing_delete)
+        with pytest.raises(DatabaseError):
+            MenuCounterService.flush_field(client, "view_count", batch_size=10)
+        monkeypatch.undo()
+
+        assert in_transaction == [True]
+        menu_item.refresh_from_db()
+        assert menu_item.view_count == 0
+        assert MenuCounterService.get_pending("view_count") == {str(menu_item.pk): 1}
+
+        MenuCounterService.flush()
+        menu_item.refresh_from_db()
+        assert menu_item.view_count == 1
+
+    def test_falls_back_to_database_without_redis(self, monkeypatch):
+        unreachable = redis.Redis(port=1, socket_connect_timeout=0.1)
+        monkeypatch.setattr(menu_counter_service, "get_redis", lambda: unreachable)
+        menu_item = MenuItemFactory()
+
+        menu_item.increment_view_count()
+
+        menu_item.refresh_from_db()
+        assert menu_item.view_count == 1
+        assert MenuCounterService.get_pending("view_count") == {}
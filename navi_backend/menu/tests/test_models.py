@@ -7,6 +7,7 @@ from django.db import IntegrityError
 from navi_backend.menu.models import Customization
 from navi_backend.menu.models import CustomizationGroup
 from navi_backend.menu.models import MenuItem
+from navi_backend.menu.services import MenuCounterService
 
 from .factories import CategoryFactory
 from .factories import CustomizationFactory
@@ -66,6 +67,7 @@ class TestMenuItem:
         menu_item = MenuItemFactory()
         initial_count = menu_item.view_count
         menu_item.increment_view_count()
+        MenuCounterService.flush()
         menu_item.refresh_from_db()
         assert menu_item.view_count == initial_count + 1
 
@@ -73,6 +75,7 @@ class TestMenuItem:
         menu_item = MenuItemFactory()
         initial_count = menu_item.selected_count
         menu_item.increment_selected_count()
+        MenuCounterService.flush()
         menu_item.refresh_from_db()
         assert menu_item.selected_count == initial_count + 1
 
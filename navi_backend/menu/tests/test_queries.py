@@ -0,0 +1,118 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.menu.api.serializers import MenuItemIngredientSerializer
+from navi_backend.menu.api.views import CustomizationGroupViewSet
+from navi_backend.menu.api.views import MenuItemViewSet
+
+from .factories import CategoryFactory
+from .factories import CustomizationFactory
+from .factories import CustomizationGroupFactory
+from .factories import MenuItemFactory
+from .factories import MenuItemIngredientFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_rf():
+    return APIRequestFactory()
+
+
+def build_menu(size):
+    """
+    Creates ``size`` categories, each with one menu item carrying two
+    ingredients and two customization groups of two customizations.
+    """
+    menu_items = []
+    for _ in range(size):
+        category = CategoryFactory()
+        for _ in range(2):
+            group = CustomizationGroupFactory(category=[category])
+            CustomizationFactory.create_batch(2, group=group)
+
+        menu_item = MenuItemFactory(category=category)
+        MenuItemIngredientFactory.create_batch(2, menu_item=menu_item)
+        menu_items.append(menu_item)
+    return menu_items
+
+
+@pytest.mark.django_db
+class TestMenuItemViewSetQueryCounts:
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_list(self, size, api_rf, django_assert_num_queries):
+        build_menu(size)
+        view = MenuItemViewSet.as_view({"get": "list"})
+
+        with django_assert_num_queries(7):
+            response = view(api_rf.get("/api/menu-items/"))
+
+        assert response.status_code == 200
+        assert len(response.data) == size
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_retrieve(self, size, api_rf, django_assert_num_queries):
+        menu_item = build_menu(size)[0]
+        view = MenuItemViewSet.as_view({"get": "retrieve"})
+
+        with django_assert_num_queries(2):
+            response = view(api_rf.get("/api/menu-items/"), pk=menu_item.pk)
+
+        assert response.status_code == 200
+        assert response.data["category_name"] == menu_item.category.name
+        assert len(response.data["ingredients"]) == 2
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_category_customizations(self, size, api_rf, django_assert_num_queries):
+        menu_item = build_menu(size)[0]
+        view = MenuItemViewSet.as_view({"get": "category_customizations"})
+
+        with django_assert_num_queries(5):
+            response = view(api_rf.get("/api/menu-items/"), slug=menu_item.slug)
+
+        assert response.status_code == 200
+        groups = response.data["category"]["customization_groups"]
+        assert len(groups) == 2
+        assert all(len(group["customizations"]) == 2 for group in groups)
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_category_customizations_cached(
+        self, size, api_rf, django_assert_num_queries
+    ):
+        menu_item = build_menu(size)[0]
+        view = MenuItemViewSet.as_view({"get": "category_customizations"})
+        view(api_rf.get("/api/menu-items/"), slug=menu_item.slug)
+
+        # A single item lookup; the tree comes from the cache.
+        with django_assert_num_queries(1):
+            response = view(api_rf.get("/api/menu-items/"), slug=menu_item.slug)
+
+        assert response.status_code == 200
+        assert len(response.data["category"]["customization_groups"]) == 2
+        expected = MenuItemIngredientSerializer(
+            menu_item.menu_item_ingredients.order_by("ingredient"), many=True
+        ).data
+        assert JSONRenderer().render(response.data["ingredients"]) == (
+            JSONRenderer().render(expected)
+        )
+
+
+@pytest.mark.django_db
+class TestCustomizationGroupViewSetQueryCounts:
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_list(self, size, api_rf, django_assert_num_queries):
+        build_menu(size)
+        view = CustomizationGroupViewSet.as_view({"get": "list"})
+
+        with django_assert_num_queries(3):
+            response = view(api_rf.get("/api/customization-groups/"))
+
+        assert response.status_code == 200
+        assert len(response.data) == size * 2
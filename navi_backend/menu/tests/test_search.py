@@ -0,0 +1,81 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.menu.api.views import MenuItemViewSet
+from navi_backend.menu.models import MenuItem
+
+from .factories import MenuItemFactory
+
+
+@pytest.fixture
+def menu_items(db):
+    return {
+        "latte": MenuItemFactory(
+            name="Vanilla Latte",
+            description="Espresso with steamed milk",
+            body="Sweet and creamy.",
+        ),
+        "espresso": MenuItemFactory(
+            name="Espresso",
+            description="A single shot",
+            body="Pairs well with vanilla biscotti.",
+        ),
+        "tea": MenuItemFactory(
+            name="Green Tea",
+            description="Loose leaf",
+            body="Light and grassy.",
+        ),
+    }
+
+
+@pytest.mark.django_db
+class TestMenuItemSearch:
+    def test_ranks_by_weighted_fields(self, menu_items):
+        results = list(MenuItem.objects.search("vanilla"))
+
+        # A name hit outranks a body hit.
+        assert results == [menu_items["latte"], menu_items["espresso"]]
+        assert results[0].rank > results[1].rank
+
+    def test_matches_stemmed_terms(self, menu_items):
+        assert list(MenuItem.objects.search("shots")) == [menu_items["espresso"]]
+
+    def test_trigram_fallback_for_typos(self, menu_items):
+        assert list(MenuItem.objects.search("expresso")) == [menu_items["espresso"]]
+
+    def test_no_match(self, menu_items):
+        assert not MenuItem.objects.search("hot chocolate").exists()
+
+    def test_uses_search_vector_index(self, menu_items):
+        with connection.cursor() as cursor:
+            # Tiny tables are cheaper to scan; make the planner show its hand.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = MenuItem.objects.search("vanilla").explain()
+
+        assert "menuitem_search_vector_idx" in plan
+
+
+@pytest.mark.django_db
+class TestMenuItemSearchAction:
+    def test_search_action(self, menu_items, django_assert_max_num_queries):
+        view = MenuItemViewSet.as_view({"get": "search"})
+        request = APIRequestFactory().get("/api/menu-items/search/", {"q": "vanilla"})
+
+        with django_assert_max_num_queries(3):
+            response = view(request)
+
+        assert response.status_code == 200
+        assert [item["slug"] for item in response.data] == [
+            menu_items["latte"].slug,
+            menu_items["espresso"].slug,
+        ]
+        assert "rank" in response.data[0]
+
+    def test_requires_query(self, db):
+        view = MenuItemViewSet.as_view({"get": "search"})
+
+        response = view(APIRequestFactory().get("/api/menu-items/search/"))
+
+        assert response.status_code == 400
@@ -0,0 +1,187 @@
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.menu.api.views import MenuItemViewSet
+from navi_backend.menu.models import MenuItem
+from navi_backend.menu.services import CategoryCustomizationService
+from navi_backend.menu.services import MenuSnapshotService
+from navi_backend.users.tests.factories import UserFactory
+
+from .factories import CategoryFactory
+from .factories import CustomizationFactory
+from .factories import CustomizationGroupFactory
+from .factories import MenuItemFactory
+from .factories import MenuItemIngredientFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestMenuSnapshotService:
+    def test_snapshot_covers_whole_menu(self):
+        category = CategoryFactory()
+        group = CustomizationGroupFactory(category=[category])
+        CustomizationFactory(group=group)
+        menu_item_ingredient = MenuItemIngredientFactory(
+            menu_item=MenuItemFactory(category=category)
+        )
+
+        snapshot = MenuSnapshotService.get_snapshot()
+
+        assert {c["slug"] for c in snapshot["categories"]} >= {category.slug}
+        category_data = next(
+            c for c in snapshot["categories"] if c["slug"] == category.slug
+        )
+        assert category_data["customization_groups"][0]["slug"] == group.slug
+        assert len(category_data["customization_groups"][0]["customizations"]) == 1
+        assert menu_item_ingredient.menu_item.slug in {
+            i["slug"] for i in snapshot["menu_items"]
+        }
+        assert menu_item_ingredient.ingredient.slug in {
+            i["slug"] for i in snapshot["ingredients"]
+        }
+
+    def test_cached_snapshot_skips_database(self, django_assert_num_queries):
+        MenuItemFactory.create_batch(3)
+        MenuSnapshotService.get_snapshot()
+
+        with django_assert_num_queries(0):
+            snapshot = MenuSnapshotService.get_snapshot()
+
+        assert len(snapshot["menu_items"]) == 3
+
+    @pytest.mark.parametrize("size", [1, 2])
+    def test_build_query_count_is_constant(self, size, django_assert_num_queries):
+        for _ in range(size):
+            group = CustomizationGroupFactory(category=[CategoryFactory()])
+            CustomizationFactory(group=group)
+            MenuItemIngredientFactory()
+
+        with django_assert_num_queries(7):
+            MenuSnapshotService.build_snapshot(1)
+
+    @pytest.mark.parametrize(
+        "factory_class",
+        [CategoryFactory, CustomizationFactory, MenuItemIngredientFactory],
+    )
+    def test_menu_writes_bump_version(
+        self, factory_class, django_capture_on_commit_callbacks
+    ):
+        version = MenuSnapshotService.get_version()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            factory_class()
+
+        assert MenuSnapshotService.get_version() > version
+
+    def test_delete_bumps_version(self, django_capture_on_commit_callbacks):
+        menu_item = MenuItemFactory()
+        version = MenuSnapshotService.get_version()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            menu_item.delete()
+
+        assert MenuSnapshotService.get_version() > version
+
+    def test_bump_replaces_stale_snapshot(self, django_capture_on_commit_callbacks):
+        menu_item = MenuItemFactory(name="Latte")
+        MenuSnapshotService.get_snapshot()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            menu_item.name = "Flat White"
+            menu_item.save()
+
+        names = [i["name"] for i in MenuSnapshotService.get_snapshot()["menu_items"]]
+        assert names == ["Flat White"]
+
+
+@pytest.mark.django_db
+class TestMenuItemListFromSnapshot:
+    def test_list_serves_snapshot(self, django_assert_num_queries):
+        MenuItemFactory(status=MenuItem.Status.ACTIVE)
+        MenuItemFactory(status=MenuItem.Status.DRAFT)
+        MenuSnapshotService.get_snapshot()
+        view = MenuItemViewSet.as_view({"get": "list"})
+
+        with django_assert_num_queries(0):
+            response = view(APIRequestFactory().get("/api/menu-items/"))
+        assert response.status_code == 200
+        assert len(response.data) == 2
+
+        response = view(APIRequestFactory().get("/api/menu-items/", {"status": "D"}))
+        assert [item["status"] for item in response.data] == ["D"]
+
+
+@pytest.mark.django_db
+class TestCategoryCustomizationService:
+    def test_cached_tree_skips_database(self, django_assert_num_queries):
+        category = CategoryFactory()
+        CustomizationFactory(group=CustomizationGroupFactory(category=[category]))
+        CategoryCustomizationService.get_tree(category.pk)
+
+        with django_assert_num_queries(0):
+            tree = CategoryCustomizationService.get_tree(category.pk)
+
+        assert len(tree["customization_groups"]) == 1
+
+    def test_customization_write_invalidates_tree(
+        self, django_capture_on_commit_callbacks
+    ):
+        category = CategoryFactory()
+        group = CustomizationGroupFactory(category=[category])
+        CategoryCustomizationService.get_tree(category.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            CustomizationFactory(group=group)
+
+        tree = CategoryCustomizationService.get_tree(category.pk)
+        assert len(tree["customization_groups"][0]["customizations"]) == 1
+
+    def test_group_membership_change_invalidates_tree(
+        self, django_capture_on_commit_callbacks
+    ):
+        category = CategoryFactory()
+        group = CustomizationGroupFactory()
+        CategoryCustomizationService.get_tree(category.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            group.category.add(category)
+
+        tree = CategoryCustomizationService.get_tree(category.pk)
+        assert [g["slug"] for g in tree["customization_groups"]] == [group.slug]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            group.delete()
+
+        assert (
+            CategoryCustomizationService.get_tree(category.pk)["customization_groups"]
+            == []
+        )
+
+    def test_staff_and_public_trees_are_cached_apart(self, user, monkeypatch):
+        category = CategoryFactory()
+        staff_request = SimpleNamespace(user=UserFactory(is_staff=True))
+        public_request = SimpleNamespace(user=user)
+        builds = []
+        build_tree = CategoryCustomizationService.build_tree
+
+        def recording_build_tree(category_id, request=None):
+            builds.append(request)
+            return build_tree(category_id, request)
+
+        monkeypatch.setattr(
+            CategoryCustomizationService, "build_tree", recording_build_tree
+        )
+        for request in (public_request, staff_request, public_request, None):
+            CategoryCustomizationService.get_tree(category.pk, request)
+        CategoryCustomizationService.get_tree(category.pk, staff_request)
+
+        assert builds == [public_request, staff_request]
@@ -46,4 +46,5 @@ class EmailTemplateSerializer(serializers.ModelSerializer):
             "subject",
             "body",
             "link",
+            "updated_at",
         ]
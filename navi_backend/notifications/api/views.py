@@ -1,6 +1,8 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAdminUser
 
+from navi_backend.core.api.mixins import StreamingExportMixin
+from navi_backend.core.pagination import SentAtCursorPagination
 from navi_backend.notifications.api.serializers import EmailLogSerializer
 from navi_backend.notifications.api.serializers import EmailTemplateSerializer
 from navi_backend.notifications.api.serializers import TextLogSerializer
@@ -10,16 +12,40 @@ from navi_backend.notifications.models import TextLog
 from navi_backend.orders.api.mixins import TrackUserMixin
 
 
-class EmailLogViewSet(TrackUserMixin, viewsets.ModelViewSet):
+class EmailLogViewSet(StreamingExportMixin, TrackUserMixin, viewsets.ModelViewSet):
     queryset = EmailLog.objects.all()
     serializer_class = EmailLogSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = SentAtCursorPagination
+    export_fields = (
+        "id",
+        "kind",
+        "reason",
+        "recipient",
+        "is_sent",
+        "error",
+        "meta",
+        "sent_at",
+    )
+    export_ordering = ("sent_at", "id")
 
 
-class TextLogViewSet(TrackUserMixin, viewsets.ModelViewSet):
+class TextLogViewSet(StreamingExportMixin, TrackUserMixin, viewsets.ModelViewSet):
     queryset = TextLog.objects.all()
     serializer_class = TextLogSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = SentAtCursorPagination
+    export_fields = (
+        "id",
+        "kind",
+        "reason",
+        "recipient",
+        "is_sent",
+        "error",
+        "meta",
+        "sent_at",
+    )
+    export_ordering = ("sent_at", "id")
 
 
 class EmailTemplateViewSet(TrackUserMixin, viewsets.ModelViewSet):
@@ -6,3 +6,6 @@ class NotificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "navi_backend.notifications"
     verbose_name = _("Notifications")
+
+    def ready(self):
+        import navi_backend.notifications.signals  # noqa: F401
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+
+from navi_backend.notifications.partitions import PARTITIONS_AHEAD
+from navi_backend.notifications.partitions import maintain_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "creates upcoming monthly notification log partitions and drops or "
+        "archives those past retention"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retain-months",
+            type=int,
+            default=settings.NOTIFICATION_LOG_RETENTION_MONTHS,
+            help="Number of whole months kept before the current one.",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=PARTITIONS_AHEAD,
+            help="Number of future months to create partitions for.",
+        )
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help="Detach expired partitions as archive_ tables instead of dropping.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the partitions that would change without touching them.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            created, retired = maintain_partitions(
+                connection,
+                options["retain_months"],
+                ahead=options["ahead"],
+                archive=options["archive"],
+                dry_run=options["dry_run"],
+            )
+
+        if options["verbosity"] > 1:
+            for name in created:
+                self.stdout.write(f"  created {name}")
+            for name in retired:
+                self.stdout.write(f"  retired {name}")
+
+        action = "archived" if options["archive"] else "dropped"
+        prefix = "Would have" if options["dry_run"] else "Have"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} created {len(created)} and {action} {len(retired)} "
+                "notification log partition(s)."
+            )
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_alter_emaillog_error_alter_emaillog_reason_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['sent_at', 'id'], name='emaillog_sent_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='textlog',
+            index=models.Index(fields=['sent_at', 'id'], name='textlog_sent_id_idx'),
+        ),
+    ]
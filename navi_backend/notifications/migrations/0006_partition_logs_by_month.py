@@ -0,0 +1,115 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:19
+
+from datetime import date
+
+from django.db import migrations, models
+from django.utils import timezone
+
+# The DDL below is a frozen copy of what navi_backend.notifications.partitions
+# did when this migration was written, so later edits there cannot change it.
+LOG_TABLES = {
+    "notifications_emaillog": "emaillog_sent_id_idx",
+    "notifications_textlog": "textlog_sent_id_idx",
+}
+PARTITIONS_AHEAD = 3
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    years, month_index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, month_index + 1, 1)
+
+
+def create_partition(cursor, qn, table, month):
+    name = f"{table}_p{month:%Y_%m}"
+    start = f"'{month:%Y-%m-%d} 00:00:00+00'"
+    end = f"'{add_months(month, 1):%Y-%m-%d} 00:00:00+00'"
+    cursor.execute(
+        f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} "
+        f"FOR VALUES FROM ({start}) TO ({end})"
+    )
+
+
+def partition_table(connection, table, index_name):
+    qn = connection.ops.quote_name
+    old = f"{table}_unpartitioned"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(old)} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (sent_at)"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(f'{table}_default')} PARTITION OF {qn(table)} DEFAULT"
+        )
+        cursor.execute(f"SELECT min(sent_at) FROM {qn(old)}")  # noqa: S608
+        oldest = cursor.fetchone()[0]
+
+        current = month_start(timezone.now())
+        month = min(month_start(oldest), current) if oldest else current
+        while month <= add_months(current, PARTITIONS_AHEAD):
+            create_partition(cursor, qn, table, month)
+            month = add_months(month, 1)
+
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")  # noqa: S608
+        # Dropping the old table frees its constraint and index names.
+        cursor.execute(f"DROP TABLE {qn(old)}")
+        cursor.execute(f"ALTER TABLE {qn(table)} ADD PRIMARY KEY (id, sent_at)")
+        cursor.execute(f"CREATE INDEX {qn(index_name)} ON {qn(table)} (sent_at, id)")
+
+
+def unpartition_table(connection, table, index_name):
+    qn = connection.ops.quote_name
+    partitioned = f"{table}_partitioned"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(partitioned)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(partitioned)} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(partitioned)}")  # noqa: S608
+        cursor.execute(f"DROP TABLE {qn(partitioned)}")
+        cursor.execute(f"ALTER TABLE {qn(table)} ADD PRIMARY KEY (id)")
+        cursor.execute(f"CREATE INDEX {qn(index_name)} ON {qn(table)} (sent_at, id)")
+
+
+def partition_logs(apps, schema_editor):
+    for table, index_name in LOG_TABLES.items():
+        partition_table(schema_editor.connection, table, index_name)
+
+
+def unpartition_logs(apps, schema_editor):
+    for table, index_name in LOG_TABLES.items():
+        unpartition_table(schema_editor.connection, table, index_name)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0005_emaillog_notifications_emaillog_sent_id_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_logs, unpartition_logs),
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(
+                fields=["recipient", "sent_at"], name="emaillog_recipient_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(fields=["reason", "sent_at"], name="emaillog_reason_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="textlog",
+            index=models.Index(
+                fields=["recipient", "sent_at"], name="textlog_recipient_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="textlog",
+            index=models.Index(fields=["reason", "sent_at"], name="textlog_reason_idx"),
+        ),
+    ]
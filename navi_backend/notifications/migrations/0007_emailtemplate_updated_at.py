@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0006_partition_logs_by_month"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailtemplate",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:51
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0007_emailtemplate_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emaillog",
+            name="sent_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name="textlog",
+            name="sent_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
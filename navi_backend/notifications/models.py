@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from navi_backend.core.models import UUIDModel
 
@@ -10,7 +11,8 @@ class NotificationKind(models.TextChoices):
 
 class NotificationLog(UUIDModel):
     reason = models.CharField(max_length=50, blank=True)
-    sent_at = models.DateTimeField(auto_now_add=True)
+    # Set by the sender, not on insert: logs can be saved in batches later.
+    sent_at = models.DateTimeField(default=timezone.now)
     error = models.TextField(blank=True)
     meta = models.JSONField(null=True, blank=True)
     is_sent = models.BooleanField(null=True, blank=True)
@@ -23,6 +25,18 @@ class NotificationLog(UUIDModel):
 
     class Meta:
         abstract = True
+        # The tables are partitioned by month on sent_at; see partitions.py.
+        indexes = [
+            models.Index(fields=["sent_at", "id"], name="%(class)s_sent_id_idx"),
+            models.Index(
+                fields=["recipient", "sent_at"],
+                name="%(class)s_recipient_idx",
+            ),
+            models.Index(
+                fields=["reason", "sent_at"],
+                name="%(class)s_reason_idx",
+            ),
+        ]
 
 
 class EmailLog(NotificationLog):
@@ -43,6 +57,8 @@ class EmailTemplate(UUIDModel):
     subject = models.CharField(max_length=255)
     body = models.TextField()
     link = models.URLField()
+    # Part of the compiled-template cache key, so edits take effect at once.
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.subject
@@ -0,0 +1,150 @@
+"""
+Monthly range partitions on ``sent_at`` for the notification log tables.
+
+Each table is partitioned into ``<table>_pYYYY_MM`` children plus a
+``<table>_default`` catch-all for rows outside every month that exists.
+Postgres requires the partition key in the primary key, so the tables'
+primary key is ``(id, sent_at)`` although Django only knows about ``id``.
+"""
+
+import re
+from datetime import date
+
+from django.utils import timezone
+
+LOG_TABLES = ("notifications_emaillog", "notifications_textlog")
+PARTITION_NAME = "{table}_p{month:%Y_%m}"
+PARTITION_MONTH = re.compile(r"_p(\d{4})_(\d{2})$")
+DEFAULT_PARTITION = "{table}_default"
+ARCHIVE_NAME = "archive_{name}"
+PARTITIONS_AHEAD = 3
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    years, month_index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, month_index + 1, 1)
+
+
+def month_bounds(month):
+    # Partition bounds are compared with timestamptz, so pin them to UTC.
+    return (
+        f"'{month:%Y-%m-%d} 00:00:00+00'",
+        f"'{add_months(month, 1):%Y-%m-%d} 00:00:00+00'",
+    )
+
+
+def list_partitions(connection, table):
+    """
+    Returns ``{month: partition_name}`` for the monthly partitions of ``table``.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = PARTITION_MONTH.search(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def create_partition(connection, table, month):
+    """
+    Creates the partition of ``table`` for ``month`` unless it exists. Rows
+    that already landed in the default partition for that month are moved
+    into it. Returns True if a partition was created.
+    """
+    name = PARTITION_NAME.format(table=table, month=month)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        qn = connection.ops.quote_name
+        start, end = month_bounds(month)
+        cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(table)} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION.format(table=table))} "  # noqa: S608
+            f"WHERE sent_at >= {start} AND sent_at < {end} RETURNING *) "
+            f"INSERT INTO {qn(name)} SELECT * FROM moved"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+    return True
+
+
+def retire_partition(connection, table, name, *, archive=False):
+    """
+    Drops a partition, or detaches it and keeps it as a standalone
+    ``archive_`` table. Either way no rows are scanned or deleted one by one.
+    """
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if archive:
+            cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+            cursor.execute(
+                f"ALTER TABLE {qn(name)} RENAME TO {qn(ARCHIVE_NAME.format(name=name))}"
+            )
+        else:
+            cursor.execute(f"DROP TABLE {qn(name)}")
+
+
+def maintain_partitions(
+    connection,
+    retain_months,
+    *,
+    ahead=PARTITIONS_AHEAD,
+    archive=False,
+    dry_run=False,
+):
+    """
+    Creates partitions up to ``ahead`` months past the current one and
+    retires those older than ``retain_months`` before it. Returns
+    ``(created, retired)`` lists of partition names.
+    """
+    current = month_start(timezone.now())
+    cutoff = add_months(current, -retain_months)
+    created, retired = [], []
+
+    for table in LOG_TABLES:
+        existing = list_partitions(connection, table)
+        for offset in range(ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            if dry_run or create_partition(connection, table, month):
+                created.append(PARTITION_NAME.format(table=table, month=month))
+
+        for month, name in sorted(existing.items()):
+            if month >= cutoff:
+                continue
+            if not dry_run:
+                retire_partition(connection, table, name, archive=archive)
+            retired.append(name)
+
+        if not dry_run:
+            # Only rows written while a month had no partition live here.
+            qn = connection.ops.quote_name
+            start, _ = month_bounds(cutoff)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {qn(DEFAULT_PARTITION.format(table=table))} "  # noqa: S608
+                    f"WHERE sent_at < {start}"
+                )
+    return created, retired
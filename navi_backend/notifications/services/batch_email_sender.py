@@ -0,0 +1,102 @@
+import logging
+from contextlib import suppress
+from smtplib import SMTPServerDisconnected
+
+from django.core.mail import get_connection
+from django.utils import timezone
+
+from navi_backend.notifications.models import EmailLog
+
+logger = logging.getLogger(__name__)
+
+BATCH_EMAIL_LOG_CHUNK_SIZE = 50
+
+
+class BatchEmailSender:
+    """
+    Sends queued EmailNotificationServices over one SMTP connection and logs
+    them with one insert per BATCH_EMAIL_LOG_CHUNK_SIZE messages. Each
+    notification's ``is_sent`` and ``error`` are set as with
+    ``EmailNotificationService.send``.
+
+    Logs skip the process-wide log buffer and are saved as each chunk is
+    sent: if the worker dies mid-batch, delivered messages are already
+    logged, so a retry can tell who got the email.
+    """
+
+    def __init__(self, notifications=(), connection=None):
+        self.queue = list(notifications)
+        self.connection = connection
+
+    def add(self, notification):
+        self.queue.append(notification)
+
+    def send(self):
+        """
+        Drains the queue and returns one success flag per notification, in
+        the order they were queued. If the connection cannot be opened every
+        notification is logged as failed.
+        """
+        notifications, self.queue = self.queue, []
+        if not notifications:
+            return []
+
+        connection = self.connection or get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            logger.exception(
+                "Could not connect to send %s queued email(s)", len(notifications)
+            )
+            failed_at = timezone.now()
+            for notification in notifications:
+                notification.error = str(e)
+                notification.is_sent = False
+                notification.sent_at = failed_at
+            self.write_logs(notifications)
+            return [False] * len(notifications)
+
+        attempted = logged = 0
+        try:
+            for notification in notifications:
+                self.send_one(notification, connection)
+                attempted += 1
+                if attempted - logged >= BATCH_EMAIL_LOG_CHUNK_SIZE:
+                    self.write_logs(notifications[logged:attempted])
+                    logged = attempted
+        finally:
+            connection.close()
+            self.write_logs(notifications[logged:attempted])
+
+        sent = sum(notification.is_sent for notification in notifications)
+        logger.info("Sent %s of %s queued email(s)", sent, len(notifications))
+        return [notification.is_sent for notification in notifications]
+
+    def write_logs(self, notifications):
+        if notifications:
+            EmailLog.objects.bulk_create(
+                [notification.build_log() for notification in notifications]
+            )
+
+    def send_one(self, notification, connection):
+        try:
+            notification._validate()  # noqa: SLF001
+            # send_messages reports failures for the whole list, so messages go
+            # one at a time, still reusing the open connection.
+            if not connection.send_messages([notification.build_message()]):
+                msg = "Message was not accepted for delivery"
+                raise ValueError(msg)
+            notification.is_sent = True
+        except Exception as e:
+            logger.exception(
+                "Failed to send email notification to %s", notification.recipient
+            )
+            notification.error = str(e)
+            notification.is_sent = False
+            if isinstance(e, SMTPServerDisconnected):
+                # Reconnect so one dropped session does not fail the rest.
+                connection.close()
+                with suppress(OSError):
+                    connection.open()
+        finally:
+            notification.sent_at = timezone.now()
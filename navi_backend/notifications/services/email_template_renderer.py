@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.template import Context
+from django.template import engines
+
+EMAIL_TEMPLATE_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    subject: object
+    body: object
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    body: str
+
+
+class EmailTemplateRenderer:
+    _compiled = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_compiled(email_template):
+        """
+        Returns the compiled subject and body of ``email_template``, parsing
+        them only the first time a given (id, updated_at) is seen in this
+        process. Saving the template changes updated_at, so edits are never
+        served stale.
+        """
+        key = (email_template.pk, email_template.updated_at)
+        cache = EmailTemplateRenderer._compiled
+        with EmailTemplateRenderer._lock:
+            compiled = cache.get(key)
+            if compiled is not None:
+                cache.move_to_end(key)
+                return compiled
+
+        engine = engines["django"].engine
+        compiled = CompiledEmailTemplate(
+            subject=engine.from_string(email_template.subject),
+            body=engine.from_string(email_template.body),
+        )
+        with EmailTemplateRenderer._lock:
+            for stale in [k for k in cache if k[0] == email_template.pk]:
+                del cache[stale]
+            cache[key] = compiled
+            while len(cache) > EMAIL_TEMPLATE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def render(email_template, context=None):
+        return EmailTemplateRenderer.render_many(email_template, [context or {}])[0]
+
+    @staticmethod
+    def render_many(email_template, contexts):
+        """
+        Renders ``email_template`` once per context with a single compiled
+        template. ``link`` is available to every context unless overridden.
+        """
+        compiled = EmailTemplateRenderer.get_compiled(email_template)
+        rendered = []
+        for context in contexts:
+            values = {"link": email_template.link, **context}
+            # Subjects are a plain-text header: no escaping, one line.
+            subject = compiled.subject.render(Context(values, autoescape=False))
+            rendered.append(
+                RenderedEmail(
+                    subject=" ".join(subject.split()),
+                    body=compiled.body.render(Context(values)),
+                )
+            )
+        return rendered
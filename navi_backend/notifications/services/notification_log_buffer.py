@@ -0,0 +1,101 @@
+import logging
+import threading
+from functools import cache
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db import connections
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationLogBuffer:
+    """
+    Collects unsaved EmailLog/TextLog rows for the current process and saves
+    them with one bulk_create per model once NOTIFICATION_LOG_BUFFER_SIZE
+    rows are waiting or the oldest has waited NOTIFICATION_LOG_FLUSH_INTERVAL
+    seconds. Worker shutdown flushes whatever is left.
+
+    Rows still waiting are lost if the process is killed outright (SIGKILL,
+    the OOM killer, a hard time limit), since no shutdown hook runs; the
+    size and interval bound how many. Each row carries its own ``sent_at``,
+    so a late flush does not move it to another time or partition.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def add(self, record):
+        with self.lock:
+            self.records.append(record)
+            full = len(self.records) >= settings.NOTIFICATION_LOG_BUFFER_SIZE
+            if not full and self.timer is None:
+                self.timer = threading.Timer(
+                    settings.NOTIFICATION_LOG_FLUSH_INTERVAL, self.flush_from_timer
+                )
+                self.timer.daemon = True
+                self.timer.start()
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Saves every buffered row and returns how many were written.
+        """
+        with self.lock:
+            records, self.records = self.records, []
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        by_model = {}
+        for record in records:
+            by_model.setdefault(type(record), []).append(record)
+
+        written = 0
+        for model, rows in by_model.items():
+            try:
+                with transaction.atomic():
+                    written += len(model.objects.bulk_create(rows))
+            except DatabaseError:
+                logger.warning(
+                    "Bulk insert of %s %s row(s) failed, saving them one by one",
+                    len(rows),
+                    model.__name__,
+                    exc_info=True,
+                )
+                written += self.save_each(rows)
+        return written
+
+    def save_each(self, rows):
+        """
+        Saves ``rows`` one at a time so a bad row only loses itself. Returns
+        how many were written.
+        """
+        written = 0
+        for row in rows:
+            try:
+                with transaction.atomic():
+                    row.save(force_insert=True)
+            except DatabaseError:
+                logger.exception(
+                    "Dropped buffered %s row for %s", type(row).__name__, row.recipient
+                )
+            else:
+                written += 1
+        return written
+
+    def flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread has its own connection; do not leave it open.
+            connections.close_all()
+
+
+@cache
+def get_log_buffer():
+    return NotificationLogBuffer()
@@ -1,16 +1,21 @@
 import logging
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
+from email.mime.application import MIMEApplication
+from pathlib import Path
 
 from django.conf import settings
 from django.core.mail import EmailMessage
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
+from django.utils import timezone
 
 from navi_backend.notifications.models import EmailLog
 from navi_backend.notifications.models import NotificationKind
 from navi_backend.notifications.models import TextLog
+from navi_backend.notifications.services.notification_log_buffer import get_log_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +23,27 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PDFAttachment:
     filename: str
-    pdf_bytes: bytes
+    path: Path
+    refetch: Callable[[], Path] | None = None
+
+    def to_mime(self):
+        """
+        Builds the MIME part from the cached file. The email library needs the
+        whole encoded payload, so the PDF is read in one go here; only the
+        download into the cache is streamed. If the file was evicted from the
+        cache meanwhile, ``refetch`` provides it again.
+        """
+        try:
+            pdf_bytes = Path(self.path).read_bytes()
+        except FileNotFoundError:
+            if self.refetch is None:
+                raise
+            logger.info("%s left the PDF cache, fetching it again", self.path)
+            self.path = self.refetch()
+            pdf_bytes = Path(self.path).read_bytes()
+        part = MIMEApplication(pdf_bytes, "pdf")
+        part.add_header("Content-Disposition", "attachment", filename=self.filename)
+        return part
 
 
 class NotificationService(ABC):
@@ -29,6 +54,7 @@ class NotificationService(ABC):
         self.reason = reason
         self.is_sent = False
         self.error = ""
+        self.sent_at = None
 
     def send(self):
         try:
@@ -42,6 +68,7 @@ class NotificationService(ABC):
             self.error = str(e)
             self.is_sent = False
         finally:
+            self.sent_at = timezone.now()
             self._log()
         return self.is_sent
 
@@ -72,6 +99,7 @@ class EmailNotificationService(NotificationService):
         from_email=None,
         reply_to=None,
         attachment=None,
+        html_body=None,
         **kwargs,
     ):
         super().__init__(recipient, **kwargs)
@@ -82,9 +110,13 @@ class EmailNotificationService(NotificationService):
         self.from_email = from_email or getattr(settings, "DEFAULT_FROM_EMAIL", None)
         self.reply_to = reply_to
         self.attachment = attachment
+        self.html_body = html_body
 
     def _deliver(self):
-        html_content = None
+        self.build_message().send(fail_silently=False)
+
+    def build_message(self):
+        html_content = self.html_body
         if self.template:
             html_content = render_to_string(self.template, self.context)
 
@@ -94,13 +126,9 @@ class EmailNotificationService(NotificationService):
             email.content_subtype = "html"
 
         if self.attachment:
-            email.attach(
-                self.attachment.filename,
-                self.attachment.pdf_bytes,
-                "application/pdf",
-            )
+            email.attach(self.attachment.to_mime())
 
-        email.send(fail_silently=False)
+        return email
 
     def create_email_object(self, has_attachment, html_content):
         if has_attachment:
@@ -130,15 +158,19 @@ class EmailNotificationService(NotificationService):
         return email
 
     def _log(self):
+        get_log_buffer().add(self.build_log())
+
+    def build_log(self):
         recipient_email = (
             self.recipient[0] if isinstance(self.recipient, list) else self.recipient
         )
-        EmailLog.objects.create(
+        return EmailLog(
             recipient=recipient_email or "",
             reason=self.reason,
             error=self.error,
             is_sent=self.is_sent,
             kind=self.kind,
+            sent_at=self.sent_at or timezone.now(),
             meta={
                 "subject": self.subject,
                 "template": self.template,
@@ -157,12 +189,16 @@ class SMSNotificationService(NotificationService):
         pass
 
     def _log(self):
-        TextLog.objects.create(
+        get_log_buffer().add(self.build_log())
+
+    def build_log(self):
+        return TextLog(
             recipient=self.recipient or 0,
             reason=self.reason,
             error=self.error,
             is_sent=self.is_sent,
             kind=self.kind,
+            sent_at=self.sent_at or timezone.now(),
             meta={
                 "message": self.message,
             },
@@ -0,0 +1,16 @@
+import atexit
+
+from celery.signals import worker_process_shutdown
+from celery.signals import worker_shutdown
+
+from navi_backend.notifications.services.notification_log_buffer import get_log_buffer
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def flush_notification_logs(**kwargs):
+    get_log_buffer().flush()
+
+
+# Web and management command processes have no worker signals.
+atexit.register(flush_notification_logs)
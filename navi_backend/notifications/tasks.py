@@ -1,8 +1,18 @@
 import logging
 
 from celery import shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db import transaction
 
+from navi_backend.core.helpers.pdf_cache import fetch_pdf
+from navi_backend.notifications.models import EmailTemplate
+from navi_backend.notifications.partitions import maintain_partitions
+from navi_backend.notifications.services.batch_email_sender import BatchEmailSender
+from navi_backend.notifications.services.email_template_renderer import (
+    EmailTemplateRenderer,
+)
 from navi_backend.notifications.services.notification_strategy import (
     EmailNotificationService,
 )
@@ -53,17 +63,86 @@ def send_invoice_email(self, user_id, invoice_id):
         logger.warning("Invoice with id of %s, does not exist", invoice_id)
         return
 
+    build_invoice_notification(user.email, invoice).send()
+
+
+@shared_task
+def send_invoice_emails(invoice_ids):
+    """
+    Sends the invoice emails for ``invoice_ids`` over one SMTP connection,
+    for backlogs that would otherwise open a connection per invoice.
+    """
+    invoices = Invoice.objects.select_related("order__user").filter(pk__in=invoice_ids)
+    sender = BatchEmailSender()
+    for invoice in invoices:
+        email = invoice.order.user.email
+        if not email:
+            logger.warning("User %s has no email address", invoice.order.user_id)
+            continue
+        sender.add(build_invoice_notification(email, invoice))
+    return sender.send()
+
+
+@shared_task
+def send_email_campaign(email_template_id, recipients):
+    """
+    Sends an EmailTemplate to ``recipients``, a list of
+    ``{"email": ..., "context": {...}}``. The template is compiled once and
+    every message goes out over one SMTP connection.
+    """
+    try:
+        email_template = EmailTemplate.objects.get(pk=email_template_id)
+    except EmailTemplate.DoesNotExist:
+        logger.warning("Email template %s does not exist", email_template_id)
+        return []
+
+    rendered = EmailTemplateRenderer.render_many(
+        email_template, [recipient.get("context", {}) for recipient in recipients]
+    )
+    sender = BatchEmailSender(
+        EmailNotificationService(
+            recipient=recipient["email"],
+            subject=message.subject,
+            html_body=message.body,
+            reason="campaign",
+        )
+        for recipient, message in zip(recipients, rendered, strict=True)
+    )
+    return sender.send()
+
+
+def build_invoice_notification(email, invoice):
     attachment = None
     if invoice.pdf:
+        path, content_hash = fetch_pdf(invoice.id, invoice.pdf_sha256, invoice.pdf)
+        if content_hash != invoice.pdf_sha256:
+            # Invoices rendered before hashes were stored always missed the
+            # cache; record the hash so the next send can hit it.
+            Invoice.objects.filter(pk=invoice.pk).update(pdf_sha256=content_hash)
+            invoice.pdf_sha256 = content_hash
         attachment = PDFAttachment(
             filename=f"invoice-{invoice.format_reference_number()}.pdf",
-            pdf_bytes=invoice.pdf.read(),
+            path=path,
+            refetch=lambda: fetch_pdf(invoice.id, content_hash, invoice.pdf)[0],
         )
 
-    notification = EmailNotificationService(
-        recipient=user.email,
+    return EmailNotificationService(
+        recipient=email,
         subject=f"Navi order confirmation #{invoice.reference_number}",
         reason="order_invoice",
         attachment=attachment,
     )
-    notification.send()
+
+
+@shared_task
+def prune_notification_logs():
+    with transaction.atomic():
+        created, retired = maintain_partitions(
+            connection, settings.NOTIFICATION_LOG_RETENTION_MONTHS
+        )
+    logger.info(
+        "Created %s and dropped %s notification log partition(s)",
+        len(created),
+        len(retired),
+    )
+    return retired
@@ -0,0 +1,109 @@
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from navi_backend.notifications.models import EmailLog
+from navi_backend.notifications.services import batch_email_sender
+from navi_backend.notifications.services.batch_email_sender import BatchEmailSender
+from navi_backend.notifications.services.notification_strategy import (
+    EmailNotificationService,
+)
+
+
+class CountingBackend(EmailBackend):
+    opened = 0
+    rejected = "bounce@example.com"
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        if any(self.rejected in message.to for message in messages):
+            msg = "Recipient refused"
+            raise OSError(msg)
+        return super().send_messages(messages)
+
+
+@pytest.fixture
+def backend():
+    CountingBackend.opened = 0
+    return CountingBackend()
+
+
+def notification(recipient):
+    return EmailNotificationService(
+        recipient=recipient, subject="Hello", body="Hi", reason="promo"
+    )
+
+
+@pytest.mark.django_db
+class TestBatchEmailSender:
+    def test_sends_over_one_connection(self, backend, django_assert_num_queries):
+        sender = BatchEmailSender(connection=backend)
+        for i in range(3):
+            sender.add(notification(f"user{i}@example.com"))
+
+        with django_assert_num_queries(1):
+            results = sender.send()
+
+        assert results == [True, True, True]
+        assert CountingBackend.opened == 1
+        assert len(mail.outbox) == 3
+        assert EmailLog.objects.filter(is_sent=True, reason="promo").count() == 3
+        assert sender.queue == []
+
+    def test_reports_each_failure(self, backend):
+        notifications = [
+            notification("a@example.com"),
+            notification(CountingBackend.rejected),
+            notification(""),
+            notification("b@example.com"),
+        ]
+
+        results = BatchEmailSender(notifications, connection=backend).send()
+
+        assert results == [True, False, False, True]
+        assert notifications[1].error == "Recipient refused"
+        assert notifications[2].error == "Missing recipient"
+        assert [m.to for m in mail.outbox] == [["a@example.com"], ["b@example.com"]]
+        assert EmailLog.objects.filter(is_sent=False).count() == 2
+
+    def test_empty_queue_sends_nothing(self):
+        assert BatchEmailSender().send() == []
+        assert not EmailLog.objects.exists()
+
+    def test_logs_are_saved_as_chunks_are_sent(self, backend, monkeypatch):
+        monkeypatch.setattr(batch_email_sender, "BATCH_EMAIL_LOG_CHUNK_SIZE", 2)
+        logged_before_send = []
+        send_messages = backend.send_messages
+
+        def counting_send(messages):
+            logged_before_send.append(EmailLog.objects.count())
+            return send_messages(messages)
+
+        monkeypatch.setattr(backend, "send_messages", counting_send)
+        notifications = [notification(f"user{i}@example.com") for i in range(5)]
+
+        BatchEmailSender(notifications, connection=backend).send()
+
+        assert logged_before_send == [0, 0, 2, 2, 4]
+        assert EmailLog.objects.filter(is_sent=True).count() == 5
+
+    def test_connection_failure_logs_every_notification(self, backend, monkeypatch):
+        def refuse():
+            msg = "Connection refused"
+            raise ConnectionRefusedError(msg)
+
+        monkeypatch.setattr(backend, "open", refuse)
+        notifications = [notification("a@example.com"), notification("b@example.com")]
+
+        results = BatchEmailSender(notifications, connection=backend).send()
+
+        assert results == [False, False]
+        assert mail.outbox == []
+        assert [n.error for n in notifications] == ["Connection refused"] * 2
+        assert list(EmailLog.objects.values_list("recipient", "is_sent", "error")) == [
+            ("a@example.com", False, "Connection refused"),
+            ("b@example.com", False, "Connection refused"),
+        ]
@@ -0,0 +1,90 @@
+import pytest
+from django.core import mail
+from django.template import Engine
+
+from navi_backend.notifications.models import EmailLog
+from navi_backend.notifications.models import EmailTemplate
+from navi_backend.notifications.services.email_template_renderer import (
+    EmailTemplateRenderer,
+)
+from navi_backend.notifications.tasks import send_email_campaign
+
+
+@pytest.fixture(autouse=True)
+def _clear_compiled():
+    EmailTemplateRenderer._compiled.clear()  # noqa: SLF001
+    yield
+    EmailTemplateRenderer._compiled.clear()  # noqa: SLF001
+
+
+@pytest.fixture
+def email_template(db):
+    return EmailTemplate.objects.create(
+        subject="Hi {{ name }} & welcome",
+        body="<p>Hello {{ name }}</p><a href='{{ link }}'>Menu</a>",
+        link="https://navi.example.com/menu",
+    )
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    from_string = Engine.from_string
+
+    def counting_from_string(self, template_code):
+        calls.append(template_code)
+        return from_string(self, template_code)
+
+    monkeypatch.setattr(Engine, "from_string", counting_from_string)
+    return calls
+
+
+class TestEmailTemplateRenderer:
+    def test_render_many_compiles_once(self, email_template, parses):
+        contexts = [{"name": f"user{i}"} for i in range(50)]
+
+        rendered = EmailTemplateRenderer.render_many(email_template, contexts)
+        EmailTemplateRenderer.render(email_template, {"name": "again"})
+
+        assert len(parses) == 2
+        assert rendered[3].subject == "Hi user3 & welcome"
+        assert rendered[3].body == (
+            "<p>Hello user3</p><a href='https://navi.example.com/menu'>Menu</a>"
+        )
+
+    def test_body_is_escaped(self, email_template):
+        rendered = EmailTemplateRenderer.render(email_template, {"name": "<b>x</b>"})
+
+        assert rendered.subject == "Hi <b>x</b> & welcome"
+        assert "&lt;b&gt;x&lt;/b&gt;" in rendered.body
+
+    def test_edit_recompiles(self, email_template, parses):
+        EmailTemplateRenderer.render(email_template, {"name": "a"})
+        email_template.subject = "Bye {{ name }}"
+        email_template.save()
+
+        assert EmailTemplateRenderer.render(email_template, {"name": "a"}).subject == (
+            "Bye a"
+        )
+        assert len(parses) == 4
+        assert len(EmailTemplateRenderer._compiled) == 1  # noqa: SLF001
+
+
+def test_send_email_campaign(email_template):
+    results = send_email_campaign(
+        email_template.pk,
+        [
+            {"email": "a@example.com", "context": {"name": "Ada"}},
+            {"email": "b@example.com", "context": {"name": "Bo"}},
+        ],
+    )
+
+    assert results == [True, True]
+    assert [m.content_subtype for m in mail.outbox] == ["html", "html"]
+    assert mail.outbox[0].message().get_content_type() == "text/html"
+    assert mail.outbox[0].body.startswith("<p>Hello Ada</p>")
+    assert [m.subject for m in mail.outbox] == [
+        "Hi Ada & welcome",
+        "Hi Bo & welcome",
+    ]
+    assert EmailLog.objects.filter(reason="campaign", is_sent=True).count() == 2
@@ -0,0 +1,125 @@
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from navi_backend.notifications.models import EmailLog
+from navi_backend.notifications.models import NotificationKind
+from navi_backend.notifications.models import TextLog
+from navi_backend.notifications.services.notification_log_buffer import (
+    NotificationLogBuffer,
+)
+from navi_backend.notifications.services.notification_strategy import (
+    SMSNotificationService,
+)
+from navi_backend.notifications.signals import flush_notification_logs
+
+
+def email_log(i):
+    return EmailLog(recipient=f"user{i}@example.com", kind=NotificationKind.EMAIL)
+
+
+@pytest.fixture
+def log_buffer(settings):
+    settings.NOTIFICATION_LOG_BUFFER_SIZE = 3
+    settings.NOTIFICATION_LOG_FLUSH_INTERVAL = 60
+    log_buffer = NotificationLogBuffer()
+    yield log_buffer
+    if log_buffer.timer is not None:
+        log_buffer.timer.cancel()
+
+
+@pytest.mark.django_db
+class TestNotificationLogBuffer:
+    def test_flushes_when_full(self, log_buffer, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            log_buffer.add(email_log(1))
+            log_buffer.add(email_log(2))
+        assert log_buffer.timer is not None
+
+        # One INSERT, inside a savepoint.
+        with django_assert_num_queries(3):
+            log_buffer.add(email_log(3))
+
+        assert EmailLog.objects.count() == 3
+        assert log_buffer.records == []
+        assert log_buffer.timer is None
+
+    def test_flush_groups_rows_by_model(self, log_buffer, django_assert_num_queries):
+        log_buffer.add(email_log(1))
+        log_buffer.add(TextLog(recipient=5550100, kind=NotificationKind.SMS))
+
+        with django_assert_num_queries(6):
+            assert log_buffer.flush() == 2
+
+        assert EmailLog.objects.count() == 1
+        assert TextLog.objects.count() == 1
+
+    def test_shutdown_flushes_the_process_buffer(self, settings, monkeypatch):
+        settings.NOTIFICATION_LOG_BUFFER_SIZE = 100
+        settings.NOTIFICATION_LOG_FLUSH_INTERVAL = 60
+        log_buffer = NotificationLogBuffer()
+        monkeypatch.setattr(
+            "navi_backend.notifications.signals.get_log_buffer", lambda: log_buffer
+        )
+        monkeypatch.setattr(
+            "navi_backend.notifications.services.notification_strategy.get_log_buffer",
+            lambda: log_buffer,
+        )
+
+        notification = SMSNotificationService(5550100, "Your order is ready")
+        notification.send()
+        assert not TextLog.objects.exists()
+
+        flush_notification_logs()
+        log = TextLog.objects.get()
+        assert log.meta == {"message": "Your order is ready"}
+        assert log.sent_at == notification.sent_at
+        assert log_buffer.timer is None
+
+
+# The base settings' buffer size; config.settings.test saves every row at once.
+default_buffer_settings = override_settings(
+    NOTIFICATION_LOG_BUFFER_SIZE=100, NOTIFICATION_LOG_FLUSH_INTERVAL=0.1
+)
+
+
+class TestNotificationLogBufferDefaults:
+    @pytest.mark.django_db(transaction=True)
+    @default_buffer_settings
+    def test_timer_flushes_waiting_rows(self):
+        log_buffer = NotificationLogBuffer()
+        log_buffer.add(email_log(1))
+        log_buffer.add(TextLog(recipient=5550100, kind=NotificationKind.SMS))
+        timer = log_buffer.timer
+        assert not EmailLog.objects.exists()
+
+        timer.join(timeout=5)
+
+        assert EmailLog.objects.count() == 1
+        assert TextLog.objects.count() == 1
+        assert log_buffer.records == []
+        assert log_buffer.timer is None
+
+    @pytest.mark.django_db
+    @default_buffer_settings
+    def test_bad_row_does_not_lose_the_batch(self):
+        log_buffer = NotificationLogBuffer()
+        sent_at = timezone.now() - timezone.timedelta(minutes=5)
+        good = [
+            TextLog(recipient=5550100 + i, kind=NotificationKind.SMS, sent_at=sent_at)
+            for i in range(3)
+        ]
+        # Out of range for the integer column.
+        bad = TextLog(recipient=10**12, kind=NotificationKind.SMS)
+        for row in [good[0], bad, *good[1:]]:
+            log_buffer.add(row)
+        log_buffer.timer.cancel()
+
+        assert log_buffer.flush() == 3
+
+        assert sorted(TextLog.objects.values_list("recipient", flat=True)) == [
+            5550100,
+            5550101,
+            5550102,
+        ]
+        assert set(TextLog.objects.values_list("sent_at", flat=True)) == {sent_at}
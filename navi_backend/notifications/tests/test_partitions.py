@@ -0,0 +1,97 @@
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from navi_backend.notifications.models import EmailLog
+from navi_backend.notifications.models import NotificationKind
+from navi_backend.notifications.partitions import add_months
+from navi_backend.notifications.partitions import create_partition
+from navi_backend.notifications.partitions import list_partitions
+from navi_backend.notifications.partitions import maintain_partitions
+from navi_backend.notifications.partitions import month_start
+
+TABLE = "notifications_emaillog"
+OLD_MONTH = date(2020, 1, 1)
+
+
+def log_sent_at(sent_at):
+    log = EmailLog.objects.create(
+        recipient="a@example.com", kind=NotificationKind.EMAIL
+    )
+    EmailLog.objects.filter(pk=log.pk).update(sent_at=sent_at)
+    return log
+
+
+def partition_of(log):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT tableoid::regclass::text FROM {TABLE} WHERE id = %s",  # noqa: S608
+            [log.pk],
+        )
+        return cursor.fetchone()[0]
+
+
+def table_exists(name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        return cursor.fetchone()[0] is not None
+
+
+def test_add_months():
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 5, 1), -17) == date(2024, 12, 1)
+
+
+@pytest.mark.django_db
+class TestPartitions:
+    def test_current_month_is_partitioned(self):
+        log = EmailLog.objects.create(
+            recipient="a@example.com", kind=NotificationKind.EMAIL
+        )
+        current = month_start(log.sent_at)
+        assert partition_of(log) == list_partitions(connection, TABLE)[current]
+
+    def test_create_partition_moves_rows_out_of_default(self):
+        log = log_sent_at(datetime(2020, 1, 15, tzinfo=UTC))
+        assert partition_of(log) == f"{TABLE}_default"
+
+        assert create_partition(connection, TABLE, OLD_MONTH)
+        assert not create_partition(connection, TABLE, OLD_MONTH)
+        assert partition_of(log) == f"{TABLE}_p2020_01"
+
+    def test_expired_partitions_are_dropped(self):
+        create_partition(connection, TABLE, OLD_MONTH)
+        log_sent_at(datetime(2020, 1, 15, tzinfo=UTC))
+
+        created, retired = maintain_partitions(connection, retain_months=12)
+
+        assert f"{TABLE}_p2020_01" in retired
+        assert created == []
+        assert not table_exists(f"{TABLE}_p2020_01")
+        assert not EmailLog.objects.filter(sent_at__year=2020).exists()
+
+    def test_archive_keeps_the_rows_outside_the_log(self):
+        create_partition(connection, TABLE, OLD_MONTH)
+        log_sent_at(datetime(2020, 1, 15, tzinfo=UTC))
+        out = StringIO()
+
+        call_command("prune_notification_logs", "--archive", stdout=out)
+
+        assert "archived" in out.getvalue()
+        assert not EmailLog.objects.filter(sent_at__year=2020).exists()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM archive_{TABLE}_p2020_01")  # noqa: S608
+            assert cursor.fetchone()[0] == 1
+
+    def test_dry_run_changes_nothing(self):
+        create_partition(connection, TABLE, OLD_MONTH)
+
+        call_command("prune_notification_logs", "--dry-run", stdout=StringIO())
+
+        assert table_exists(f"{TABLE}_p2020_01")
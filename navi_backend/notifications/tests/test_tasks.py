@@ -0,0 +1,71 @@
+import pytest
+from django.core import mail
+from django.core.files.base import ContentFile
+
+from navi_backend.core.helpers.pdf_cache import cache_pdf
+from navi_backend.core.helpers.pdf_cache import hash_pdf
+from navi_backend.notifications.tasks import build_invoice_notification
+from navi_backend.notifications.tasks import send_invoice_email
+from navi_backend.orders.tests.factories import OrderFactory
+from navi_backend.payments.models import Invoice
+
+PDF = b"%PDF-1.7 " + bytes(range(256)) * 400
+
+
+@pytest.fixture
+def invoice(user):
+    invoice = Invoice.objects.create(
+        order=OrderFactory(navi_port=None, user=user),
+        created_by=user,
+        updated_by=user,
+        pdf_sha256=hash_pdf(PDF),
+    )
+    invoice.pdf.save("invoice.pdf", ContentFile(PDF), save=True)
+    return invoice
+
+
+def attached_pdf():
+    (message,) = mail.outbox
+    (part,) = [
+        part
+        for part in message.message().walk()
+        if part.get_content_type() == "application/pdf"
+    ]
+    return part
+
+
+@pytest.mark.django_db
+class TestSendInvoiceEmail:
+    def test_attaches_the_pdf(self, user, invoice):
+        send_invoice_email(user.id, invoice.id)
+
+        part = attached_pdf()
+        assert part.get_filename() == f"invoice-{invoice.format_reference_number()}.pdf"
+        assert part.get_payload(decode=True) == PDF
+
+    def test_cached_pdf_skips_storage(self, user, invoice, monkeypatch):
+        cache_pdf(invoice.id, [PDF])
+
+        def fail(*args, **kwargs):
+            raise AssertionError
+
+        monkeypatch.setattr(type(invoice.pdf), "open", fail)
+        send_invoice_email(user.id, invoice.id)
+
+        assert attached_pdf().get_payload(decode=True) == PDF
+
+    def test_missing_hash_is_recorded(self, user, invoice):
+        Invoice.objects.filter(pk=invoice.pk).update(pdf_sha256="")
+
+        send_invoice_email(user.id, invoice.id)
+
+        invoice.refresh_from_db()
+        assert invoice.pdf_sha256 == hash_pdf(PDF)
+
+    def test_evicted_pdf_is_fetched_again(self, user, invoice):
+        notification = build_invoice_notification(user.email, invoice)
+        notification.attachment.path.unlink()
+
+        notification.send()
+
+        assert attached_pdf().get_payload(decode=True) == PDF
@@ -59,6 +59,7 @@ class OrderItemSerializer(ReadOnlyAuditMixin, serializers.ModelSerializer):
 class OrderSerializer(BaseModelSerializer):
     items = OrderItemSerializer(many=True, required=False)
     user = UserSerializer(read_only=True)
+    price = serializers.SerializerMethodField()
 
     show_only_to_admin_fields = ()
 
@@ -77,6 +78,14 @@ class OrderSerializer(BaseModelSerializer):
         field_sets = {
             "partial_update": ["navi_port", "items", "order_status"],
         }
+        prefetch_plan = {
+            "select_related": ["user"],
+            "prefetch_related": ["items__customizations"],
+        }
+
+    def get_price(self, obj):
+        # The stored total, kept current as items change; no per-order query.
+        return obj.total
 
     def create(self, validated_data):
         service = CreateOrderService(
@@ -9,7 +9,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from navi_backend.core.api import BaseModelViewSet
+from navi_backend.core.api.mixins import NonAtomicActionsMixin
+from navi_backend.core.api.mixins import PrefetchPlanMixin
+from navi_backend.core.api.mixins import StreamingExportMixin
 from navi_backend.core.api.mixins import UserScopedQuerySetMixin
+from navi_backend.core.pagination import CreatedAtCursorPagination
 from navi_backend.core.permissions import IsOwner
 from navi_backend.core.utils.decorators import require_body_params
 from navi_backend.devices.models import NaviPort
@@ -24,8 +28,29 @@ from .serializers import OrderItemSerializer
 from .serializers import OrderSerializer
 
 
-class OrderViewSet(UserScopedQuerySetMixin, BaseModelViewSet):
+class OrderViewSet(
+    NonAtomicActionsMixin,
+    StreamingExportMixin,
+    PrefetchPlanMixin,
+    UserScopedQuerySetMixin,
+    BaseModelViewSet,
+):
     serializer_class = OrderSerializer
+    # CreateOrderService commits the order before calling Stripe.
+    non_atomic_actions = ("create",)
+    pagination_class = CreatedAtCursorPagination
+    export_fields = (
+        "id",
+        "slug",
+        "user_id",
+        "user__email",
+        "navi_port_id",
+        "order_status",
+        "subtotal",
+        "total",
+        "payment__stripe_payment_intent_id",
+        "created_at",
+    )
     action_permissions = {
         "default": [IsOwner, IsAuthenticated],
         "create": [IsAuthenticated],
@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Q
+
+from navi_backend.orders.models import Order
+from navi_backend.orders.models import OrderItem
+
+
+class Command(BaseCommand):
+    help = "recomputes stored order and line totals and reports drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing corrected totals.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows recomputed per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        batch_size = options["batch_size"]
+        self.verbosity = options["verbosity"]
+
+        with transaction.atomic():
+            # Line totals feed the order subtotal, so they are reconciled first.
+            drifted_items = self.reconcile(
+                OrderItem.objects.with_computed_line_total().exclude(
+                    line_total=F("computed_line_total")
+                ),
+                lambda pks: OrderItem.objects.filter(pk__in=pks).refresh_line_totals(),
+                batch_size,
+            )
+            drifted_orders = self.reconcile(
+                Order.objects.with_computed_subtotal().exclude(
+                    Q(subtotal=F("computed_subtotal")) & Q(total=F("computed_subtotal"))
+                ),
+                lambda pks: Order.objects.filter(pk__in=pks).refresh_totals(),
+                batch_size,
+            )
+            # A dry run still applies the fixes so order drift is measured
+            # against corrected line totals, then throws them away.
+            if dry_run:
+                transaction.set_rollback(True)
+
+        msg = (
+            f"{'Found' if dry_run else 'Fixed'} {drifted_items} order item(s) and "
+            f"{drifted_orders} order(s) with drifted totals."
+        )
+        if drifted_items or drifted_orders:
+            self.stdout.write(self.style.WARNING(msg))
+        else:
+            self.stdout.write(self.style.SUCCESS(msg))
+
+    def reconcile(self, drifted, refresh, batch_size):
+        pks = list(drifted.values_list("pk", flat=True))
+        if self.verbosity > 1:
+            for pk in pks:
+                self.stdout.write(f"  {drifted.model.__name__} {pk} drifted")
+        for start in range(0, len(pks), batch_size):
+            refresh(pks[start : start + batch_size])
+        return len(pks)
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import models
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models import Sum
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+ZERO = Value(Decimal("0.00"))
+
+
+def money_field():
+    return models.DecimalField(max_digits=12, decimal_places=2)
+
+
+class OrderItemQuerySet(models.QuerySet):
+    def computed_line_total(self):
+        """
+        Expression for unit_price * quantity plus the item's customizations,
+        evaluated against the outer OrderItem row.
+        """
+        order_customization = apps.get_model("orders", "OrderCustomization")
+        customizations_total = (
+            order_customization.objects.filter(order_item=OuterRef("pk"))
+            .values("order_item")
+            .annotate(
+                total=Sum(F("unit_price") * F("quantity"), output_field=money_field())
+            )
+            .values("total")
+        )
+        return F("unit_price") * F("quantity") + Coalesce(
+            Subquery(customizations_total, output_field=money_field()), ZERO
+        )
+
+    def with_computed_line_total(self):
+        return self.annotate(computed_line_total=self.computed_line_total())
+
+    def refresh_line_totals(self):
+        return self.update(line_total=self.computed_line_total())
+
+
+class OrderQuerySet(models.QuerySet):
+    def computed_subtotal(self):
+        """
+        Expression summing the stored line totals of the outer Order's items.
+        """
+        order_item = apps.get_model("orders", "OrderItem")
+        items_total = (
+            order_item.objects.filter(order=OuterRef("pk"))
+            .values("order")
+            .annotate(total=Sum("line_total", output_field=money_field()))
+            .values("total")
+        )
+        return Coalesce(Subquery(items_total, output_field=money_field()), ZERO)
+
+    def with_computed_subtotal(self):
+        return self.annotate(computed_subtotal=self.computed_subtotal())
+
+    def refresh_totals(self):
+        # No fees or taxes are modelled yet, so total tracks subtotal.
+        subtotal = self.computed_subtotal()
+        return self.update(subtotal=subtotal, total=subtotal)
+
+    def awaiting_payment(self, older_than):
+        """
+        Ordered orders that never got a payment attached, e.g. because the
+        process died between committing the order and creating the intent.
+        """
+        return self.filter(
+            order_status="O",
+            payment__isnull=True,
+            created_at__lt=timezone.now() - older_than,
+        )
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:05
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_totals(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    OrderItem = apps.get_model("orders", "OrderItem")
+    OrderCustomization = apps.get_model("orders", "OrderCustomization")
+    money = models.DecimalField(max_digits=12, decimal_places=2)
+    zero = Value(Decimal("0.00"))
+
+    customizations_total = (
+        OrderCustomization.objects.filter(order_item=OuterRef("pk"))
+        .values("order_item")
+        .annotate(total=Sum(F("unit_price") * F("quantity"), output_field=money))
+        .values("total")
+    )
+    OrderItem.objects.update(
+        line_total=F("unit_price") * F("quantity")
+        + Coalesce(Subquery(customizations_total, output_field=money), zero)
+    )
+
+    items_total = (
+        OrderItem.objects.filter(order=OuterRef("pk"))
+        .values("order")
+        .annotate(total=Sum("line_total", output_field=money))
+        .values("total")
+    )
+    subtotal = Coalesce(Subquery(items_total, output_field=money), zero)
+    Order.objects.update(subtotal=subtotal, total=subtotal)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_alter_order_status_alter_ordercustomization_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='subtotal',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text="Sum of the line totals of the order's items", max_digits=12, verbose_name='Subtotal'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Amount charged for the order', max_digits=12, verbose_name='Total'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='line_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Unit price times quantity plus customizations', max_digits=12, verbose_name='Line Total'),
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,7 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from navi_backend.core.models import AuditModel
@@ -12,6 +13,8 @@ from navi_backend.core.models import UUIDModel
 from navi_backend.devices.models import NaviPort
 from navi_backend.menu.models import Customization
 from navi_backend.menu.models import MenuItem
+from navi_backend.orders.managers import OrderItemQuerySet
+from navi_backend.orders.managers import OrderQuerySet
 from navi_backend.payments.models import Payment
 from navi_backend.users.models import User
 
@@ -47,18 +50,45 @@ class Order(
         db_index=True,
         help_text=_("Order status"),
     )
+    subtotal = models.DecimalField(
+        _("Subtotal"),
+        decimal_places=2,
+        max_digits=12,
+        default=Decimal("0.00"),
+        help_text=_("Sum of the line totals of the order's items"),
+    )
+    total = models.DecimalField(
+        _("Total"),
+        decimal_places=2,
+        max_digits=12,
+        default=Decimal("0.00"),
+        help_text=_("Amount charged for the order"),
+    )
+
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="order_created_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} (v{self.created_at})"
 
     @property
     def price(self):
+        # Computed from the rows, so it also covers unsaved orders and rows
+        # changed without save(); ``total`` is the stored, indexed value.
         total = Decimal("0.00")
         if self.pk:
             for item in self.items.all():
                 total += item.price
         return total
 
+    def refresh_totals(self):
+        Order.objects.filter(pk=self.pk).refresh_totals()
+        self.refresh_from_db(fields=["subtotal", "total"])
+
     def is_dispatchable(self):
         if self.order_status != "O":
             msg = "Order must be in 'ordered' status to dispatch."
@@ -109,26 +139,53 @@ class OrderItem(
         ],
         help_text=_("Price per unit in dollars (between $99999-$0.01)"),
     )
+    line_total = models.DecimalField(
+        _("Line Total"),
+        decimal_places=2,
+        max_digits=12,
+        default=Decimal("0.00"),
+        help_text=_("Unit price times quantity plus customizations"),
+    )
+
+    objects = OrderItemQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.order} {self.menu_item}"
 
     def save(self, *args, **kwargs):
+        self.validate_order()
+
+        if not self.unit_price:
+            self.unit_price = self.menu_item.price
+
+        with transaction.atomic():
+            result = super().save(*args, **kwargs)
+            self.refresh_totals()
+        return result
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if self.order_id:
+                self.order.refresh_totals()
+        return result
+
+    def refresh_totals(self):
+        OrderItem.objects.filter(pk=self.pk).refresh_line_totals()
+        self.refresh_from_db(fields=["line_total"])
+        if self.order_id:
+            self.order.refresh_totals()
+
+    def validate_order(self):
         if not self.order:
             msg = "Can't save an order item without a parent order."
             raise ValidationError(msg)
         if self.order.order_status != "O":
             msg = (
-                "You can't update order items if the order is not in "
-                "'Ordered' status."
+                "You can't update order items if the order is not in 'Ordered' status."
             )
             raise ValidationError(msg)
 
-        if not self.unit_price:
-            self.unit_price = self.menu_item.price
-
-        return super().save(*args, **kwargs)
-
     @property
     def price(self):
         item_price = self.unit_price * self.quantity
@@ -177,10 +234,25 @@ class OrderCustomization(
     def save(self, *args, **kwargs):
         if self.order_item:
             order_item = OrderItem.objects.get(pk=self.order_item.pk)
-            if order_item.order.order_status != "O":
-                msg = (
-                    "You cannot update order customizations if the order is not in "
-                    "'Ordered' status."
-                )
-                raise ValidationError(msg)
-        return super().save(*args, **kwargs)
+            self.validate_order(order_item.order)
+
+        with transaction.atomic():
+            result = super().save(*args, **kwargs)
+            if self.order_item:
+                self.order_item.refresh_totals()
+        return result
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if self.order_item:
+                self.order_item.refresh_totals()
+        return result
+
+    def validate_order(self, order):
+        if order.order_status != "O":
+            msg = (
+                "You cannot update order customizations if the order is not in "
+                "'Ordered' status."
+            )
+            raise ValidationError(msg)
@@ -1,3 +1,4 @@
 from .create_order_service import CreateOrderService
+from .invoice_pdf_service import InvoicePDFService
 
-__all__ = ["CreateOrderService"]
+__all__ = ["CreateOrderService", "InvoicePDFService"]
@@ -1,14 +1,32 @@
+import logging
 from collections import Counter
 from contextlib import contextmanager
+from decimal import Decimal
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
 from navi_backend.core.base_service import BaseService
-from navi_backend.menu.models import CustomizationGroup
+from navi_backend.menu.services import CustomizationRuleService
 from navi_backend.orders.models import Order
+from navi_backend.orders.models import OrderCustomization
+from navi_backend.orders.models import OrderItem
 from navi_backend.payments.services import StripePaymentService
 
+logger = logging.getLogger(__name__)
+
+# Relations are already resolved instances; validating them again would cost a
+# query per foreign key per line.
+BULK_CLEAN_EXCLUDE = [
+    "order",
+    "order_item",
+    "menu_item",
+    "customization",
+    "created_by",
+    "updated_by",
+]
+
 
 class CreateOrderService(BaseService):
     def __init__(self, **kwargs):
@@ -17,10 +35,15 @@ class CreateOrderService(BaseService):
             self.validate_customizations,
             self.save_order,
             self.save_order_items,
-            self.create_payment_intent,
         ]
         super().__init__(**kwargs)
 
+    def run(self):
+        super().run()
+        # The order is committed by now. Stripe is only called afterwards so
+        # no transaction, row lock or savepoint is held across its round trips.
+        self.result["ctx"] = self.create_payment_intent(self.result["ctx"])
+
     @contextmanager
     def execute(self):
         try:
@@ -48,54 +71,35 @@ class CreateOrderService(BaseService):
     def validate_customizations(self, ctx):
         """
         Enforce CustomizationGroup rules (is_required, allow_multiple,
-        minimum_allowed, maximum_allowed) for each order item.
+        minimum_allowed, maximum_allowed) for each order item, using one rule
+        table loaded for every category in the cart.
         """
         errors = []
+        order_items_data = ctx["order_items_data"]
+        rules = CustomizationRuleService.get_rules(
+            item_data["menu_item"].category_id
+            for item_data in order_items_data
+            if item_data.get("menu_item")
+        )
 
-        for idx, item_data in enumerate(ctx["order_items_data"]):
+        for idx, item_data in enumerate(order_items_data):
             menu_item = item_data.get("menu_item")
-            if not menu_item or not menu_item.category:
+            if not menu_item or not menu_item.category_id:
                 continue
 
-            customizations = item_data.get("customizations", [])
-
             # Count how many customizations were selected per group
             group_counts = Counter()
-            for c in customizations:
+            for c in item_data.get("customizations", []):
                 customization = c.get("customization")
                 if customization and customization.group_id:
                     group_counts[customization.group_id] += c.get("quantity", 1)
 
-            # Get all customization groups for this item's category
-            groups = CustomizationGroup.objects.filter(category=menu_item.category)
-
-            for group in groups:
-                count = group_counts.get(group.pk, 0)
-                item_label = f"Item {idx + 1} ({menu_item.name})"
-
-                if group.is_required and count == 0:
-                    errors.append(f'{item_label}: "{group.name}" is required.')
-                    continue
-
-                if count == 0:
-                    continue
-
-                if not group.allow_multiple and count > 1:
-                    errors.append(
-                        f'{item_label}: "{group.name}" only allows a single selection.'
-                    )
-
-                if group.minimum_allowed is not None and count < group.minimum_allowed:
-                    errors.append(
-                        f'{item_label}: "{group.name}" requires at least '
-                        f"{group.minimum_allowed} selection(s)."
-                    )
-
-                if group.maximum_allowed is not None and count > group.maximum_allowed:
-                    errors.append(
-                        f'{item_label}: "{group.name}" allows at most '
-                        f"{group.maximum_allowed} selection(s)."
-                    )
+            item_label = f"Item {idx + 1} ({menu_item.name})"
+            for rule in rules.get(menu_item.category_id, []):
+                errors.extend(
+                    f"{item_label}: {error}"
+                    for error in rule.check(group_counts.get(rule.group_id, 0))
+                )
 
         if errors:
             raise ValidationError({"customizations": errors})
@@ -107,50 +111,108 @@ class CreateOrderService(BaseService):
         return ctx
 
     def save_order_items(self, ctx):
-        from navi_backend.orders.api.serializers import OrderCustomizationSerializer
-        from navi_backend.orders.api.serializers import OrderItemSerializer
-
+        """
+        Validate every line in memory, then insert all order items and all
+        order customizations with one bulk_create each and store the totals.
+        """
         order = ctx["order"]
         tracking_user = ctx["tracking_user"]
 
-        for order_item_data in ctx["order_items_data"]:
-            customizations = order_item_data.pop("customizations", [])
-
-            order_item_data["order"] = order.id
-            order_item_data["unit_price"] = order_item_data["menu_item"].price
-            order_item_data["menu_item"] = order_item_data["menu_item"].id
+        order_items = []
+        order_customizations = []
+        errors = []
 
-            order_item_serializer = OrderItemSerializer(data=order_item_data)
-            if not order_item_serializer.is_valid():
-                raise ValidationError(order_item_serializer.errors)
+        for idx, order_item_data in enumerate(ctx["order_items_data"]):
+            menu_item = order_item_data["menu_item"]
+            order_item = OrderItem(
+                slug=OrderItem.random_slug(),
+                order=order,
+                menu_item=menu_item,
+                quantity=order_item_data.get("quantity", 1),
+                unit_price=menu_item.price,
+                created_by=tracking_user,
+                updated_by=tracking_user,
+            )
+            line_customizations = [
+                OrderCustomization(
+                    slug=OrderCustomization.random_slug(),
+                    order_item=order_item,
+                    customization=customization_data["customization"],
+                    quantity=customization_data.get("quantity", 1),
+                    unit_price=customization_data["customization"].price,
+                    created_by=tracking_user,
+                    updated_by=tracking_user,
+                )
+                for customization_data in order_item_data.get("customizations", [])
+            ]
+
+            try:
+                order_item.validate_order()
+                order_item.full_clean(exclude=BULK_CLEAN_EXCLUDE, validate_unique=False)
+                for order_customization in line_customizations:
+                    order_customization.validate_order(order)
+                    order_customization.full_clean(
+                        exclude=BULK_CLEAN_EXCLUDE, validate_unique=False
+                    )
+            except DjangoValidationError as e:
+                errors.append(
+                    f"Item {idx + 1} ({menu_item.name}): {'; '.join(e.messages)}"
+                )
+                continue
 
-            order_item = order_item_serializer.save(
-                created_by=tracking_user, updated_by=tracking_user
+            # bulk_create skips save(), so stored totals are computed here.
+            order_item.line_total = order_item.unit_price * order_item.quantity + sum(
+                (c.unit_price * c.quantity for c in line_customizations),
+                Decimal("0.00"),
             )
+            order_items.append(order_item)
+            order_customizations.extend(line_customizations)
 
-            for customization_data in customizations:
-                customization_serializer = OrderCustomizationSerializer(
-                    data={
-                        "customization": customization_data["customization"].id,
-                        "order_item": order_item.id,
-                        "quantity": customization_data["quantity"],
-                        "unit_price": customization_data["customization"].price,
-                    }
-                )
-                if not customization_serializer.is_valid():
-                    raise ValidationError(customization_serializer.errors)
+        if errors:
+            raise ValidationError({"items": errors})
 
-                customization_serializer.save(
-                    created_by=tracking_user, updated_by=tracking_user
-                )
+        OrderItem.objects.bulk_create(order_items)
+        OrderCustomization.objects.bulk_create(order_customizations)
+
+        order.subtotal = sum(
+            (order_item.line_total for order_item in order_items), Decimal("0.00")
+        )
+        order.total = order.subtotal
+        order.save(update_fields=["subtotal", "total"])
 
+        ctx["order_items"] = order_items
         return ctx
 
     def create_payment_intent(self, ctx):
         order = ctx["order"]
-        client_secret, payment = StripePaymentService.create_payment_intent(order)
-        order.payment = payment
-        order._stripe_client_secret = client_secret  # NOQA: SLF001
-        order.save(update_fields=["payment"])
+        try:
+            intent = StripePaymentService.create_payment_intent(order)
+        except Exception as e:
+            self.log_service_error(e, self.create_payment_intent)
+            self.cancel_unpaid_order(order)
+            raise ValidationError({"error": str(e)}) from e
+
+        try:
+            with transaction.atomic():
+                order.payment = StripePaymentService.record_payment(order, intent)
+                order.save(update_fields=["payment"])
+        except Exception as e:
+            self.log_service_error(e, self.create_payment_intent)
+            # Compensate: the authorization exists at Stripe but nothing here
+            # points at it, so it would never be captured or released.
+            try:
+                StripePaymentService.cancel_payment(intent.id)
+            except Exception:
+                logger.exception("Failed to cancel orphaned intent %s", intent.id)
+            order.payment = None
+            self.cancel_unpaid_order(order)
+            raise ValidationError({"error": str(e)}) from e
+
+        order._stripe_client_secret = intent.client_secret  # NOQA: SLF001
         ctx["order"] = order
         return ctx
+
+    @staticmethod
+    def cancel_unpaid_order(order):
+        Order.objects.filter(pk=order.pk, payment__isnull=True).update(order_status="C")
+        order.order_status = "C"
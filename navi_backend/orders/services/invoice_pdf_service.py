@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.conf import settings
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+INVOICE_TEMPLATE = "invoices/order_pdf.html"
+INVOICE_STYLESHEET = settings.APPS_DIR / "templates" / "invoices" / "order_pdf.css"
+WARM_UP_HTML = "<p>warm-up</p>"
+
+
+@dataclass
+class RendererState:
+    html_class: type
+    font_config: object
+    stylesheets: list
+    image_cache: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RenderedPDF:
+    pdf_bytes: bytes
+    render_ms: float
+
+
+class InvoicePDFService:
+    _state = None
+    _state_lock = threading.Lock()
+
+    @staticmethod
+    def get_state():
+        """
+        Returns the process-wide WeasyPrint state, building it on first use:
+        one FontConfiguration, the parsed invoice stylesheet and an image
+        cache, all reused by every later render in this process.
+        """
+        if InvoicePDFService._state is not None:
+            return InvoicePDFService._state
+
+        with InvoicePDFService._state_lock:
+            if InvoicePDFService._state is None:
+                # Imported here so web processes never load WeasyPrint/Pango.
+                from weasyprint import CSS  # noqa: PLC0415
+                from weasyprint import HTML  # noqa: PLC0415
+                from weasyprint.text.fonts import FontConfiguration  # noqa: PLC0415
+
+                font_config = FontConfiguration()
+                InvoicePDFService._state = RendererState(
+                    html_class=HTML,
+                    font_config=font_config,
+                    stylesheets=[
+                        CSS(filename=str(INVOICE_STYLESHEET), font_config=font_config)
+                    ],
+                )
+        return InvoicePDFService._state
+
+    @staticmethod
+    def warm_up():
+        """
+        Builds the renderer state and lays out a throwaway page so font
+        discovery and stylesheet parsing happen before the first invoice.
+        """
+        started = time.perf_counter()
+        state = InvoicePDFService.get_state()
+        get_template(INVOICE_TEMPLATE)
+        state.html_class(string=WARM_UP_HTML).write_pdf(
+            stylesheets=state.stylesheets,
+            font_config=state.font_config,
+            cache=state.image_cache,
+        )
+        logger.info(
+            "Warmed up invoice PDF renderer in %.0fms",
+            (time.perf_counter() - started) * 1000,
+        )
+
+    @staticmethod
+    def render(order, invoice):
+        """
+        Renders the invoice PDF for ``order`` and logs how long layout took.
+        Renders are not throttled here: the invoice worker's process count
+        bounds how many run at once.
+        """
+        html = get_template(INVOICE_TEMPLATE).render(
+            {"order": order, "invoice": invoice}
+        )
+        state = InvoicePDFService.get_state()
+
+        started = time.perf_counter()
+        pdf_bytes = state.html_class(string=html).write_pdf(
+            stylesheets=state.stylesheets,
+            font_config=state.font_config,
+            cache=state.image_cache,
+        )
+        rendered = RenderedPDF(
+            pdf_bytes=pdf_bytes,
+            render_ms=(time.perf_counter() - started) * 1000,
+        )
+        logger.info(
+            "Rendered invoice %s in %.0fms (%d bytes)",
+            invoice.format_reference_number(),
+            rendered.render_ms,
+            len(pdf_bytes),
+        )
+        return rendered
@@ -1,14 +1,26 @@
 import logging
+from datetime import timedelta
 
 from celery import shared_task
+from celery.signals import worker_process_init
+from django.conf import settings
 from django.core.files.base import ContentFile
-from django.template.loader import render_to_string
-from weasyprint import HTML
 
+from navi_backend.core.helpers.pdf_cache import cache_pdf
+from navi_backend.core.helpers.pdf_cache import hash_pdf
 from navi_backend.notifications.tasks import send_invoice_email
 from navi_backend.orders.models import Order
+from navi_backend.orders.services import InvoicePDFService
 from navi_backend.payments.models import Invoice
 
+ABANDONED_ORDER_AGE = timedelta(minutes=30)
+
+
+@worker_process_init.connect
+def warm_up_invoice_renderer(**kwargs):
+    if settings.INVOICE_PDF_WARM_UP:
+        InvoicePDFService.warm_up()
+
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def create_order_invoice(self, order_id):
@@ -31,16 +43,29 @@ def create_order_invoice(self, order_id):
 
     logging.info(f"Created Invoice #{invoice.id}")  # NOQA: G004
 
-    html = render_to_string(
-        "invoices/order_pdf.html",
-        context={"order": order, "invoice": invoice},
-    )
-    pdf_bytes = HTML(string=html).write_pdf()
+    rendered = InvoicePDFService.render(order, invoice)
 
+    invoice.pdf_sha256 = hash_pdf(rendered.pdf_bytes)
     invoice.pdf.save(
         f"invoice-{invoice.reference_number}-order-{order.id}",
-        ContentFile(pdf_bytes),
+        ContentFile(rendered.pdf_bytes),
         save=True,
     )
+    try:
+        # Lets send_invoice_email attach the PDF without downloading it again.
+        cache_pdf(invoice.id, [rendered.pdf_bytes])
+    except OSError:
+        logging.warning("Could not cache the PDF of invoice %s", invoice.id)
 
     send_invoice_email.apply_async(args=[order.user.id, invoice.id], queue="email")
+    return rendered.render_ms
+
+
+@shared_task
+def cancel_abandoned_orders():
+    # An uncaptured intent that may exist for these expires at Stripe on its own.
+    cancelled = Order.objects.awaiting_payment(ABANDONED_ORDER_AGE).update(
+        order_status="C"
+    )
+    logging.info("Cancelled %s order(s) that never got a payment", cancelled)
+    return cancelled
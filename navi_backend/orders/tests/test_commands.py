@@ -0,0 +1,51 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from navi_backend.orders.models import Order
+from navi_backend.orders.models import OrderItem
+
+from .factories import OrderCustomizationFactory
+from .factories import OrderFactory
+from .factories import OrderItemFactory
+
+
+def reconcile(*args):
+    out = StringIO()
+    call_command("reconcile_order_totals", *args, stdout=out, skip_checks=True)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestReconcileOrderTotals:
+    @pytest.fixture
+    def drifted_order(self):
+        order = OrderFactory(order_status="O")
+        order_item = OrderItemFactory(
+            order=order, quantity=1, unit_price=Decimal("3.00")
+        )
+        OrderCustomizationFactory(
+            order_item=order_item, quantity=2, unit_price=Decimal("1.00")
+        )
+        OrderItem.objects.filter(pk=order_item.pk).update(line_total=Decimal("0.00"))
+        Order.objects.filter(pk=order.pk).update(total=Decimal("1.00"))
+        return order
+
+    def test_fixes_drift(self, drifted_order):
+        output = reconcile()
+
+        drifted_order.refresh_from_db()
+        assert "Fixed 1 order item(s) and 1 order(s)" in output
+        assert drifted_order.items.get().line_total == Decimal("5.00")
+        assert drifted_order.subtotal == drifted_order.total == Decimal("5.00")
+        assert "Fixed 0 order item(s) and 0 order(s)" in reconcile()
+
+    def test_dry_run_reports_without_writing(self, drifted_order):
+        output = reconcile("--dry-run", "--verbosity", "2")
+
+        drifted_order.refresh_from_db()
+        assert "Found 1 order item(s) and 1 order(s)" in output
+        assert f"Order {drifted_order.pk} drifted" in output
+        assert drifted_order.total == Decimal("1.00")
@@ -0,0 +1,61 @@
+import pytest
+
+from navi_backend.orders.services import InvoicePDFService
+from navi_backend.orders.services.invoice_pdf_service import INVOICE_STYLESHEET
+from navi_backend.orders.services.invoice_pdf_service import INVOICE_TEMPLATE
+from navi_backend.orders.services.invoice_pdf_service import RendererState
+from navi_backend.orders.tests.factories import OrderFactory
+from navi_backend.payments.models import Invoice
+
+
+class FakeHTML:
+    rendered = []
+
+    def __init__(self, string):
+        self.string = string
+
+    def write_pdf(self, **kwargs):
+        FakeHTML.rendered.append((self.string, kwargs))
+        return b"%PDF-fake"
+
+
+@pytest.fixture
+def renderer_state(monkeypatch):
+    FakeHTML.rendered = []
+    state = RendererState(
+        html_class=FakeHTML, font_config=object(), stylesheets=["css"]
+    )
+    monkeypatch.setattr(InvoicePDFService, "_state", state)
+    return state
+
+
+@pytest.fixture
+def invoice(user):
+    return Invoice.objects.create(
+        order=OrderFactory(navi_port=None), created_by=user, updated_by=user
+    )
+
+
+def test_stylesheet_is_not_inlined():
+    assert INVOICE_STYLESHEET.is_file()
+    template = (INVOICE_STYLESHEET.parent / INVOICE_TEMPLATE.split("/")[-1]).read_text()
+    assert "<style" not in template
+
+
+@pytest.mark.django_db
+class TestInvoicePDFService:
+    def test_render_reuses_the_shared_state(self, renderer_state, invoice):
+        first = InvoicePDFService.render(invoice.order, invoice)
+        InvoicePDFService.render(invoice.order, invoice)
+
+        assert first.pdf_bytes == b"%PDF-fake"
+        assert first.render_ms >= 0
+        assert len(FakeHTML.rendered) == 2
+        for html, kwargs in FakeHTML.rendered:
+            assert invoice.format_reference_number() in html
+            assert kwargs["stylesheets"] is renderer_state.stylesheets
+            assert kwargs["font_config"] is renderer_state.font_config
+            assert kwargs["cache"] is renderer_state.image_cache
+
+    def test_get_state_is_built_once(self, renderer_state):
+        assert InvoicePDFService.get_state() is renderer_state
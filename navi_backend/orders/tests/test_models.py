@@ -7,6 +7,7 @@ from django.core.exceptions import ValidationError
 from navi_backend.devices.tests.factories import NaviPortFactory
 from navi_backend.menu.tests.factories import CustomizationFactory
 from navi_backend.menu.tests.factories import MenuItemFactory
+from navi_backend.orders.models import OrderItem
 from navi_backend.payments.tests.factories import PaymentFactory
 from navi_backend.users.tests.factories import UserFactory
 
@@ -251,3 +252,45 @@ class TestOrderWorkflow:
         assert order_item1.price == expected_item1_price
         assert order_item2.price == expected_item2_price
         assert order.price == expected_total
+
+
+@pytest.mark.django_db
+class TestStoredTotals:
+    def test_item_and_customization_writes_update_totals(self):
+        order = OrderFactory(order_status="O")
+        order_item = OrderItemFactory(
+            order=order, quantity=2, unit_price=Decimal("4.00")
+        )
+        customization = OrderCustomizationFactory(
+            order_item=order_item, quantity=1, unit_price=Decimal("0.50")
+        )
+
+        order.refresh_from_db()
+        assert order_item.line_total == Decimal("8.50")
+        assert order.subtotal == order.total == Decimal("8.50")
+
+        customization.delete()
+        order.refresh_from_db()
+        assert order.total == Decimal("8.00")
+
+        order_item.quantity = 3
+        order_item.save()
+        order.refresh_from_db()
+        assert order.total == Decimal("12.00")
+
+        order_item.delete()
+        order.refresh_from_db()
+        assert order.total == Decimal("0.00")
+
+    def test_price_is_computed_from_the_rows(self):
+        order_item = OrderItemFactory(quantity=2, unit_price=Decimal("4.00"))
+        order = order_item.order
+        OrderItem.objects.filter(pk=order_item.pk).update(quantity=3)
+
+        order.refresh_from_db()
+        assert order.total == Decimal("8.00")
+        assert order.price == Decimal("12.00")
+
+        unsaved = OrderItem(order=order, quantity=2, unit_price=Decimal("1.50"))
+        assert unsaved.line_total == Decimal("0.00")
+        assert unsaved.price == Decimal("3.00")
@@ -0,0 +1,91 @@
+from decimal import Decimal
+
+import pytest
+
+from navi_backend.core.api.mixins import apply_prefetch_plan
+from navi_backend.menu.tests.factories import CustomizationFactory
+from navi_backend.menu.tests.factories import MenuItemFactory
+from navi_backend.orders.api.serializers import OrderSerializer
+from navi_backend.orders.models import Order
+
+from .factories import OrderCustomizationFactory
+from .factories import OrderFactory
+from .factories import OrderItemFactory
+
+
+def build_orders(size):
+    """
+    Creates ``size`` orders, each with two items carrying two customizations.
+    """
+    menu_item = MenuItemFactory()
+    customization = CustomizationFactory()
+    orders = []
+    for _ in range(size):
+        order = OrderFactory(order_status="O", navi_port=None)
+        for _ in range(2):
+            order_item = OrderItemFactory(
+                order=order,
+                menu_item=menu_item,
+                quantity=2,
+                unit_price=Decimal("4.00"),
+            )
+            OrderCustomizationFactory.create_batch(
+                2,
+                order_item=order_item,
+                customization=customization,
+                quantity=1,
+                unit_price=Decimal("0.50"),
+            )
+        orders.append(order)
+    return orders
+
+
+@pytest.mark.django_db
+class TestOrderSerializerQueryCounts:
+    @pytest.mark.parametrize("size", [1, 5])
+    def test_list(self, size, admin_user, api_rf, django_assert_num_queries):
+        build_orders(size)
+        request = api_rf.get("/api/orders/")
+        request.user = admin_user
+        queryset = apply_prefetch_plan(
+            Order.objects.all(), OrderSerializer.Meta.prefetch_plan
+        )
+
+        with django_assert_num_queries(3):
+            data = OrderSerializer(
+                queryset, many=True, context={"request": request}
+            ).data
+
+        assert len(data) == size
+        assert {order["price"] for order in data} == {Decimal("18.00")}
+
+
+@pytest.mark.django_db
+class TestNestedOrderEndpoints:
+    def test_lists_customizations_of_an_order_item(self, client):
+        order_customization = OrderCustomizationFactory()
+        order_item = order_customization.order_item
+        client.force_login(order_item.order.user)
+
+        response = client.get(
+            f"/api/orders/{order_item.order.pk}/items/{order_item.pk}/customizations/"
+        )
+
+        assert response.status_code == 200
+        assert [row["customization"] for row in response.json()] == [
+            str(order_customization.customization_id)
+        ]
+
+
+@pytest.mark.django_db
+def test_price_is_the_stored_total(admin_user, api_rf):
+    order = build_orders(1)[0]
+    Order.objects.filter(pk=order.pk).update(total=Decimal("20.00"))
+    request = api_rf.get("/api/orders/")
+    request.user = admin_user
+
+    data = OrderSerializer(
+        Order.objects.get(pk=order.pk), context={"request": request}
+    ).data
+
+    assert data["price"] == Decimal("20.00")
@@ -0,0 +1,337 @@
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIRequestFactory
+
+from navi_backend.menu.services import CustomizationRuleService
+from navi_backend.menu.tests.factories import CategoryFactory
+from navi_backend.menu.tests.factories import CustomizationFactory
+from navi_backend.menu.tests.factories import CustomizationGroupFactory
+from navi_backend.menu.tests.factories import MenuItemFactory
+from navi_backend.orders.models import Order
+from navi_backend.orders.models import OrderCustomization
+from navi_backend.orders.models import OrderItem
+from navi_backend.orders.services import CreateOrderService
+from navi_backend.orders.tests.factories import OrderFactory
+from navi_backend.payments.services import StripePaymentService
+from navi_backend.payments.tests.factories import PaymentFactory
+from navi_backend.users.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def _fake_payment_intent(monkeypatch):
+    def create_payment_intent(order):
+        return SimpleNamespace(id=f"pi_{order.pk.hex}", client_secret="secret")  # noqa: S106
+
+    monkeypatch.setattr(
+        StripePaymentService,
+        "create_payment_intent",
+        staticmethod(create_payment_intent),
+    )
+
+
+@pytest.fixture
+def service_context(db):
+    request = APIRequestFactory().post("/api/orders/")
+    request.user = UserFactory()
+    return {"request": request}
+
+
+def build_items(size, customizations_per_item=2):
+    items = []
+    for _ in range(size):
+        menu_item = MenuItemFactory(category=None, price=Decimal("4.00"))
+        items.append(
+            {
+                "menu_item": menu_item,
+                "quantity": 2,
+                "customizations": [
+                    {
+                        "customization": CustomizationFactory(price=Decimal("0.50")),
+                        "quantity": 1,
+                        "unit_price": Decimal("9.99"),
+                    }
+                    for _ in range(customizations_per_item)
+                ],
+            }
+        )
+    return items
+
+
+def order_data(service_context, items, **kwargs):
+    user = service_context["request"].user
+    return {
+        "user": user,
+        "created_by": user,
+        "updated_by": user,
+        "items": items,
+        **kwargs,
+    }
+
+
+def insert_count(queries, table):
+    return sum(1 for q in queries if q["sql"].startswith(f'INSERT INTO "{table}"'))
+
+
+@pytest.mark.django_db
+class TestCreateOrderServiceBulkItems:
+    @pytest.mark.parametrize("size", [1, 5])
+    def test_items_and_customizations_use_one_insert_each(self, size, service_context):
+        items = build_items(size)
+
+        with CaptureQueriesContext(connection) as ctx:
+            service = CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        order = service.result["ctx"]["order"]
+        assert order.items.count() == size
+        assert (
+            OrderCustomization.objects.filter(order_item__order=order).count()
+            == size * 2
+        )
+        assert insert_count(ctx.captured_queries, "orders_orderitem") == 1
+        assert insert_count(ctx.captured_queries, "orders_ordercustomization") == 1
+
+    def test_prices_and_audit_fields_are_set(self, service_context):
+        items = build_items(1, customizations_per_item=1)
+
+        service = CreateOrderService(
+            context=service_context, validated_data=order_data(service_context, items)
+        )
+
+        order_item = OrderItem.objects.get(order=service.result["ctx"]["order"])
+        customization = order_item.customizations.get()
+        assert order_item.unit_price == Decimal("4.00")
+        assert order_item.slug
+        assert order_item.created_by == service_context["request"].user
+        assert order_item.created_at is not None
+        assert customization.unit_price == Decimal("0.50")
+        assert customization.slug != order_item.slug
+        assert order_item.line_total == Decimal("8.50")
+        assert order_item.order.total == Decimal("8.50")
+
+    def test_rejects_items_for_non_ordered_status(self, service_context):
+        items = build_items(1)
+
+        with pytest.raises(ValidationError) as exc_info:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items, order_status="S"),
+            )
+
+        assert "update order items" in str(exc_info.value)
+        assert not OrderItem.objects.exists()
+
+    def test_rejects_invalid_quantity(self, service_context):
+        items = build_items(1)
+        items[0]["quantity"] = 101
+
+        with pytest.raises(ValidationError) as exc_info:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        assert "Item 1" in str(exc_info.value)
+        assert not OrderItem.objects.exists()
+
+
+def build_categorized_items(size):
+    """
+    Creates ``size`` lines, each in its own category with one required
+    single-choice group, selecting one customization from that group.
+    """
+    items = []
+    for _ in range(size):
+        category = CategoryFactory()
+        group = CustomizationGroupFactory(
+            category=[category], is_required=True, allow_multiple=False
+        )
+        items.append(
+            {
+                "menu_item": MenuItemFactory(category=category),
+                "quantity": 1,
+                "customizations": [
+                    {"customization": CustomizationFactory(group=group), "quantity": 1}
+                ],
+            }
+        )
+    return items
+
+
+def group_query_count(queries):
+    return sum(1 for q in queries if "menu_customizationgroup" in q["sql"])
+
+
+@pytest.mark.django_db
+class TestCreateOrderServiceCustomizationRules:
+    @pytest.fixture(autouse=True)
+    def _clear_rules(self):
+        CustomizationRuleService.clear()
+        yield
+        CustomizationRuleService.clear()
+
+    @pytest.mark.parametrize("size", [1, 4])
+    def test_rules_load_in_one_query(self, size, service_context):
+        items = build_categorized_items(size)
+
+        with CaptureQueriesContext(connection) as ctx:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        assert group_query_count(ctx.captured_queries) == 1
+
+    def test_cached_rules_skip_database(self, service_context):
+        items = build_categorized_items(2)
+        CreateOrderService(
+            context=service_context, validated_data=order_data(service_context, items)
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        assert group_query_count(ctx.captured_queries) == 0
+
+    def test_rejects_missing_required_group(self, service_context):
+        items = build_categorized_items(2)
+        items[1]["customizations"] = []
+
+        with pytest.raises(ValidationError) as exc_info:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        assert "Item 2" in str(exc_info.value)
+        assert "is required" in str(exc_info.value)
+
+    def test_rejects_multiple_selections(self, service_context):
+        items = build_categorized_items(1)
+        items[0]["customizations"][0]["quantity"] = 2
+
+        with pytest.raises(ValidationError) as exc_info:
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, items),
+            )
+
+        assert "only allows a single selection" in str(exc_info.value)
+
+    def test_menu_change_refreshes_rules(
+        self, service_context, django_capture_on_commit_callbacks
+    ):
+        items = build_categorized_items(1)
+        CustomizationRuleService.get_rules([items[0]["menu_item"].category_id])
+        items[0]["customizations"] = []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            CustomizationGroupFactory(
+                category=[items[0]["menu_item"].category], name="Milk"
+            )
+
+        rules = CustomizationRuleService.get_rules([items[0]["menu_item"].category_id])
+        assert "Milk" in [rule.name for rule in next(iter(rules.values()))]
+
+
+class TestCreateOrderServicePaymentIntent:
+    @pytest.mark.django_db(transaction=True)
+    def test_stripe_is_called_after_the_order_commits(
+        self, monkeypatch, service_context
+    ):
+        seen = {}
+
+        def create_payment_intent(order):
+            seen["in_atomic_block"] = connection.in_atomic_block
+            seen["committed"] = Order.objects.filter(pk=order.pk).exists()
+            return SimpleNamespace(id="pi_after_commit", client_secret="secret")  # noqa: S106
+
+        monkeypatch.setattr(
+            StripePaymentService,
+            "create_payment_intent",
+            staticmethod(create_payment_intent),
+        )
+
+        service = CreateOrderService(
+            context=service_context,
+            validated_data=order_data(service_context, build_items(1)),
+        )
+
+        order = service.result["ctx"]["order"]
+        assert seen == {"in_atomic_block": False, "committed": True}
+        assert order._stripe_client_secret == "secret"  # noqa: S105, SLF001
+        order.refresh_from_db()
+        assert order.payment.stripe_payment_intent_id == "pi_after_commit"
+
+    @pytest.mark.django_db
+    def test_stripe_failure_cancels_the_order(self, monkeypatch, service_context):
+        def create_payment_intent(order):
+            msg = "card network down"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(
+            StripePaymentService,
+            "create_payment_intent",
+            staticmethod(create_payment_intent),
+        )
+
+        with pytest.raises(ValidationError, match="card network down"):
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, build_items(1)),
+            )
+
+        order = Order.objects.get()
+        assert order.order_status == "C"
+        assert order.payment is None
+
+    @pytest.mark.django_db
+    def test_local_failure_cancels_the_intent(self, monkeypatch, service_context):
+        cancelled = []
+
+        def record_payment(order, intent):
+            msg = "database unavailable"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(
+            StripePaymentService, "record_payment", staticmethod(record_payment)
+        )
+        monkeypatch.setattr(
+            StripePaymentService, "cancel_payment", staticmethod(cancelled.append)
+        )
+
+        with pytest.raises(ValidationError, match="database unavailable"):
+            CreateOrderService(
+                context=service_context,
+                validated_data=order_data(service_context, build_items(1)),
+            )
+
+        order = Order.objects.get()
+        assert cancelled == [f"pi_{order.pk.hex}"]
+        assert order.order_status == "C"
+        assert order.payment is None
+
+
+@pytest.mark.django_db
+def test_awaiting_payment_finds_stale_unpaid_orders():
+    stale = OrderFactory(order_status="O", payment=None, navi_port=None)
+    OrderFactory(order_status="O", payment=None, navi_port=None)
+    OrderFactory(order_status="O", payment=PaymentFactory(), navi_port=None)
+    OrderFactory(order_status="C", payment=None, navi_port=None)
+    Order.objects.filter(pk=stale.pk).update(
+        created_at=timezone.now() - timedelta(hours=1)
+    )
+
+    assert list(Order.objects.awaiting_payment(timedelta(minutes=30))) == [stale]
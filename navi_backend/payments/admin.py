@@ -1,5 +1,7 @@
 from django.contrib import admin
 
 from .models import Payment
+from .models import WebhookEvent
 
 admin.site.register(Payment)
+admin.site.register(WebhookEvent)
@@ -1,3 +1,4 @@
+import json
 import logging
 
 import stripe
@@ -9,18 +10,29 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import viewsets
 from rest_framework.permissions import IsAdminUser
 
+from navi_backend.core.api.mixins import StreamingExportMixin
+from navi_backend.core.pagination import CreatedAtCursorPagination
 from navi_backend.orders.api.mixins import TrackUserMixin
 from navi_backend.payments.api.serializers import PaymentCreateSerializer
 from navi_backend.payments.api.serializers import PaymentSerializer
 from navi_backend.payments.models import Payment
-from navi_backend.payments.services import StripePaymentService
+from navi_backend.payments.services import StripeWebhookService
 
 logger = logging.getLogger(__name__)
 
 
-class PaymentViewSet(TrackUserMixin, viewsets.ModelViewSet):
+class PaymentViewSet(StreamingExportMixin, TrackUserMixin, viewsets.ModelViewSet):
     queryset = Payment.objects.all()
     permission_classes = [IsAdminUser]
+    pagination_class = CreatedAtCursorPagination
+    export_fields = (
+        "id",
+        "stripe_payment_intent_id",
+        "amount_received",
+        "currency",
+        "status",
+        "created_at",
+    )
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -31,8 +43,9 @@ class PaymentViewSet(TrackUserMixin, viewsets.ModelViewSet):
 @method_decorator(csrf_exempt, name="dispatch")
 class StripeWebhookView(View):
     """
-    Receives Stripe webhook events and updates payment/order state.
-    Verifies the webhook signature using STRIPE_WEBHOOK_SECRET.
+    Receives Stripe webhook events, verifies the signature using
+    STRIPE_WEBHOOK_SECRET, and acks once the event is persisted. Payment and
+    order state is updated by a celery consumer.
     """
 
     HANDLED_EVENTS = {
@@ -57,6 +70,7 @@ class StripeWebhookView(View):
             return HttpResponse(status=400)
 
         if event["type"] in self.HANDLED_EVENTS:
-            StripePaymentService.handle_webhook_event(event)
+            # Store the raw JSON rather than the StripeObject wrapper.
+            StripeWebhookService.record_event(json.loads(payload))
 
         return HttpResponse(status=200)
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_payment_payment_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stripe_event_id', models.CharField(max_length=255, unique=True)),
+                ('event_type', models.CharField(max_length=100)),
+                ('payment_intent_id', models.CharField(max_length=255)),
+                ('stripe_created', models.PositiveBigIntegerField(help_text='Event creation time reported by Stripe, in epoch seconds')),
+                ('payload', models.JSONField()),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('D', 'Processed'), ('F', 'Failed')], default='P', max_length=1)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['payment_intent_id', 'status', 'stripe_created'], name='webhookevent_intent_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_webhookevent'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "CREATE SEQUENCE payments_invoice_reference_number_seq "
+                "OWNED BY payments_invoice.reference_number",
+                # Continue after the numbers already handed out.
+                "SELECT setval('payments_invoice_reference_number_seq', "
+                "COALESCE(MAX(reference_number), 0) + 1, false) "
+                "FROM payments_invoice",
+            ],
+            reverse_sql="DROP SEQUENCE payments_invoice_reference_number_seq",
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='reference_number',
+            field=models.PositiveIntegerField(db_default=models.Func(models.Value('payments_invoice_reference_number_seq'), function='nextval', output_field=models.PositiveIntegerField()), editable=False, unique=True),
+        ),
+    ]
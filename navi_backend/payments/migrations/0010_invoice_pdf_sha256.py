@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0009_invoice_reference_number_sequence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invoice",
+            name="pdf_sha256",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 of the PDF, used as its local cache key",
+                max_length=64,
+            ),
+        ),
+    ]
@@ -1,9 +1,14 @@
 from django.db import models
+from django.db.models import Func
+from django.db.models import Value
+from django.utils.translation import gettext_lazy as _
 
 from navi_backend.core.models import AuditModel
 from navi_backend.core.models import UpdateRecordModel
 from navi_backend.core.models import UUIDModel
 
+INVOICE_REFERENCE_SEQUENCE = "payments_invoice_reference_number_seq"
+
 
 class Payment(UUIDModel, AuditModel):
     STATUS_CHOICES = [
@@ -18,6 +23,11 @@ class Payment(UUIDModel, AuditModel):
     currency = models.CharField(max_length=10, default="usd")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="payment_created_id_idx"),
+        ]
+
     def __str__(self):
         return f"Payment {self.stripe_payment_intent_id} - {self.status}"
 
@@ -26,21 +36,56 @@ class Invoice(UUIDModel, AuditModel, UpdateRecordModel):
     order = models.OneToOneField(
         "orders.Order", on_delete=models.PROTECT, related_name="invoice"
     )
-    reference_number = models.PositiveIntegerField(editable=False, unique=True)
+    # Numbers come from a Postgres sequence so concurrent invoice workers
+    # never race for the same value. Rolled-back inserts leave gaps.
+    reference_number = models.PositiveIntegerField(
+        editable=False,
+        unique=True,
+        db_default=Func(
+            Value(INVOICE_REFERENCE_SEQUENCE),
+            function="nextval",
+            output_field=models.PositiveIntegerField(),
+        ),
+    )
     pdf = models.FileField(upload_to="invoices/", null=True, blank=True)
+    pdf_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text=_("SHA-256 of the PDF, used as its local cache key"),
+    )
 
-    def save(self, *args, **kwargs):
-        if not self.reference_number:
-            last = self.__class__.last_reference_number()
-            self.reference_number = last.reference_number + 1 if last else 1
+    def format_reference_number(self):
+        return f"{self.reference_number:06d}"
 
-        super().save(*args, **kwargs)
 
-    @classmethod
-    def last_reference_number(cls):
-        return (
-            cls.objects.only("reference_number").order_by("-reference_number").first()
-        )
+class WebhookEvent(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "P", _("Pending")
+        PROCESSED = "D", _("Processed")
+        FAILED = "F", _("Failed")
 
-    def format_reference_number(self):
-        return f"{self.reference_number:06d}"
+    stripe_event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100)
+    payment_intent_id = models.CharField(max_length=255)
+    stripe_created = models.PositiveBigIntegerField(
+        help_text=_("Event creation time reported by Stripe, in epoch seconds")
+    )
+    payload = models.JSONField()
+    status = models.CharField(
+        max_length=1, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["payment_intent_id", "status", "stripe_created"],
+                name="webhookevent_intent_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} {self.stripe_event_id} - {self.get_status_display()}"
@@ -1,30 +1,77 @@
+import logging
+
 import stripe
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from redis.exceptions import RedisError
 
+from navi_backend.core.helpers.redis_client import get_redis
 from navi_backend.payments.models import Payment
+from navi_backend.payments.models import WebhookEvent
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_MAX_ATTEMPTS = 5
+STRIPE_CUSTOMER_KEY = "stripe:customer:{user_id}"
+STRIPE_CUSTOMER_LOCK_KEY = "stripe:customer:{user_id}:lock"
+STRIPE_CUSTOMER_LOCK_TIMEOUT = 30
+STRIPE_CUSTOMER_CACHE_TIMEOUT = 60 * 60 * 24
 
 stripe.api_key = settings.STRIPE_API_KEY
 
 
+class StripeCustomerLockError(Exception):
+    pass
+
+
+def get_cached_customer_id(user_id):
+    try:
+        customer_id = get_redis().get(STRIPE_CUSTOMER_KEY.format(user_id=user_id))
+    except RedisError:
+        return None
+    return customer_id.decode() if customer_id else None
+
+
+def cache_customer_id(user_id, customer_id):
+    try:
+        get_redis().set(
+            STRIPE_CUSTOMER_KEY.format(user_id=user_id),
+            customer_id,
+            ex=STRIPE_CUSTOMER_CACHE_TIMEOUT,
+        )
+    except RedisError:
+        logger.warning("Redis unavailable, not caching customer for %s", user_id)
+
+
 class StripePaymentService:
     @staticmethod
     def create_payment_intent(order):
         """
-        Creates a Stripe PaymentIntent with manual capture for an order.
+        Creates a Stripe PaymentIntent with manual capture for an order. Only
+        talks to Stripe, so call it outside any transaction. The order id is
+        the idempotency key, so a retried call returns the same intent.
         """
-        user = StripePaymentService.get_or_create_stripe_customer(order.user)
-        intent = stripe.PaymentIntent.create(
+        customer = StripePaymentService.get_or_create_stripe_customer(order.user)
+        return stripe.PaymentIntent.create(
             amount=int(order.price * 100),  # Stripe expects amount in cents
             currency="usd",
-            customer=user,
+            customer=customer,
             capture_method="manual",  # Authorize, but don't charge yet
             automatic_payment_methods={"enabled": True},
             metadata={
                 "order_id": order.id,
             },
+            idempotency_key=f"order-{order.id}-payment-intent",
         )
 
-        payment = Payment.objects.create(
+    @staticmethod
+    def record_payment(order, intent):
+        """
+        Stores the local Payment for an intent returned by
+        create_payment_intent.
+        """
+        return Payment.objects.create(
             stripe_payment_intent_id=intent.id,
             amount_received=0,  # Not captured yet
             status="requires_capture",
@@ -32,8 +79,6 @@ class StripePaymentService:
             updated_by=order.user,
         )
 
-        return intent.client_secret, payment
-
     @staticmethod
     def capture_payment(payment_intent_id):
         """
@@ -110,14 +155,174 @@ class StripePaymentService:
 
     @staticmethod
     def get_or_create_stripe_customer(user):
-        if user.stripe_customer_id:
-            return user.stripe_customer_id
+        """
+        Returns the user's Stripe customer id, creating the customer if the
+        signup task has not done so yet. A per-user Redis lock keeps two
+        concurrent first orders from creating two customers; a caller that
+        times out waiting for it raises StripeCustomerLockError rather than
+        creating one unlocked.
+        """
+        customer_id = user.stripe_customer_id or get_cached_customer_id(user.pk)
+        if customer_id:
+            user.stripe_customer_id = customer_id
+            return customer_id
+
+        try:
+            lock = get_redis().lock(
+                STRIPE_CUSTOMER_LOCK_KEY.format(user_id=user.pk),
+                timeout=STRIPE_CUSTOMER_LOCK_TIMEOUT,
+                blocking_timeout=STRIPE_CUSTOMER_LOCK_TIMEOUT,
+            )
+            acquired = lock.acquire()
+        except RedisError:
+            # The idempotency key on Customer.create still collapses
+            # concurrent creations into one customer.
+            logger.warning("Redis unavailable, creating customer without lock")
+            return StripePaymentService.create_stripe_customer(user)
 
-        customer = stripe.Customer.create(
-            email=user.email, metadata={"user_id": user.id}
+        if not acquired:
+            # The holder may have finished just as the wait ran out.
+            customer_id = StripePaymentService.get_saved_customer_id(user)
+            if customer_id:
+                user.stripe_customer_id = customer_id
+                return customer_id
+            msg = f"Timed out waiting to create the Stripe customer of user {user.pk}"
+            raise StripeCustomerLockError(msg)
+
+        try:
+            return StripePaymentService.create_stripe_customer(user)
+        finally:
+            try:
+                lock.release()
+            except RedisError:
+                logger.warning("Failed to release customer lock for %s", user.pk)
+
+    @staticmethod
+    def get_saved_customer_id(user):
+        return (
+            type(user)
+            .objects.filter(pk=user.pk)
+            .values_list("stripe_customer_id", flat=True)
+            .first()
         )
 
-        user.stripe_customer_id = customer.id
-        user.save(update_fields=["stripe_customer_id"])
+    @staticmethod
+    def create_stripe_customer(user):
+        # Another worker may have created the customer while this one waited.
+        customer_id = StripePaymentService.get_saved_customer_id(user)
+        if not customer_id:
+            customer = stripe.Customer.create(
+                email=user.email,
+                metadata={"user_id": user.id},
+                idempotency_key=f"user-{user.id}-customer",
+            )
+            customer_id = customer.id
+            type(user).objects.filter(pk=user.pk).update(stripe_customer_id=customer_id)
 
-        return customer.id
+        user.stripe_customer_id = customer_id
+        cache_customer_id(user.pk, customer_id)
+        return customer_id
+
+
+class StripeWebhookService:
+    @staticmethod
+    def record_event(event):
+        """
+        Persists a verified webhook event and, if it was not seen before,
+        schedules its processing. Returns True when a row was created.
+        """
+        from navi_backend.payments.tasks import process_webhook_events  # noqa: PLC0415
+
+        payment_intent_id = event["data"]["object"]["id"]
+        _, created = WebhookEvent.objects.get_or_create(
+            stripe_event_id=event["id"],
+            defaults={
+                "event_type": event["type"],
+                "payment_intent_id": payment_intent_id,
+                "stripe_created": event["created"],
+                "payload": event,
+            },
+        )
+        # Stripe redelivers until acknowledged; a duplicate has nothing new.
+        if created:
+            transaction.on_commit(
+                lambda: process_webhook_events.delay(payment_intent_id)
+            )
+        return created
+
+    @staticmethod
+    def process_events(payment_intent_id):
+        """
+        Applies the pending events of one payment intent in Stripe creation
+        order. Row locks serialize concurrent consumers of the same intent.
+        Stops at the first failure so later events never overtake it, and
+        re-raises once the failure is recorded. Once an event has FAILED, the
+        intent's later events stay pending until it is set back to pending or
+        marked processed in the admin. Returns the number processed.
+        """
+        processed = 0
+        failure = None
+        with transaction.atomic():
+            events = list(
+                WebhookEvent.objects.select_for_update()
+                .filter(
+                    payment_intent_id=payment_intent_id,
+                    status__in=[
+                        WebhookEvent.Status.PENDING,
+                        WebhookEvent.Status.FAILED,
+                    ],
+                )
+                .order_by("stripe_created", "id")
+            )
+            if any(event.status == WebhookEvent.Status.FAILED for event in events):
+                logger.warning(
+                    "Stripe webhooks for %s are held behind a failed event",
+                    payment_intent_id,
+                )
+                return 0
+
+            for event in events:
+                try:
+                    with transaction.atomic():
+                        StripePaymentService.handle_webhook_event(event.payload)
+                except Exception as error:  # noqa: BLE001
+                    logger.warning(
+                        "Stripe webhook %s failed: %s", event.stripe_event_id, error
+                    )
+                    event.attempts += 1
+                    event.last_error = str(error)
+                    if event.attempts >= WEBHOOK_MAX_ATTEMPTS:
+                        event.status = WebhookEvent.Status.FAILED
+                    event.save(update_fields=["attempts", "last_error", "status"])
+                    failure = error
+                    break
+
+                event.attempts += 1
+                event.status = WebhookEvent.Status.PROCESSED
+                event.processed_at = timezone.now()
+                event.save(update_fields=["attempts", "status", "processed_at"])
+                processed += 1
+
+        if failure is not None:
+            raise failure
+        return processed
+
+    @staticmethod
+    def get_stale_intent_ids(older_than):
+        """
+        Payment intents with events still pending after ``older_than``, for
+        sweeping up events whose processing task was lost. Intents held
+        behind a failed event are left out.
+        """
+        failed = WebhookEvent.objects.filter(status=WebhookEvent.Status.FAILED).values(
+            "payment_intent_id"
+        )
+        return (
+            WebhookEvent.objects.filter(
+                status=WebhookEvent.Status.PENDING,
+                received_at__lt=timezone.now() - older_than,
+            )
+            .exclude(payment_intent_id__in=failed)
+            .values_list("payment_intent_id", flat=True)
+            .distinct()
+        )
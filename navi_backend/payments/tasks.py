@@ -0,0 +1,35 @@
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+
+from navi_backend.payments.services import StripePaymentService
+from navi_backend.payments.services import StripeWebhookService
+from navi_backend.users.models import User
+
+logger = logging.getLogger(__name__)
+
+STALE_WEBHOOK_AGE = timedelta(minutes=5)
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def process_webhook_events(self, payment_intent_id):
+    processed = StripeWebhookService.process_events(payment_intent_id)
+    logger.info("Processed %s webhook event(s) for %s", processed, payment_intent_id)
+    return processed
+
+
+@shared_task
+def sweep_webhook_events():
+    intent_ids = list(StripeWebhookService.get_stale_intent_ids(STALE_WEBHOOK_AGE))
+    for payment_intent_id in intent_ids:
+        process_webhook_events.delay(payment_intent_id)
+    return len(intent_ids)
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def provision_stripe_customer(self, user_id):
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return None
+    return StripePaymentService.get_or_create_stripe_customer(user)
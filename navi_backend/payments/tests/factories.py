@@ -6,6 +6,7 @@ import factory
 from navi_backend.core.tests.factories import AuditFactory
 from navi_backend.core.tests.factories import StatusFactory
 from navi_backend.core.tests.factories import UpdateRecordFactory
+from navi_backend.payments.models import Invoice
 from navi_backend.payments.models import Payment
 
 
@@ -24,3 +25,17 @@ class PaymentFactory(
     amount_received = factory.LazyFunction(lambda: Decimal("5.00"))
     currency = "usd"
     status = "requires_capture"
+
+
+class InvoiceFactory(
+    AuditFactory,
+    UpdateRecordFactory,
+    StatusFactory,
+    factory.django.DjangoModelFactory,
+):
+    class Meta:
+        model = Invoice
+
+    order = factory.SubFactory(
+        "navi_backend.orders.tests.factories.OrderFactory", navi_port=None
+    )
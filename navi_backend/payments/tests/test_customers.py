@@ -0,0 +1,141 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import stripe
+from django.db import connection
+from redis.exceptions import RedisError
+
+from navi_backend.core.helpers.redis_client import get_redis
+from navi_backend.payments import services
+from navi_backend.payments import tasks
+from navi_backend.payments.services import StripeCustomerLockError
+from navi_backend.payments.services import StripePaymentService
+from navi_backend.payments.services import get_cached_customer_id
+from navi_backend.users.models import User
+from navi_backend.users.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_customer_cache():
+    keys = get_redis().keys("stripe:customer:*")
+    if keys:
+        get_redis().delete(*keys)
+    yield
+    keys = get_redis().keys("stripe:customer:*")
+    if keys:
+        get_redis().delete(*keys)
+
+
+@pytest.fixture
+def created_customers(monkeypatch):
+    created = []
+
+    def create(email, metadata, idempotency_key):
+        # Widen the race window between concurrent callers.
+        time.sleep(0.05)
+        created.append(idempotency_key)
+        return SimpleNamespace(id=f"cus_{len(created)}")
+
+    monkeypatch.setattr(stripe.Customer, "create", staticmethod(create))
+    return created
+
+
+@pytest.mark.django_db
+class TestGetOrCreateStripeCustomer:
+    def test_creates_and_caches_customer(self, created_customers):
+        user = UserFactory(stripe_customer_id=None)
+
+        assert StripePaymentService.get_or_create_stripe_customer(user) == "cus_1"
+
+        user.refresh_from_db()
+        assert user.stripe_customer_id == "cus_1"
+        assert get_cached_customer_id(user.pk) == "cus_1"
+        assert created_customers == [f"user-{user.pk}-customer"]
+
+    def test_stale_instance_uses_cached_id(
+        self, created_customers, django_assert_num_queries
+    ):
+        user = UserFactory(stripe_customer_id=None)
+        stale = User.objects.get(pk=user.pk)
+        StripePaymentService.get_or_create_stripe_customer(user)
+
+        with django_assert_num_queries(0):
+            assert StripePaymentService.get_or_create_stripe_customer(stale) == "cus_1"
+        assert stale.stripe_customer_id == "cus_1"
+        assert len(created_customers) == 1
+
+    def test_lock_timeout_does_not_create_unlocked(
+        self, monkeypatch, created_customers
+    ):
+        monkeypatch.setattr(services, "STRIPE_CUSTOMER_LOCK_TIMEOUT", 0.1)
+        user = UserFactory(stripe_customer_id=None)
+        holder = get_redis().lock(f"stripe:customer:{user.pk}:lock", timeout=5)
+        assert holder.acquire()
+        try:
+            with pytest.raises(StripeCustomerLockError):
+                StripePaymentService.get_or_create_stripe_customer(user)
+            assert created_customers == []
+
+            # The holder saved the customer just before the wait ran out.
+            User.objects.filter(pk=user.pk).update(stripe_customer_id="cus_held")
+            assert (
+                StripePaymentService.get_or_create_stripe_customer(user) == "cus_held"
+            )
+        finally:
+            holder.release()
+        assert created_customers == []
+
+    def test_works_without_redis(self, monkeypatch, created_customers):
+        class DownRedis:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise RedisError
+
+                return fail
+
+        monkeypatch.setattr(services, "get_redis", DownRedis)
+        user = UserFactory(stripe_customer_id=None)
+
+        assert StripePaymentService.get_or_create_stripe_customer(user) == "cus_1"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_first_orders_create_one_customer(created_customers):
+    user = UserFactory(stripe_customer_id=None)
+    results = []
+
+    def first_order():
+        try:
+            results.append(
+                StripePaymentService.get_or_create_stripe_customer(
+                    User.objects.get(pk=user.pk)
+                )
+            )
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=first_order) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["cus_1"] * 4
+    assert len(created_customers) == 1
+
+
+@pytest.mark.django_db
+def test_signup_provisions_customer_after_commit(
+    monkeypatch, created_customers, django_capture_on_commit_callbacks
+):
+    monkeypatch.setattr(
+        tasks.provision_stripe_customer, "delay", tasks.provision_stripe_customer
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user = UserFactory(stripe_customer_id=None)
+
+    user.refresh_from_db()
+    assert user.stripe_customer_id == "cus_1"
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+from django.db import connection
+
+from navi_backend.orders.tests.factories import OrderFactory
+from navi_backend.payments.models import Invoice
+
+from .factories import InvoiceFactory
+
+
+def build_invoice(user):
+    return Invoice(order=OrderFactory(navi_port=None), created_by=user, updated_by=user)
+
+
+@pytest.mark.django_db
+class TestInvoiceReferenceNumber:
+    def test_numbers_increase(self):
+        first = InvoiceFactory()
+        second = InvoiceFactory()
+
+        assert second.reference_number > first.reference_number
+        assert first.format_reference_number() == f"{first.reference_number:06d}"
+
+    def test_number_is_returned_by_the_insert(self, user, django_assert_num_queries):
+        invoice = build_invoice(user)
+
+        with django_assert_num_queries(1):
+            invoice.save()
+
+        assert isinstance(invoice.reference_number, int)
+        assert Invoice.objects.get(pk=invoice.pk).reference_number == (
+            invoice.reference_number
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_invoices_get_distinct_numbers(user):
+    invoices = [build_invoice(user) for _ in range(8)]
+    errors = []
+
+    def create(invoice):
+        try:
+            invoice.save()
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=create, args=(invoice,)) for invoice in invoices]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    numbers = list(Invoice.objects.values_list("reference_number", flat=True))
+    assert len(set(numbers)) == len(invoices)
@@ -0,0 +1,207 @@
+import json
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+import stripe
+from django.test import RequestFactory
+from django.utils import timezone
+
+from navi_backend.orders.tests.factories import OrderFactory
+from navi_backend.payments.api.views import StripeWebhookView
+from navi_backend.payments.models import WebhookEvent
+from navi_backend.payments.services import WEBHOOK_MAX_ATTEMPTS
+from navi_backend.payments.services import StripePaymentService
+from navi_backend.payments.services import StripeWebhookService
+from navi_backend.payments.tasks import process_webhook_events
+
+from .factories import PaymentFactory
+
+
+def build_event(payment, event_type, created, event_id=None, **intent):
+    return {
+        "id": event_id or f"evt_{event_type}_{created}",
+        "type": event_type,
+        "created": created,
+        "data": {
+            "object": {"id": payment.stripe_payment_intent_id, **intent},
+        },
+    }
+
+
+@pytest.fixture
+def payment(db):
+    return PaymentFactory(amount_received=0)
+
+
+@pytest.mark.django_db
+class TestStripeWebhookView:
+    def post(self, monkeypatch, event):
+        monkeypatch.setattr(
+            stripe.Webhook, "construct_event", lambda payload, sig, secret: event
+        )
+        request = RequestFactory().post(
+            "/api/webhooks/stripe/",
+            data=json.dumps(event),
+            content_type="application/json",
+        )
+        return StripeWebhookView.as_view()(request)
+
+    def test_acks_after_persisting(
+        self, monkeypatch, payment, django_capture_on_commit_callbacks
+    ):
+        event = build_event(
+            payment, "payment_intent.succeeded", 100, amount_received=500
+        )
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = self.post(monkeypatch, event)
+
+        assert response.status_code == 200
+        stored = WebhookEvent.objects.get()
+        assert stored.stripe_event_id == event["id"]
+        assert stored.payment_intent_id == payment.stripe_payment_intent_id
+        assert stored.status == WebhookEvent.Status.PENDING
+        assert stored.payload == event
+        assert len(callbacks) == 1
+        payment.refresh_from_db()
+        assert payment.status == "requires_capture"
+
+    def test_duplicate_delivery_schedules_nothing(
+        self,
+        monkeypatch,
+        payment,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        event = build_event(payment, "payment_intent.succeeded", 100)
+        self.post(monkeypatch, event)
+
+        with (
+            django_assert_num_queries(1),
+            django_capture_on_commit_callbacks() as callbacks,
+        ):
+            response = self.post(monkeypatch, event)
+
+        assert response.status_code == 200
+        assert WebhookEvent.objects.count() == 1
+        assert callbacks == []
+
+    def test_ignores_unhandled_events(self, monkeypatch, payment):
+        event = build_event(payment, "customer.created", 100)
+
+        assert self.post(monkeypatch, event).status_code == 200
+        assert not WebhookEvent.objects.exists()
+
+
+@pytest.mark.django_db
+class TestProcessWebhookEvents:
+    def test_processes_in_stripe_order(self, monkeypatch, payment):
+        order = OrderFactory(payment=payment, order_status="O")
+        # Delivered out of order: the cancel was created after the success.
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.canceled", 200)
+        )
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.succeeded", 100, amount_received=500)
+        )
+        handled = []
+        handle = StripePaymentService.handle_webhook_event
+        monkeypatch.setattr(
+            StripePaymentService,
+            "handle_webhook_event",
+            lambda event: handled.append(event["type"]) or handle(event),
+        )
+
+        assert process_webhook_events(payment.stripe_payment_intent_id) == 2
+
+        assert handled == ["payment_intent.succeeded", "payment_intent.canceled"]
+        payment.refresh_from_db()
+        order.refresh_from_db()
+        assert payment.status == "canceled"
+        assert order.order_status == "C"
+        assert set(WebhookEvent.objects.values_list("status", flat=True)) == {
+            WebhookEvent.Status.PROCESSED
+        }
+
+    def test_already_processed_events_are_skipped(self, payment):
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.succeeded", 100, amount_received=5)
+        )
+        assert (
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id) == 1
+        )
+
+        assert (
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id) == 0
+        )
+
+    def test_failure_blocks_later_events(self, monkeypatch, payment):
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.succeeded", 100)
+        )
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.canceled", 200)
+        )
+
+        def fail(event):
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(StripePaymentService, "handle_webhook_event", fail)
+
+        with pytest.raises(RuntimeError):
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id)
+
+        first, second = WebhookEvent.objects.order_by("stripe_created")
+        assert first.attempts == 1
+        assert first.last_error == "boom"
+        assert first.status == WebhookEvent.Status.PENDING
+        assert second.attempts == 0
+        assert second.status == WebhookEvent.Status.PENDING
+
+    def test_gives_up_after_max_attempts(self, monkeypatch, payment):
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.succeeded", 100)
+        )
+        WebhookEvent.objects.update(attempts=WEBHOOK_MAX_ATTEMPTS - 1)
+        monkeypatch.setattr(
+            StripePaymentService,
+            "handle_webhook_event",
+            lambda event: 1 / 0,
+        )
+
+        with pytest.raises(ZeroDivisionError):
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id)
+
+        assert WebhookEvent.objects.get().status == WebhookEvent.Status.FAILED
+
+    def test_failed_event_holds_later_events(self, monkeypatch, payment):
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.amount_capturable_updated", 100)
+        )
+        StripeWebhookService.record_event(
+            build_event(payment, "payment_intent.succeeded", 200, amount_received=5)
+        )
+        failed = WebhookEvent.objects.get(stripe_created=100)
+        failed.status = WebhookEvent.Status.FAILED
+        failed.save(update_fields=["status"])
+        WebhookEvent.objects.update(received_at=timezone.now() - timedelta(hours=1))
+        handle = Mock()
+        monkeypatch.setattr(StripePaymentService, "handle_webhook_event", handle)
+
+        assert (
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id) == 0
+        )
+        assert not handle.called
+        assert (
+            WebhookEvent.objects.get(stripe_created=200).status
+            == WebhookEvent.Status.PENDING
+        )
+        assert list(StripeWebhookService.get_stale_intent_ids(timedelta(0))) == []
+
+        failed.status = WebhookEvent.Status.PROCESSED
+        failed.save(update_fields=["status"])
+        assert (
+            StripeWebhookService.process_events(payment.stripe_payment_intent_id) == 1
+        )
@@ -1,9 +1,11 @@
 # myapp/signals.py
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from navi_backend.notifications.tasks import send_user_confirmation_email
+from navi_backend.payments.tasks import provision_stripe_customer
 
 
 @receiver(post_save, sender=get_user_model())
@@ -12,3 +14,13 @@ def send_confirmation_on_create(sender, instance, created, **kwargs):
         return
 
     send_user_confirmation_email.delay(user_id=instance.pk)
+
+
+@receiver(post_save, sender=get_user_model())
+def provision_stripe_customer_on_create(sender, instance, created, **kwargs):
+    # Created ahead of the first order so checkout skips the Stripe round trip.
+    if not created or instance.stripe_customer_id:
+        return
+
+    user_id = instance.pk
+    transaction.on_commit(lambda: provision_stripe_customer.delay(user_id))